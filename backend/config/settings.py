@@ -2,6 +2,7 @@ import os
 from pathlib import Path
 
 import dj_database_url
+from corsheaders.defaults import default_headers
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -32,7 +33,11 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    "content.middleware.ServerTimingMiddleware",
+    "content.middleware.ContentVersionMiddleware",
+    "content.middleware.QueryBudgetMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "content.middleware.CompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -63,7 +68,9 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 DATABASES = {
     "default": dj_database_url.config(
-        default=os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}")
+        default=os.getenv("DATABASE_URL", f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
+        conn_max_age=int(os.getenv("DJANGO_CONN_MAX_AGE", "0")),
+        conn_health_checks=True,
     )
 }
 
@@ -92,6 +99,77 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+
+def _cache_config(backend: str, location: str) -> dict:
+    if backend == "redis":
+        return {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": location or "redis://localhost:6379/1",
+        }
+    if backend == "file":
+        return {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": location or str(BASE_DIR / ".cache"),
+        }
+    return {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": location or "romanweiss",
+    }
+
+
+CACHE_BACKEND = os.getenv("DJANGO_CACHE_BACKEND", "locmem")
+CACHE_LOCATION = os.getenv("DJANGO_CACHE_LOCATION", "")
+CACHES = {
+    "default": _cache_config(CACHE_BACKEND, CACHE_LOCATION),
+    "responses": _cache_config(
+        os.getenv("DJANGO_RESPONSE_CACHE_BACKEND") or CACHE_BACKEND,
+        os.getenv("DJANGO_RESPONSE_CACHE_LOCATION") or CACHE_LOCATION,
+    ),
+}
+CONTENT_RESPONSE_CACHE_TIMEOUT = int(os.getenv("CONTENT_RESPONSE_CACHE_TIMEOUT", str(60 * 60 * 24)))
+CONTENT_DOCUMENTS_IN_BACKGROUND = os.getenv("CONTENT_DOCUMENTS_IN_BACKGROUND", "1") == "1"
+CONTENT_I18N_BUNDLES_IN_BACKGROUND = os.getenv("CONTENT_I18N_BUNDLES_IN_BACKGROUND", "1") == "1"
+CONTENT_PAGE_SIZE = int(os.getenv("CONTENT_PAGE_SIZE", "50"))
+CONTENT_MAX_PAGE_SIZE = int(os.getenv("CONTENT_MAX_PAGE_SIZE", "500"))
+CONTENT_COMPRESS_MIN_SIZE = int(os.getenv("CONTENT_COMPRESS_MIN_SIZE", "512"))
+CONTENT_STREAM_CHUNK_SIZE = int(os.getenv("CONTENT_STREAM_CHUNK_SIZE", "500"))
+CONTENT_FETCH_WORKERS = int(os.getenv("CONTENT_FETCH_WORKERS", "8"))
+CONTENT_SERVER_TIMING = os.getenv("CONTENT_SERVER_TIMING", "1") == "1"
+CONTENT_QUERY_HEADERS = os.getenv("CONTENT_QUERY_HEADERS", "1" if DEBUG else "0") == "1"
+CONTENT_QUERY_BUDGET_ACTION = os.getenv("CONTENT_QUERY_BUDGET_ACTION", "log")
+CONTENT_QUERY_BUDGETS = {
+    "content": 30,
+    "async-content": 30,
+    "site-structure": 40,
+    "async-site-structure": 40,
+    "v1-bootstrap": 40,
+    "async-v1-bootstrap": 40,
+    "v1-batch": 45,
+    "content:home": 45,
+    "content:async-home": 45,
+    "content:page": 45,
+    "content:async-page": 45,
+}
+
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "content.renderers.ORJSONRenderer",
+        "content.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
 CORS_ALLOWED_ORIGINS = _csv_env("CORS_ALLOWED_ORIGINS")
 CORS_ALLOW_CREDENTIALS = True
+CORS_ALLOW_HEADERS = (*default_headers, "if-none-match")
+CORS_EXPOSE_HEADERS = ["ETag", "X-I18n-Version"]
 CSRF_TRUSTED_ORIGINS = _csv_env("DJANGO_CSRF_TRUSTED_ORIGINS")
+
+CONTENT_I18N_ROUTE_GROUPS = {
+    "shared": ["brand", "nav", "lang", "theme", "status", "footer", "social", "newsletter"],
+    "home": ["section", "category", "expedition", "story", "form", "ui"],
+    "expeditions-index": ["expedition", "ui"],
+    "expedition-detail": ["expedition", "detail", "ui"],
+    "category-detail": ["category", "detail", "ui"],
+    "page": ["section", "form", "detail", "ui"],
+}
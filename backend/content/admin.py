@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.db import models
 from django.utils.html import format_html
 
+from .i18n import language_registry
 from .models import (
     Category,
     CategoryGalleryItem,
@@ -30,13 +31,11 @@ from .models import (
 def _translation_languages() -> list[tuple[str, str]]:
     default_lang = (settings.LANGUAGE_CODE or "en").split("-")[0].lower()
     try:
-        rows = (
-            Language.objects.filter(is_active=True)
-            .exclude(code=default_lang)
-            .order_by("order", "id")
-            .values_list("code", "name")
-        )
-        data = [(str(code).lower(), str(name)) for code, name in rows if code]
+        data = [
+            (str(language["code"]).lower(), str(language["name"]))
+            for language in language_registry().languages
+            if language["code"] and language["code"] != default_lang
+        ]
         if data:
             return data
     except Exception:
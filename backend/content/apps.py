@@ -5,3 +5,15 @@ class ContentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "content"
     verbose_name = "Site Content"
+
+    def ready(self):
+        from django.core.checks import Tags, register
+        from django.db.backends.signals import connection_created
+
+        from .checks import check_shared_cache
+        from .queries import install_recorder
+        from .signals import connect_signals
+
+        connect_signals()
+        register(check_shared_cache, Tags.caches)
+        connection_created.connect(install_recorder, dispatch_uid="content_query_recorder")
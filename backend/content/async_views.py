@@ -0,0 +1,101 @@
+from abc import ABCMeta, abstractmethod
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse
+from django.views import View
+from rest_framework.exceptions import ValidationError
+
+from .documents import keep_document, read_document
+from .fetches import gather_fetches
+from .renderers import ORJSONRenderer
+from .timing import timing_phase
+from .viewsets import (
+    DOCUMENT_PARTS,
+    _content_document,
+    _content_fetches,
+    _document_headers,
+    _finish_response,
+    _requested_groups,
+    _requested_texts,
+    _response_cache_probe,
+    _set_language_cookie,
+    _store_response,
+)
+
+_renderer = ORJSONRenderer()
+
+
+def _json_response(payload, status: int = 200) -> HttpResponse:
+    with timing_phase("render"):
+        content = _renderer.render(payload)
+    return HttpResponse(content, status=status, content_type="application/json")
+
+
+class AsyncCompositeView(View, metaclass=ABCMeta):
+    http_method_names = ["get", "head", "options"]
+
+    async def get(self, request, *args, **kwargs):
+        probe, response = await sync_to_async(_response_cache_probe)(request)
+        if response is None:
+            try:
+                response = await self.build_response(
+                    request,
+                    probe["lang_code"],
+                    probe["fallback_lang"],
+                )
+            except ValidationError as error:
+                response = _json_response(error.detail, status=error.status_code)
+            await sync_to_async(_store_response)(probe, response)
+        return _finish_response(probe, response)
+
+    @abstractmethod
+    async def build_response(self, request, lang_code: str, fallback_lang: str) -> HttpResponse:
+        pass
+
+
+class AsyncContentView(AsyncCompositeView):
+    async def build_response(self, request, lang_code, fallback_lang):
+        groups = await sync_to_async(_requested_groups)(request)
+        fetches = _content_fetches(lang_code, fallback_lang, groups, _requested_texts(request))
+        parts = await gather_fetches(fetches)
+        response = _json_response(_content_document(lang_code, fallback_lang, parts))
+        response["Content-Language"] = lang_code
+        if request.GET.get("lang"):
+            _set_language_cookie(response, lang_code)
+        return response
+
+
+class AsyncStoredDocumentView(AsyncCompositeView):
+    document_kind = None
+    language_headers = False
+
+    async def build_response(self, request, lang_code, fallback_lang):
+        kind = self.document_kind
+        version, payload, document = await sync_to_async(read_document)(kind, lang_code)
+        if payload is None:
+            fetches, assemble = DOCUMENT_PARTS[kind]
+            parts = await gather_fetches(fetches(lang_code, fallback_lang))
+            payload = assemble(lang_code, fallback_lang, parts)
+            if payload is None:
+                return _json_response({"detail": "No active pages are available."}, status=404)
+            document = await sync_to_async(keep_document)(
+                kind,
+                lang_code,
+                fallback_lang,
+                version,
+                payload,
+                document,
+            )
+
+        response = _json_response(payload)
+        _document_headers(response, request, document, lang_code, self.language_headers)
+        return response
+
+
+class AsyncSiteStructureView(AsyncStoredDocumentView):
+    document_kind = "site-structure"
+    language_headers = True
+
+
+class AsyncSiteBootstrapView(AsyncStoredDocumentView):
+    document_kind = "site-bootstrap"
@@ -0,0 +1,41 @@
+import logging
+import threading
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescedTask:
+    def __init__(self, name: str, run):
+        self.name = name
+        self.run = run
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending = False
+
+    def _run_pending(self, args: tuple) -> None:
+        pending = True
+        try:
+            while pending:
+                self.run(*args)
+                with self._lock:
+                    pending = self._pending
+                    self._pending = False
+        except Exception:
+            logger.exception("%s failed.", self.name)
+        finally:
+            with self._lock:
+                self._running = False
+            connection.close()
+
+    def schedule(self, *args, in_background: bool = True) -> None:
+        if not in_background:
+            self.run(*args)
+            return
+        with self._lock:
+            if self._running:
+                self._pending = True
+                return
+            self._running = True
+        threading.Thread(target=self._run_pending, args=(args,), daemon=True).start()
@@ -0,0 +1,414 @@
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import Client, RequestFactory
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import get_resolver, include, resolve, reverse
+from django.urls import path as route
+from rest_framework.renderers import JSONRenderer
+
+from .cache import bump_content_version
+from .generation import generate_content
+from .i18n import _build_legacy_translation_table
+from .models import (
+    Language,
+    Menu,
+    NavigationItem,
+    SiteSettings,
+    SocialLink,
+    Translation,
+    TranslationKey,
+)
+from .renderers import MessagePackRenderer, ORJSONRenderer
+
+RENDERER_PATHS = ("/api/v1/bootstrap/", "/api/expeditions/")
+ASYNC_VIEW_PATHS = (
+    ("/api/content/", "/api/async/content/"),
+    ("/api/site/structure/", "/api/async/site/structure/"),
+    ("/api/v1/bootstrap/", "/api/async/v1/bootstrap/"),
+)
+ENDPOINT_URLCONFS = (("content.urls", "/api/"), ("content.web_urls", "/site/"))
+ENDPOINT_SKIPPED = {
+    "set-language": "POST only",
+    "contact-submit": "POST only",
+    "async-content": "covered by async-views",
+    "async-site-structure": "covered by async-views",
+    "async-v1-bootstrap": "covered by async-views",
+    "async-home": "covered by async-views",
+    "async-page": "covered by async-views",
+}
+ENDPOINT_SAMPLES = {
+    "categories-detail": "category",
+    "categories-gallery": "category",
+    "category-detail": "category",
+    "expeditions-detail": "expedition",
+    "expeditions-media": "expedition",
+    "expedition-detail": "expedition",
+    "stories-detail": "story",
+    "page-detail": "page",
+    "v1-pages-detail": "page",
+    "page": "page",
+    "navigation-items-detail": "navigation",
+    "settings-detail": "settings",
+    "social-links-detail": "social",
+    "v1-menu-detail": "menu",
+}
+ENDPOINT_QUERY = {"v1-batch": {"bundle": "home"}}
+
+
+class _Rollback(Exception):
+    pass
+
+
+class _EndpointURLConf:
+    urlpatterns = [
+        route("", include(settings.ROOT_URLCONF)),
+        route("site/", include("content.web_urls")),
+    ]
+
+
+def measure(func, repeat: int = 5) -> dict:
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            func()
+            timings.append((time.perf_counter() - started) * 1000)
+        queries = len(captured.captured_queries)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "queries": queries,
+    }
+
+
+def _ensure_languages() -> list[Language]:
+    languages = list(Language.objects.filter(is_active=True))
+    if languages:
+        return languages
+    return [
+        Language.objects.create(code=code, name=code, is_default=code == "en", order=index)
+        for index, code in enumerate(("en", "ru", "zh"))
+    ]
+
+
+def legacy_translations(sizes=(100, 1000, 10000), repeat: int = 5) -> list[dict]:
+    results = []
+    for size in sizes:
+        try:
+            with transaction.atomic():
+                languages = _ensure_languages()
+                keys = TranslationKey.objects.bulk_create(
+                    [
+                        TranslationKey(key=f"bench.key_{index:07d}", namespace="bench")
+                        for index in range(size)
+                    ],
+                    batch_size=2000,
+                )
+                if not all(key.pk for key in keys):
+                    keys = list(TranslationKey.objects.filter(namespace="bench"))
+                Translation.objects.bulk_create(
+                    [
+                        Translation(language=language, key=key, text=f"{language.code}:{key.key}")
+                        for language in languages
+                        for index, key in enumerate(keys)
+                        if language.code == "en" or index % 3
+                    ],
+                    batch_size=2000,
+                )
+                total = TranslationKey.objects.filter(is_active=True).count()
+                stats = measure(lambda: _build_legacy_translation_table("ru", "en"), repeat)
+                results.append({"size": size, "keys": total, **stats})
+                raise _Rollback
+        except _Rollback:
+            pass
+    return results
+
+
+def _percentiles(timings: list[float]) -> dict:
+    timings = sorted(timings)
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[max(int(len(timings) * 0.95) - 1, 0)], 3),
+    }
+
+
+def _synthetic_dataset(size: int) -> dict:
+    categories = max(1, size // 100)
+    pages = max(1, size // 20)
+    generate_content(
+        "bench",
+        expeditions=size,
+        media_per_expedition=1,
+        categories=categories,
+        gallery_per_category=max(1, size // categories),
+        stories=max(1, size // 10),
+        pages=pages,
+        sections_per_page=max(1, size // pages),
+        images_per_section=0,
+        menus=0,
+        items_per_menu=0,
+        navigation_items=0,
+        site_texts=size,
+        translation_keys=0,
+        languages=3,
+    )
+
+    def first(queryset, field="pk"):
+        return queryset.values_list(field, flat=True).first()
+
+    return {
+        "category": "bench-category-0",
+        "expedition": "bench-expedition-0",
+        "story": "bench-story-0",
+        "page": "bench-page-0",
+        "navigation": first(NavigationItem.objects.filter(is_published=True)),
+        "settings": first(SiteSettings.objects.all()),
+        "social": first(SocialLink.objects.filter(is_published=True)),
+        "menu": first(Menu.objects.filter(is_published=True), "code"),
+    }
+
+
+def _endpoint_routes(samples: dict) -> list[tuple[str, str | None]]:
+    routes = []
+    for urlconf, prefix in ENDPOINT_URLCONFS:
+        names = sorted(key for key in get_resolver(urlconf).reverse_dict if isinstance(key, str))
+        for name in names:
+            if name in ENDPOINT_SKIPPED:
+                routes.append((name, None))
+                continue
+            sample = ENDPOINT_SAMPLES.get(name)
+            kwargs = None
+            if sample:
+                params = get_resolver(urlconf).reverse_dict.getlist(name)[0][0][0][1]
+                kwargs = {params[0]: samples[sample]}
+            if sample and samples[sample] is None:
+                routes.append((name, None))
+                continue
+            routes.append((name, prefix + reverse(name, urlconf=urlconf, kwargs=kwargs).lstrip("/")))
+    return routes
+
+
+def _endpoint_stats(client: Client, url: str, query: dict, repeat: int, cold_repeat: int) -> dict:
+    cold = []
+    for _ in range(cold_repeat):
+        bump_content_version()
+        started = time.perf_counter()
+        response = client.get(url, query)
+        cold.append((time.perf_counter() - started) * 1000)
+    queries = int(response.get("X-DB-Queries", 0))
+    size = len(response.content)
+
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        client.get(url, query)
+        warm.append((time.perf_counter() - started) * 1000)
+    cold_stats = _percentiles(cold)
+    warm_stats = _percentiles(warm)
+    return {
+        "status": response.status_code,
+        "bytes": size,
+        "queries": queries,
+        "cold_median_ms": cold_stats["median_ms"],
+        "cold_p95_ms": cold_stats["p95_ms"],
+        "warm_median_ms": warm_stats["median_ms"],
+        "warm_p95_ms": warm_stats["p95_ms"],
+    }
+
+
+def endpoints(
+    sizes=(10, 1000),
+    repeat: int = 10,
+    cold_repeat: int = 3,
+    lang_code: str = "ru",
+) -> list[dict]:
+    results = []
+    for size in sizes:
+        try:
+            with transaction.atomic(), override_settings(
+                ROOT_URLCONF=_EndpointURLConf,
+                CONTENT_QUERY_HEADERS=True,
+                CONTENT_QUERY_BUDGETS={},
+                CONTENT_DOCUMENTS_IN_BACKGROUND=False,
+            ):
+                samples = _synthetic_dataset(size)
+                client = Client()
+                for name, url in _endpoint_routes(samples):
+                    result = {"size": size, "route": name, "lang": lang_code}
+                    if url is None:
+                        results.append({**result, "skipped": ENDPOINT_SKIPPED.get(name, "no sample")})
+                        continue
+                    query = {"lang": lang_code, **ENDPOINT_QUERY.get(name, {})}
+                    stats = _endpoint_stats(client, url, query, repeat, cold_repeat)
+                    results.append({**result, "path": url, **stats})
+                raise _Rollback
+        except _Rollback:
+            pass
+    return results
+
+
+def _result_key(result: dict) -> tuple:
+    return result["size"], result["route"], result["lang"]
+
+
+def regressions(
+    results: list[dict],
+    baseline: list[dict],
+    threshold: float = 0.25,
+    floor_ms: float = 2.0,
+) -> list[str]:
+    previous = {_result_key(result): result for result in baseline if "skipped" not in result}
+    found = []
+    for result in results:
+        before = previous.get(_result_key(result))
+        if before is None or "skipped" in result:
+            continue
+        label = f"{result['route']} @ {result['size']}"
+        if result["queries"] > before["queries"]:
+            found.append(f"{label}: queries {before['queries']} -> {result['queries']}")
+        for metric in ("cold_median_ms", "warm_median_ms"):
+            old, new = before[metric], result[metric]
+            if new - old > floor_ms and new > old * (1 + threshold):
+                found.append(f"{label}: {metric} {old:.2f} -> {new:.2f}")
+    return found
+
+
+def _response_data(path: str, lang_code: str):
+    request = RequestFactory().get(path, {"lang": lang_code}, HTTP_ACCEPT="application/json")
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return json.loads(response.content)
+
+
+def renderers(paths=RENDERER_PATHS, languages=("en", "ru", "zh"), repeat: int = 50) -> list[dict]:
+    candidates = {
+        "drf-json": JSONRenderer(),
+        "orjson": ORJSONRenderer(),
+        "msgpack": MessagePackRenderer(),
+    }
+    results = []
+    for path in paths:
+        for lang_code in languages:
+            data = _response_data(path, lang_code)
+            for name, renderer in candidates.items():
+                stats = measure(lambda: renderer.render(data), repeat)
+                results.append(
+                    {
+                        "path": path,
+                        "lang": lang_code,
+                        "renderer": name,
+                        "bytes": len(renderer.render(data)),
+                        "median_ms": stats["median_ms"],
+                        "min_ms": stats["min_ms"],
+                    }
+                )
+    return results
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _get(port: int, path: str) -> int:
+    client = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        client.request("GET", path)
+        response = client.getresponse()
+        response.read()
+        return response.status
+    finally:
+        client.close()
+
+
+def _start_uvicorn(port: int) -> subprocess.Popen:
+    env = {**os.environ, "CONTENT_RESPONSE_CACHE_TIMEOUT": "0"}
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "config.asgi:application",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=settings.BASE_DIR,
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited before accepting connections.")
+        try:
+            _get(port, "/api/health/")
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("uvicorn did not start in time.")
+
+
+def _load(port: int, path: str, concurrency: int, requests: int) -> dict:
+    def worker(_):
+        client = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        timings = []
+        try:
+            for _ in range(requests):
+                started = time.perf_counter()
+                client.request("GET", path)
+                response = client.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise RuntimeError(f"{path} answered {response.status}.")
+                timings.append((time.perf_counter() - started) * 1000)
+        finally:
+            client.close()
+        return timings
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        timings = [timing for batch in executor.map(worker, range(concurrency)) for timing in batch]
+    elapsed = time.perf_counter() - started
+    return {**_percentiles(timings), "rps": round(len(timings) / elapsed, 1)}
+
+
+def async_views(
+    paths=ASYNC_VIEW_PATHS,
+    levels=(1, 8, 32),
+    requests: int = 20,
+    lang_code: str = "ru",
+) -> list[dict]:
+    port = _free_port()
+    server = _start_uvicorn(port)
+    results = []
+    try:
+        for sync_path, async_path in paths:
+            for mode, path in (("sync", sync_path), ("async", async_path)):
+                url = f"{path}?lang={lang_code}"
+                _get(port, url)
+                for concurrency in levels:
+                    stats = _load(port, url, concurrency, requests)
+                    results.append(
+                        {"path": sync_path, "mode": mode, "concurrency": concurrency, **stats}
+                    )
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    return results
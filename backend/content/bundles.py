@@ -0,0 +1,98 @@
+import json
+import os
+import posixpath
+import tempfile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+from .background import CoalescedTask
+from .compression import brotli_bytes, gzip_bytes
+from .i18n import language_registry, translation_table, translation_token
+
+BUNDLE_DIR = "i18n"
+MANIFEST_NAME = posixpath.join(BUNDLE_DIR, "manifest.json")
+
+
+def _bundle_name(lang_code: str, token: str) -> str:
+    return posixpath.join(BUNDLE_DIR, f"{lang_code}.{token}.json")
+
+
+def _write(name: str, data: bytes) -> None:
+    try:
+        target = default_storage.path(name)
+    except NotImplementedError:
+        if default_storage.exists(name):
+            default_storage.delete(name)
+        default_storage.save(name, ContentFile(data))
+        return
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=".", delete=False) as handle:
+        handle.write(data)
+    os.chmod(handle.name, settings.FILE_UPLOAD_PERMISSIONS or 0o644)
+    os.replace(handle.name, target)
+
+
+def read_manifest() -> dict:
+    if not default_storage.exists(MANIFEST_NAME):
+        return {}
+    with default_storage.open(MANIFEST_NAME) as handle:
+        try:
+            return json.loads(handle.read())
+        except ValueError:
+            return {}
+
+
+def _write_bundle(name: str, table: dict) -> None:
+    data = json.dumps(table, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    _write(name, data)
+    _write(f"{name}.gz", gzip_bytes(data))
+    compressed = brotli_bytes(data)
+    if compressed is not None:
+        _write(f"{name}.br", compressed)
+
+
+def _prune_bundles(lang_code: str, keep: set[str]) -> None:
+    try:
+        _, files = default_storage.listdir(BUNDLE_DIR)
+    except FileNotFoundError:
+        return
+    for file_name in files:
+        name = posixpath.join(BUNDLE_DIR, file_name)
+        base = name.removesuffix(".gz").removesuffix(".br")
+        if file_name.startswith(f"{lang_code}.") and base not in keep:
+            default_storage.delete(name)
+
+
+def write_i18n_bundles(force: bool = False) -> dict[str, bool]:
+    registry = language_registry()
+    fallback_lang = registry.default_code
+    stored = read_manifest()
+    previous = stored.get("languages", {})
+    languages = {}
+    written = {}
+
+    for lang_code in registry.codes:
+        token = translation_token(lang_code, fallback_lang)
+        name = _bundle_name(lang_code, token)
+        current = previous.get(lang_code, {})
+        changed = force or current.get("file") != name or not default_storage.exists(name)
+        if changed:
+            _write_bundle(name, translation_table(lang_code, fallback_lang))
+            _prune_bundles(lang_code, {name, current.get("file", name)})
+        languages[lang_code] = {"file": name, "url": default_storage.url(name), "hash": token}
+        written[lang_code] = changed
+
+    manifest = {"default": fallback_lang, "languages": languages}
+    if force or manifest != stored:
+        _write(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8"))
+    return written
+
+
+_bundle_rebuild = CoalescedTask("I18n bundle rebuild", write_i18n_bundles)
+
+
+def schedule_i18n_bundles() -> None:
+    _bundle_rebuild.schedule(in_background=settings.CONTENT_I18N_BUNDLES_IN_BACKGROUND)
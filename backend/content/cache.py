@@ -0,0 +1,127 @@
+import hashlib
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.utils.http import quote_etag
+
+CONTENT_VERSION_KEY = "content:version"
+DERIVED_MODEL_LABELS = ("content.localizedsnapshot", "content.bootstrapdocument")
+RESPONSE_CACHE_ALIAS = "responses"
+RESPONSE_COUNTER_KEYS = {"hit": "response-cache:hits", "miss": "response-cache:misses"}
+
+_version_scope = ContextVar("content_version_scope", default=None)
+_memo_lock = threading.Lock()
+_memo: dict[tuple, tuple[int, object]] = {}
+
+
+def _seed_version() -> int:
+    from django.apps import apps
+    from django.db.models import Count, Max
+
+    state = []
+    for model in apps.get_app_config("content").get_models():
+        if model._meta.label_lower in DERIVED_MODEL_LABELS:
+            continue
+        aggregates = {"rows": Count("pk")}
+        if any(field.name == "updated_at" for field in model._meta.fields):
+            aggregates["latest"] = Max("updated_at")
+        row = model.objects.aggregate(**aggregates)
+        state.append((model._meta.label_lower, row["rows"], row.get("latest")))
+    latest = [value for _, _, value in state if value is not None]
+    if not latest:
+        return time.time_ns()
+    digest = int.from_bytes(hashlib.sha256(repr(state).encode("utf-8")).digest()[:8], "big")
+    return int(max(latest).timestamp()) * 1_000_000_000 + digest % 1_000_000_000
+
+
+def start_version_scope():
+    return _version_scope.set({})
+
+
+def stop_version_scope(token) -> None:
+    _version_scope.reset(token)
+
+
+def content_version() -> int:
+    scope = _version_scope.get()
+    if scope is not None and "version" in scope:
+        return scope["version"]
+    version = cache.get(CONTENT_VERSION_KEY)
+    if version is None:
+        version = _seed_version()
+        if not cache.add(CONTENT_VERSION_KEY, version, timeout=None):
+            version = cache.get(CONTENT_VERSION_KEY, version)
+    version = int(version)
+    if scope is not None:
+        scope["version"] = version
+    return version
+
+
+def bump_content_version() -> int:
+    current = cache.get(CONTENT_VERSION_KEY) or 0
+    version = max(time.time_ns(), int(current) + 1)
+    cache.set(CONTENT_VERSION_KEY, version, timeout=None)
+    scope = _version_scope.get()
+    if scope is not None:
+        scope["version"] = version
+    return version
+
+
+def versioned(key: tuple, build):
+    version = content_version()
+    entry = _memo.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    value = build()
+    with _memo_lock:
+        _memo[key] = (version, value)
+    return value
+
+
+def clear_versioned() -> None:
+    with _memo_lock:
+        _memo.clear()
+
+
+def response_cache():
+    if RESPONSE_CACHE_ALIAS in settings.CACHES:
+        return caches[RESPONSE_CACHE_ALIAS]
+    return cache
+
+
+def request_fingerprint(*parts: str) -> str:
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:32]
+
+
+def response_cache_key(version: int, fingerprint: str) -> str:
+    return f"response:{version}:{fingerprint}"
+
+
+def response_etag(version: int, fingerprint: str) -> str:
+    return quote_etag(f"{version:x}-{fingerprint[:16]}")
+
+
+def count_response_cache(outcome: str) -> None:
+    store = response_cache()
+    key = RESPONSE_COUNTER_KEYS[outcome]
+    if store.add(key, 1, timeout=None):
+        return
+    try:
+        store.incr(key)
+    except ValueError:
+        store.set(key, 1, timeout=None)
+
+
+def response_cache_stats() -> dict[str, int]:
+    store = response_cache()
+    hits = int(store.get(RESPONSE_COUNTER_KEYS["hit"]) or 0)
+    misses = int(store.get(RESPONSE_COUNTER_KEYS["miss"]) or 0)
+    return {"hits": hits, "misses": misses}
+
+
+def reset_response_cache_stats() -> None:
+    response_cache().delete_many(list(RESPONSE_COUNTER_KEYS.values()))
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.core.checks import Warning
+
+PER_PROCESS_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def check_shared_cache(app_configs, **kwargs):
+    if settings.DEBUG:
+        return []
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PER_PROCESS_CACHE_BACKENDS:
+        return []
+    return [
+        Warning(
+            "The default cache is local to each process, so content version bumps "
+            "are not seen by other workers or management commands.",
+            hint="Set DJANGO_CACHE_BACKEND=redis or DJANGO_CACHE_BACKEND=file.",
+            obj="CACHES['default']",
+            id="content.W001",
+        )
+    ]
@@ -0,0 +1,82 @@
+import gzip
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/javascript",
+    "application/json",
+    "application/msgpack",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def gzip_bytes(data: bytes, level: int = 9) -> bytes:
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def brotli_bytes(data: bytes, quality: int = 11) -> bytes | None:
+    if brotli is None:
+        return None
+    return brotli.compress(data, quality=quality)
+
+
+def available_encodings() -> tuple[str, ...]:
+    if brotli is None:
+        return ("gzip",)
+    return ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: str) -> str:
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = "identity", 0.0
+    for coding in available_encodings():
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def is_compressible(content_type: str, size: int) -> bool:
+    if size < settings.CONTENT_COMPRESS_MIN_SIZE:
+        return False
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+
+def compress(data: bytes, encoding: str) -> bytes | None:
+    if encoding == "br":
+        return brotli_bytes(data, 5)
+    if encoding == "gzip":
+        return gzip_bytes(data, 6)
+    return None
+
+
+def precompress(data: bytes, content_type: str, encodings: tuple[str, ...]) -> dict[str, bytes]:
+    if not is_compressible(content_type, len(data)):
+        return {}
+    variants = {}
+    for encoding in encodings:
+        compressed = compress(data, encoding)
+        if compressed is not None and len(compressed) < len(data):
+            variants[encoding] = compressed
+    return variants
@@ -0,0 +1,91 @@
+import json
+
+from django.conf import settings
+from rest_framework.utils.encoders import JSONEncoder
+
+from .background import CoalescedTask
+from .cache import content_version
+from .i18n import language_registry
+from .models import BootstrapDocument
+
+
+def _store_document(kind: str, lang_code: str, version: int, payload: dict) -> BootstrapDocument:
+    body = json.dumps(payload, cls=JSONEncoder, ensure_ascii=False, separators=(",", ":"))
+    document, _ = BootstrapDocument.objects.update_or_create(
+        kind=kind,
+        language=lang_code,
+        defaults={"content_version": version, "body": body},
+    )
+    return document
+
+
+def read_document(kind: str, lang_code: str):
+    version = content_version()
+    stored = BootstrapDocument.objects.filter(kind=kind, language=lang_code).first()
+    if stored is not None and stored.content_version == version:
+        return version, json.loads(stored.body), stored
+    return version, None, stored
+
+
+def keep_document(kind: str, lang_code: str, fallback_lang: str, version: int, payload: dict, stored):
+    registry = language_registry()
+    if lang_code in registry.codes and fallback_lang == registry.default_code:
+        return _store_document(kind, lang_code, version, payload)
+    return stored
+
+
+def load_document(kind: str, build, lang_code: str, fallback_lang: str):
+    version, payload, stored = read_document(kind, lang_code)
+    if payload is not None:
+        return payload, stored
+
+    payload = build(lang_code, fallback_lang)
+    if payload is None:
+        return None, None
+    return payload, keep_document(kind, lang_code, fallback_lang, version, payload, stored)
+
+
+def rebuild_documents(builders: dict, kinds=None) -> int:
+    registry = language_registry()
+    total = 0
+    for kind in kinds or builders:
+        for lang_code in registry.codes:
+            version = content_version()
+            payload = builders[kind](lang_code, registry.default_code)
+            if payload is None:
+                BootstrapDocument.objects.filter(kind=kind, language=lang_code).delete()
+                continue
+            _store_document(kind, lang_code, version, payload)
+            total += 1
+    BootstrapDocument.objects.filter(kind__in=list(kinds or builders)).exclude(
+        language__in=registry.codes
+    ).delete()
+    return total
+
+
+def document_status(builders: dict) -> list[dict]:
+    version = content_version()
+    stored = {
+        (document.kind, document.language): document
+        for document in BootstrapDocument.objects.filter(kind__in=list(builders))
+    }
+    status = []
+    for kind in builders:
+        for lang_code in language_registry().codes:
+            document = stored.get((kind, lang_code))
+            status.append(
+                {
+                    "kind": kind,
+                    "language": lang_code,
+                    "stale": document is None or document.content_version != version,
+                    "built_at": document.updated_at if document else None,
+                }
+            )
+    return status
+
+
+_document_rebuild = CoalescedTask("Bootstrap document rebuild", rebuild_documents)
+
+
+def schedule_document_rebuild(builders: dict) -> None:
+    _document_rebuild.schedule(builders, in_background=settings.CONTENT_DOCUMENTS_IN_BACKGROUND)
@@ -0,0 +1,33 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+
+_executor = ThreadPoolExecutor(
+    max_workers=settings.CONTENT_FETCH_WORKERS,
+    thread_name_prefix="content-fetch",
+)
+
+
+def run_fetches(fetches: dict) -> dict:
+    return {name: fetch() for name, fetch in fetches.items()}
+
+
+def _isolated(fetch):
+    def run():
+        close_old_connections()
+        return fetch()
+
+    return run
+
+
+async def gather_fetches(fetches: dict) -> dict:
+    results = await asyncio.gather(
+        *(
+            sync_to_async(_isolated(fetch), thread_sensitive=False, executor=_executor)()
+            for fetch in fetches.values()
+        )
+    )
+    return dict(zip(fetches, results))
@@ -0,0 +1,377 @@
+import random
+import time
+from itertools import islice
+
+from django.db import transaction
+
+from .cache import bump_content_version
+from .models import (
+    Category,
+    CategoryGalleryItem,
+    Expedition,
+    ExpeditionMedia,
+    Language,
+    Menu,
+    MenuItem,
+    NavigationItem,
+    Page,
+    PageSection,
+    SectionImage,
+    SiteText,
+    Story,
+    Translation,
+    TranslationKey,
+)
+
+GENERATED_LANGUAGES = ("en", "ru", "zh", "de", "fr", "es", "it", "pt", "ja", "ko")
+DEFAULT_COUNTS = {
+    "expeditions": 100,
+    "media_per_expedition": 5,
+    "categories": 10,
+    "gallery_per_category": 20,
+    "stories": 50,
+    "pages": 10,
+    "sections_per_page": 5,
+    "images_per_section": 3,
+    "menus": 2,
+    "items_per_menu": 8,
+    "navigation_items": 20,
+    "site_texts": 500,
+    "translation_keys": 500,
+    "languages": 3,
+}
+WORDS = (
+    "arctic",
+    "basalt",
+    "canyon",
+    "delta",
+    "ember",
+    "fjord",
+    "glacier",
+    "harbor",
+    "island",
+    "juniper",
+    "kelp",
+    "lagoon",
+    "meadow",
+    "nomad",
+    "orbit",
+    "plateau",
+    "quartz",
+    "ridge",
+    "summit",
+    "tundra",
+    "upland",
+    "valley",
+    "willow",
+    "yonder",
+    "zenith",
+)
+SECTION_TYPES = (
+    PageSection.TYPE_RICH_TEXT,
+    PageSection.TYPE_CARDS,
+    PageSection.TYPE_GALLERY,
+    PageSection.TYPE_STORIES,
+)
+
+
+class ContentGenerator:
+    def __init__(
+        self,
+        prefix: str = "gen",
+        seed: int = 42,
+        languages: int = 3,
+        batch_size: int = 2000,
+    ):
+        self.prefix = prefix
+        self.random = random.Random(seed)
+        self.languages = GENERATED_LANGUAGES[: max(1, languages)]
+        self.batch_size = batch_size
+        self.stats = []
+
+    def phrase(self, words: int = 3) -> str:
+        return " ".join(self.random.choice(WORDS) for _ in range(words)).capitalize()
+
+    def localized(self, name: str, text: str) -> dict:
+        translations = {code: f"[{code}] {text}" for code in self.languages if code != "en"}
+        return {name: text, f"{name}_i18n": translations}
+
+    def image_url(self, kind: str, index: int) -> str:
+        return f"https://example.com/{self.prefix}/{kind}-{index}.jpg"
+
+    def slug(self, kind: str, index: int) -> str:
+        return f"{self.prefix}-{kind}-{index}"
+
+    def insert(self, model, objects) -> int:
+        started = time.perf_counter()
+        total = 0
+        objects = iter(objects)
+        while batch := list(islice(objects, self.batch_size)):
+            model.objects.bulk_create(batch, batch_size=self.batch_size)
+            total += len(batch)
+        self.stats.append(
+            {
+                "model": model._meta.label_lower,
+                "rows": total,
+                "seconds": time.perf_counter() - started,
+            }
+        )
+        return total
+
+    def ids(self, model, field: str = "slug", kind: str | None = None) -> list[int]:
+        prefix = f"{self.prefix}-{kind}-" if kind else f"{self.prefix}."
+        return list(
+            model.objects.filter(**{f"{field}__startswith": prefix})
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def exists(self) -> bool:
+        return Expedition.objects.filter(slug__startswith=f"{self.prefix}-").exists() or (
+            SiteText.objects.filter(key__startswith=f"{self.prefix}.").exists()
+        )
+
+    def generate_languages(self) -> None:
+        existing = set(Language.objects.values_list("code", flat=True))
+        self.insert(
+            Language,
+            (
+                Language(code=code, name=code.upper(), order=index + 1)
+                for index, code in enumerate(self.languages)
+                if code not in existing
+            ),
+        )
+
+    def generate_expeditions(self, count: int, media_per_expedition: int) -> None:
+        self.insert(
+            Expedition,
+            (
+                Expedition(
+                    title=self.phrase(),
+                    slug=self.slug("expedition", index),
+                    subtitle=self.phrase(5),
+                    date_label=str(2000 + index % 27),
+                    description=self.phrase(12),
+                    image_url=self.image_url("expedition", index),
+                    order=index + 1,
+                )
+                for index in range(count)
+            ),
+        )
+        kinds = [value for value, _ in ExpeditionMedia.KIND_CHOICES]
+        self.insert(
+            ExpeditionMedia,
+            (
+                ExpeditionMedia(
+                    expedition_id=expedition_id,
+                    kind=kinds[position % len(kinds)],
+                    **self.localized("title", self.phrase()),
+                    **self.localized("body", self.phrase(10)),
+                    image_url=self.image_url("media", index * media_per_expedition + position),
+                    order=position + 1,
+                )
+                for index, expedition_id in enumerate(self.ids(Expedition, kind="expedition"))
+                for position in range(media_per_expedition)
+            ),
+        )
+
+    def generate_categories(self, count: int, gallery_per_category: int) -> None:
+        sizes = [value for value, _ in Category.SIZE_CHOICES]
+        self.insert(
+            Category,
+            (
+                Category(
+                    title=self.phrase(2),
+                    slug=self.slug("category", index),
+                    image_url=self.image_url("category", index),
+                    size=sizes[index % len(sizes)],
+                    order=index + 1,
+                )
+                for index in range(count)
+            ),
+        )
+        self.insert(
+            CategoryGalleryItem,
+            (
+                CategoryGalleryItem(
+                    category_id=category_id,
+                    **self.localized("title", self.phrase()),
+                    **self.localized("description", self.phrase(8)),
+                    image_url=self.image_url("frame", index * gallery_per_category + position),
+                    order=position + 1,
+                )
+                for index, category_id in enumerate(self.ids(Category, kind="category"))
+                for position in range(gallery_per_category)
+            ),
+        )
+
+    def generate_stories(self, count: int) -> None:
+        self.insert(
+            Story,
+            (
+                Story(
+                    **self.localized("title", self.phrase()),
+                    slug=self.slug("story", index),
+                    date_label=str(2000 + index % 27),
+                    **self.localized("description", self.phrase(10)),
+                    image_url=self.image_url("story", index),
+                    order=index + 1,
+                )
+                for index in range(count)
+            ),
+        )
+
+    def generate_pages(self, count: int, sections_per_page: int, images_per_section: int) -> None:
+        self.insert(
+            Page,
+            (
+                Page(
+                    **self.localized("title", self.phrase(2)),
+                    slug=self.slug("page", index),
+                    order=index + 1,
+                )
+                for index in range(count)
+            ),
+        )
+        self.insert(
+            PageSection,
+            (
+                PageSection(
+                    page_id=page_id,
+                    key=f"section-{position}",
+                    section_type=SECTION_TYPES[position % len(SECTION_TYPES)],
+                    **self.localized("title", self.phrase()),
+                    **self.localized("body", self.phrase(20)),
+                    order=position + 1,
+                )
+                for page_id in self.ids(Page, kind="page")
+                for position in range(sections_per_page)
+            ),
+        )
+        section_ids = (
+            PageSection.objects.filter(page__slug__startswith=f"{self.prefix}-page-")
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        self.insert(
+            SectionImage,
+            (
+                SectionImage(
+                    section_id=section_id,
+                    image_url=self.image_url("section", index * images_per_section + position),
+                    alt_text=self.phrase(2),
+                    order=position + 1,
+                )
+                for index, section_id in enumerate(section_ids.iterator(chunk_size=self.batch_size))
+                for position in range(images_per_section)
+            ),
+        )
+
+    def generate_menus(self, count: int, items_per_menu: int, navigation_items: int) -> None:
+        page_ids = self.ids(Page, kind="page") or [None]
+        locations = [value for value, _ in Menu.LOCATION_CHOICES]
+        placements = (
+            (NavigationItem.SECTION_HEADER, NavigationItem.MENU_MAIN),
+            (NavigationItem.SECTION_FOOTER, NavigationItem.MENU_FOOTER),
+        )
+        self.insert(
+            Menu,
+            (
+                Menu(
+                    code=self.slug("menu", index),
+                    **self.localized("title", self.phrase(2)),
+                    location=locations[index % len(locations)],
+                    order=index + 1,
+                )
+                for index in range(count)
+            ),
+        )
+        self.insert(
+            MenuItem,
+            (
+                MenuItem(
+                    menu_id=menu_id,
+                    **self.localized("label", self.phrase(2)),
+                    page_id=self.random.choice(page_ids),
+                    order=position + 1,
+                )
+                for menu_id in self.ids(Menu, field="code", kind="menu")
+                for position in range(items_per_menu)
+            ),
+        )
+        self.insert(
+            NavigationItem,
+            (
+                NavigationItem(
+                    section=placements[index % 2][0],
+                    menu=placements[index % 2][1],
+                    **self.localized("title", self.phrase(2)),
+                    slug=self.slug("nav", index),
+                    page_id=self.random.choice(page_ids),
+                    href=f"/{self.slug('nav', index)}/",
+                    order=index + 1,
+                )
+                for index in range(navigation_items)
+            ),
+        )
+
+    def generate_texts(self, site_texts: int, translation_keys: int) -> None:
+        self.insert(
+            SiteText,
+            (
+                SiteText(
+                    key=f"{self.prefix}.text_{index:07d}",
+                    group=self.prefix,
+                    **self.localized("text", self.phrase(4)),
+                    order=index + 1,
+                )
+                for index in range(site_texts)
+            ),
+        )
+        self.insert(
+            TranslationKey,
+            (
+                TranslationKey(key=f"{self.prefix}.key_{index:07d}", namespace=self.prefix)
+                for index in range(translation_keys)
+            ),
+        )
+        languages = dict(
+            Language.objects.filter(code__in=self.languages).values_list("code", "id")
+        )
+        self.insert(
+            Translation,
+            (
+                Translation(
+                    language_id=languages[code],
+                    key_id=key_id,
+                    text=f"[{code}] {self.phrase(3)}",
+                )
+                for key_id in self.ids(TranslationKey, field="key")
+                for code in self.languages
+            ),
+        )
+
+
+def generate_content(
+    prefix: str = "gen",
+    seed: int = 42,
+    batch_size: int = 2000,
+    **counts,
+) -> list[dict]:
+    counts = {**DEFAULT_COUNTS, **counts}
+    generator = ContentGenerator(prefix, seed, counts["languages"], batch_size)
+    if generator.exists():
+        raise ValueError(f"Content with prefix {prefix!r} already exists.")
+    generator.generate_languages()
+    generator.generate_expeditions(counts["expeditions"], counts["media_per_expedition"])
+    generator.generate_categories(counts["categories"], counts["gallery_per_category"])
+    generator.generate_stories(counts["stories"])
+    generator.generate_pages(
+        counts["pages"],
+        counts["sections_per_page"],
+        counts["images_per_section"],
+    )
+    generator.generate_menus(counts["menus"], counts["items_per_menu"], counts["navigation_items"])
+    generator.generate_texts(counts["site_texts"], counts["translation_keys"])
+    transaction.on_commit(bump_content_version)
+    return generator.stats
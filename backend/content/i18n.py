@@ -0,0 +1,180 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max, Q
+
+from .cache import versioned
+from .localization import _localized_text
+from .models import Language, SiteText, TranslationKey
+
+TABLE_HISTORY_TIMEOUT = 60 * 60 * 24 * 30
+
+
+class LanguageRegistry:
+    def __init__(self, languages: list[dict]):
+        self.languages = languages
+        self.codes = tuple(language["code"] for language in languages)
+        self._by_code = {language["code"]: language for language in languages}
+        self.default = (
+            self._by_code.get("en")
+            or next((language for language in languages if language["is_default"]), None)
+            or (languages[0] if languages else None)
+        )
+
+    @property
+    def default_code(self) -> str:
+        if self.default:
+            return self.default["code"]
+        return "en"
+
+    def get(self, code: str) -> dict | None:
+        return self._by_code.get(code)
+
+
+def _load_language_registry() -> LanguageRegistry:
+    rows = (
+        Language.objects.filter(is_active=True)
+        .order_by("order", "id")
+        .values("code", "name", "is_default", "order")
+    )
+    return LanguageRegistry(list(rows))
+
+
+def language_registry() -> LanguageRegistry:
+    return versioned(("languages",), _load_language_registry)
+
+
+def _build_site_text_table(lang_code: str, fallback_lang: str) -> dict[str, str]:
+    rows = (
+        SiteText.objects.filter(is_published=True)
+        .order_by("group", "order", "key")
+        .values_list("key", "text", "text_i18n")
+    )
+    return {
+        key: _localized_text(text, text_i18n, lang_code, fallback_lang)
+        for key, text, text_i18n in rows
+    }
+
+
+def _build_legacy_translation_table(lang_code: str, fallback_lang: str) -> dict[str, str]:
+    def language_text(code: str):
+        return Max(
+            "translations__text",
+            filter=Q(translations__language__code=code, translations__language__is_active=True),
+        )
+
+    rows = (
+        TranslationKey.objects.filter(is_active=True)
+        .annotate(current=language_text(lang_code), fallback=language_text(fallback_lang))
+        .order_by("key")
+        .values_list("key", "current", "fallback")
+    )
+    translations: dict[str, str] = {}
+    for key, current, fallback in rows.iterator(chunk_size=2000):
+        if current is not None:
+            translations[key] = current
+        elif fallback is not None:
+            translations[key] = fallback
+        else:
+            translations[key] = key
+    return translations
+
+
+def site_text_table(lang_code: str, fallback_lang: str) -> dict[str, str]:
+    return versioned(
+        ("site_texts", lang_code, fallback_lang),
+        lambda: _build_site_text_table(lang_code, fallback_lang),
+    )
+
+
+def legacy_translation_table(lang_code: str, fallback_lang: str) -> dict[str, str]:
+    return versioned(
+        ("legacy_translations", lang_code, fallback_lang),
+        lambda: _build_legacy_translation_table(lang_code, fallback_lang),
+    )
+
+
+def translation_table(lang_code: str, fallback_lang: str) -> dict[str, str]:
+    return site_text_table(lang_code, fallback_lang) or legacy_translation_table(
+        lang_code, fallback_lang
+    )
+
+
+def _load_translation_groups() -> dict[str, str]:
+    site_groups = dict(SiteText.objects.filter(is_published=True).values_list("key", "group"))
+    if site_groups:
+        return site_groups
+    return dict(TranslationKey.objects.filter(is_active=True).values_list("key", "namespace"))
+
+
+def translation_groups() -> dict[str, str]:
+    return versioned(("translation_groups",), _load_translation_groups)
+
+
+def _build_translation_bundle(lang_code: str, fallback_lang: str, groups: tuple) -> dict[str, str]:
+    key_groups = translation_groups()
+    selected = set(groups)
+    return {
+        key: text
+        for key, text in translation_table(lang_code, fallback_lang).items()
+        if key_groups.get(key) in selected
+    }
+
+
+def translation_bundle(lang_code: str, fallback_lang: str, groups: tuple = ()) -> dict[str, str]:
+    if not groups:
+        return translation_table(lang_code, fallback_lang)
+    return versioned(
+        ("translation_bundle", lang_code, fallback_lang, groups),
+        lambda: _build_translation_bundle(lang_code, fallback_lang, groups),
+    )
+
+
+def route_groups() -> dict:
+    manifest = settings.CONTENT_I18N_ROUTE_GROUPS
+    shared = list(manifest.get("shared", ()))
+    return {
+        "shared": shared,
+        "routes": {
+            route: list(dict.fromkeys(shared + list(groups)))
+            for route, groups in manifest.items()
+            if route != "shared"
+        },
+    }
+
+
+def _table_history_key(lang_code: str, fallback_lang: str, token: str) -> str:
+    return f"i18n:table:{lang_code}:{fallback_lang}:{token}"
+
+
+def _remember_table(lang_code: str, fallback_lang: str, groups: tuple) -> str:
+    table = translation_bundle(lang_code, fallback_lang, groups)
+    encoded = json.dumps(table, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    token = hashlib.sha256(encoded).hexdigest()[:20]
+    cache.set(_table_history_key(lang_code, fallback_lang, token), table, TABLE_HISTORY_TIMEOUT)
+    return token
+
+
+def translation_token(lang_code: str, fallback_lang: str, groups: tuple = ()) -> str:
+    return versioned(
+        ("translation_token", lang_code, fallback_lang, groups),
+        lambda: _remember_table(lang_code, fallback_lang, groups),
+    )
+
+
+def translation_delta(
+    lang_code: str,
+    fallback_lang: str,
+    since: str,
+    groups: tuple = (),
+) -> dict | None:
+    previous = cache.get(_table_history_key(lang_code, fallback_lang, since))
+    if previous is None:
+        return None
+    current = translation_bundle(lang_code, fallback_lang, groups)
+    return {
+        "changed": {key: text for key, text in current.items() if previous.get(key) != text},
+        "removed": sorted(previous.keys() - current.keys()),
+    }
@@ -0,0 +1,233 @@
+from collections.abc import Mapping
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.files.storage import default_storage
+from django.db import models
+from django.db.models import Manager, QuerySet
+from django.templatetags.static import static
+from rest_framework import serializers
+
+_datetime_field = serializers.DateTimeField()
+
+
+def _localized_text(
+    default_value: str,
+    translations: dict,
+    lang: str,
+    fallback_lang: str = "en",
+) -> str:
+    base = default_value if isinstance(default_value, str) else ""
+
+    if isinstance(translations, dict):
+        translated = translations.get(lang)
+        if isinstance(translated, str) and translated.strip():
+            return translated
+
+    if base.strip():
+        return base
+
+    if isinstance(translations, dict):
+        fallback_value = translations.get(fallback_lang)
+        if isinstance(fallback_value, str) and fallback_value.strip():
+            return fallback_value
+
+    return base
+
+
+class LayeredMapping(Mapping):
+    __slots__ = ("_layers",)
+
+    def __init__(self, *layers):
+        self._layers = tuple(layer for layer in layers if isinstance(layer, Mapping))
+
+    def __getitem__(self, key):
+        for layer in self._layers:
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return any(key in layer for layer in self._layers)
+
+    def __iter__(self):
+        seen = set()
+        for layer in reversed(self._layers):
+            for key in layer:
+                if key not in seen:
+                    seen.add(key)
+                    yield key
+
+    def __len__(self):
+        return len(set().union(*self._layers))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def _payload_layers(translations, lang: str, fallback_lang: str):
+    if not isinstance(translations, dict):
+        return None, None
+    translated = translations.get(lang) if lang != fallback_lang else None
+    return translated, translations.get(fallback_lang)
+
+
+def _localized_dict(default_value: dict, translations: dict, lang: str, fallback_lang: str) -> Mapping:
+    translated, fallback = _payload_layers(translations, lang, fallback_lang)
+    return LayeredMapping(translated, default_value, fallback)
+
+
+def _merged_translations(translations: dict, lang: str, fallback_lang: str) -> dict:
+    translation_map = translations if isinstance(translations, dict) else {}
+    merged = {}
+    fallback_values = translation_map.get(fallback_lang)
+    if isinstance(fallback_values, dict):
+        merged.update(fallback_values)
+    if lang != fallback_lang:
+        current_values = translation_map.get(lang)
+        if isinstance(current_values, dict):
+            merged.update(current_values)
+    return merged
+
+
+def _asset_url(file_name: str | None, static_path: str | None, legacy_url: str) -> str:
+    legacy = legacy_url or ""
+    if file_name:
+        resolved = default_storage.url(file_name)
+    elif static_path:
+        resolved = static(static_path)
+    else:
+        resolved = ""
+    if resolved:
+        normalized = static_path.strip().lower() if static_path else ""
+        if legacy and normalized.startswith("content/images/") and normalized.endswith("-default.svg"):
+            return legacy
+        return resolved
+    return legacy
+
+
+def _is_datetime_field(model, name: str) -> bool:
+    if model is None:
+        return False
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return isinstance(field, models.DateTimeField)
+
+
+def _compile(name: str, lines: list[str]):
+    namespace = {
+        "_asset_url": _asset_url,
+        "_datetime": _datetime_field.to_representation,
+        "_localized_dict": _localized_dict,
+        "_localized_text": _localized_text,
+    }
+    exec(compile("\n".join(lines), f"<localization {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+class LocalizationSpec:
+    def __init__(
+        self,
+        fields,
+        translated=(),
+        payloads=(),
+        assets=None,
+        computed=(),
+        extra=(),
+        materialized=False,
+        model=None,
+    ):
+        self.fields = tuple(fields)
+        self.translated = tuple(translated)
+        self.payloads = tuple(payloads)
+        self.assets = dict(assets or {})
+        self.extra = tuple(extra)
+        self.materialized = materialized
+
+        derived = set(self.assets) | set(computed)
+        if materialized:
+            derived.update(self.translated + self.payloads)
+        columns = [name for name in self.fields if name not in derived]
+        if not materialized:
+            columns += [f"{name}_i18n" for name in self.translated + self.payloads]
+        for relation, legacy_field in self.assets.values():
+            columns += [f"{relation}__file", f"{relation}__static_path", legacy_field]
+        columns += self.extra
+        self.columns = tuple(dict.fromkeys(columns))
+        self.datetimes = tuple(name for name in self.columns if _is_datetime_field(model, name))
+
+        self.localize = self._compile_localize()
+        self.output = self._compile_output()
+
+    def _compile_localize(self):
+        lines = [
+            "def localize(row, lang, fallback_lang, localized=None):",
+            "    if localized is not None:",
+            "        row.update(localized)",
+        ]
+        if self.translated or self.payloads:
+            lines.append("    else:")
+        for name in self.translated:
+            lines.append(
+                f"        row[{name!r}] = _localized_text("
+                f"row[{name!r}], row.pop({name + '_i18n'!r}), lang, fallback_lang)"
+            )
+        for name in self.payloads:
+            lines.append(
+                f"        row[{name!r}] = _localized_dict("
+                f"row[{name!r}], row.pop({name + '_i18n'!r}), lang, fallback_lang)"
+            )
+        for output, (relation, legacy_field) in self.assets.items():
+            lines.append(
+                f"    row[{output!r}] = _asset_url(row[{relation + '__file'!r}], "
+                f"row[{relation + '__static_path'!r}], row[{legacy_field!r}])"
+            )
+        for name in self.datetimes:
+            lines.append(f"    row[{name!r}] = _datetime(row[{name!r}])")
+        lines.append("    return row")
+        return _compile("localize", lines)
+
+    def _compile_output(self):
+        items = ", ".join(f"{name!r}: row[{name!r}]" for name in self.fields)
+        return _compile("output", ["def output(row):", f"    return {{{items}}}"])
+
+    def row_from_instance(self, obj) -> dict:
+        row = {}
+        for column in self.columns:
+            relation, _, attribute = column.partition("__")
+            if not attribute:
+                row[column] = getattr(obj, column)
+                continue
+            related = getattr(obj, relation)
+            if related is None:
+                row[column] = None
+            elif attribute == "file":
+                row[column] = related.file.name
+            else:
+                row[column] = getattr(related, attribute)
+        return row
+
+
+def localize_rows(
+    source,
+    spec: LocalizationSpec,
+    lang: str,
+    fallback_lang: str,
+    snapshots=None,
+) -> list[dict]:
+    if isinstance(source, Manager):
+        source = source.all()
+    if isinstance(source, QuerySet):
+        rows = list(source.values(*spec.columns))
+        keys = [row["id"] for row in rows]
+    else:
+        source = list(source)
+        rows = [spec.row_from_instance(obj) for obj in source]
+        keys = source
+
+    if snapshots is None or not rows:
+        return [spec.localize(row, lang, fallback_lang) for row in rows]
+
+    localized = snapshots(keys)
+    return [spec.localize(row, lang, fallback_lang, localized[row["id"]]) for row in rows]
@@ -0,0 +1,110 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content import benchmarks
+
+
+def _sizes(value: str) -> list[int]:
+    return [int(size) for size in value.split(",") if size.strip()]
+
+
+class Command(BaseCommand):
+    help = "Run content benchmarks and print the results."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "scenario",
+            choices=["legacy-translations", "renderers", "async-views", "endpoints"],
+        )
+        parser.add_argument(
+            "--sizes",
+            type=_sizes,
+            default=None,
+            help="Dataset sizes (legacy-translations: 100,1000,10000; endpoints: 10,1000).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=_sizes,
+            default=[1, 8, 32],
+            help="Concurrency levels for async-views.",
+        )
+        parser.add_argument("--repeat", type=int, default=None)
+        parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+        parser.add_argument("--output", help="Write results as JSON to this file.")
+        parser.add_argument("--baseline", help="Fail when results regress against this JSON file.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.25,
+            help="Allowed relative slowdown against --baseline.",
+        )
+
+    def handle(self, *args, **options):
+        scenario = options["scenario"]
+        if options["baseline"] and scenario != "endpoints":
+            raise CommandError("--baseline is only supported for the endpoints scenario.")
+        if scenario == "legacy-translations":
+            results = benchmarks.legacy_translations(
+                options["sizes"] or [100, 1000, 10000],
+                options["repeat"] or 5,
+            )
+        elif scenario == "renderers":
+            results = benchmarks.renderers(repeat=options["repeat"] or 50)
+        elif scenario == "endpoints":
+            results = benchmarks.endpoints(options["sizes"] or [10, 1000], options["repeat"] or 10)
+        else:
+            try:
+                results = benchmarks.async_views(
+                    levels=options["concurrency"],
+                    requests=options["repeat"] or 20,
+                )
+            except RuntimeError as error:
+                raise CommandError(str(error)) from error
+
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as handle:
+                json.dump(results, handle, indent=2)
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+        else:
+            self._print(scenario, results)
+
+        if options["baseline"]:
+            with open(options["baseline"], encoding="utf-8") as handle:
+                baseline = json.load(handle)
+            found = benchmarks.regressions(results, baseline, options["threshold"])
+            if found:
+                raise CommandError("Benchmark regressions:\n" + "\n".join(found))
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline."))
+
+    def _print(self, scenario, results):
+        for result in results:
+            if scenario == "legacy-translations":
+                self.stdout.write(
+                    f"{result['keys']:>8} keys  {result['queries']} queries  "
+                    f"median {result['median_ms']:.2f} ms  min {result['min_ms']:.2f} ms"
+                )
+            elif scenario == "endpoints" and "skipped" in result:
+                self.stdout.write(
+                    f"{result['size']:>7} {result['route']:<26} skipped ({result['skipped']})"
+                )
+            elif scenario == "endpoints":
+                self.stdout.write(
+                    f"{result['size']:>7} {result['route']:<26} {result['status']} "
+                    f"{result['queries']:>3} q {result['bytes']:>9} B  "
+                    f"cold {result['cold_median_ms']:.2f}/{result['cold_p95_ms']:.2f} ms  "
+                    f"warm {result['warm_median_ms']:.2f}/{result['warm_p95_ms']:.2f} ms"
+                )
+            elif scenario == "renderers":
+                self.stdout.write(
+                    f"{result['path']:<22} {result['lang']}  {result['renderer']:<9} "
+                    f"{result['bytes']:>7} B  median {result['median_ms']:.3f} ms"
+                )
+            else:
+                self.stdout.write(
+                    f"{result['path']:<22} {result['mode']:<5} x{result['concurrency']:<3} "
+                    f"median {result['median_ms']:.2f} ms  p95 {result['p95_ms']:.2f} ms  "
+                    f"{result['rps']:.1f} req/s"
+                )
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from content.bundles import MANIFEST_NAME, write_i18n_bundles
+
+
+class Command(BaseCommand):
+    help = "Write content-hashed per-language i18n dictionaries and their manifest to storage."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rewrite every bundle even if its content hash is unchanged.",
+        )
+
+    def handle(self, *args, **options):
+        written = write_i18n_bundles(force=options["force"])
+        for lang_code, changed in written.items():
+            self.stdout.write(f"{lang_code}: {'written' if changed else 'unchanged'}")
+        self.stdout.write(self.style.SUCCESS(f"I18n bundles ready ({MANIFEST_NAME})."))
@@ -0,0 +1,54 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from content.generation import DEFAULT_COUNTS, GENERATED_LANGUAGES, generate_content
+
+
+class Command(BaseCommand):
+    help = "Generate deterministic synthetic content for benchmarks and load tests."
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_COUNTS.items():
+            parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=default)
+        parser.add_argument("--seed", type=int, default=42)
+        parser.add_argument(
+            "--prefix",
+            default="gen",
+            help="Slug/key prefix of generated rows; must not be in use yet.",
+        )
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        counts = {name: options[name] for name in DEFAULT_COUNTS}
+        if any(value < 0 for value in counts.values()) or options["batch_size"] < 1:
+            raise CommandError("Counts must be non-negative and --batch-size positive.")
+        if not 1 <= counts["languages"] <= len(GENERATED_LANGUAGES):
+            raise CommandError(f"--languages must be between 1 and {len(GENERATED_LANGUAGES)}.")
+
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                stats = generate_content(
+                    options["prefix"],
+                    options["seed"],
+                    options["batch_size"],
+                    **counts,
+                )
+        except ValueError as error:
+            raise CommandError(f"{error} Use another --prefix.") from error
+        elapsed = time.perf_counter() - started
+
+        for item in stats:
+            rate = item["rows"] / item["seconds"] if item["seconds"] else 0
+            self.stdout.write(
+                f"{item['model']:<28} {item['rows']:>9} rows  {item['seconds']:>8.2f} s  "
+                f"{rate:>10.0f} rows/s"
+            )
+        total = sum(item["rows"] for item in stats)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {total} rows in {elapsed:.1f} s ({total / elapsed:.0f} rows/s)."
+            )
+        )
@@ -0,0 +1,39 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from content.documents import document_status, rebuild_documents
+from content.viewsets import DOCUMENT_BUILDERS
+
+
+class Command(BaseCommand):
+    help = "Rebuild the stored per-language bootstrap documents, or report which are stale."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "kinds",
+            nargs="*",
+            help=f"Document kinds to rebuild ({', '.join(DOCUMENT_BUILDERS)}). Defaults to all.",
+        )
+        parser.add_argument(
+            "--status",
+            action="store_true",
+            help="Only report stale documents, do not rebuild.",
+        )
+
+    def handle(self, *args, **options):
+        unknown = [kind for kind in options["kinds"] if kind not in DOCUMENT_BUILDERS]
+        if unknown:
+            raise CommandError(f"Unknown document kind: {', '.join(unknown)}")
+
+        if options["status"]:
+            stale = 0
+            for entry in document_status(DOCUMENT_BUILDERS):
+                built_at = entry["built_at"].isoformat() if entry["built_at"] else "never"
+                state = "stale" if entry["stale"] else "fresh"
+                stale += entry["stale"]
+                self.stdout.write(f"{entry['kind']} [{entry['language']}]: {state} (built {built_at})")
+            if stale:
+                self.stdout.write(self.style.WARNING(f"{stale} stale document(s)."))
+            return
+
+        total = rebuild_documents(DOCUMENT_BUILDERS, options["kinds"] or None)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} bootstrap documents."))
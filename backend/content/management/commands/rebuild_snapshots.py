@@ -0,0 +1,35 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from content.snapshots import SNAPSHOT_FIELDS, rebuild_snapshots
+
+
+class Command(BaseCommand):
+    help = "Rebuild per-language localized snapshots for translated content models."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models",
+            nargs="*",
+            help="Model labels to rebuild (e.g. content.story). Defaults to all snapshot models.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        models = []
+        for label in options["models"]:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as exc:
+                raise CommandError(f"Unknown model: {label}") from exc
+            if model not in SNAPSHOT_FIELDS:
+                raise CommandError(f"{label} has no localized snapshots.")
+            models.append(model)
+
+        with transaction.atomic():
+            counts = rebuild_snapshots(models or None, batch_size=options["batch_size"])
+
+        for label, total in counts.items():
+            self.stdout.write(f"{label}: {total} snapshots")
+        self.stdout.write(self.style.SUCCESS("Localized snapshots rebuilt."))
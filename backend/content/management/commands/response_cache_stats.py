@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from content.cache import reset_response_cache_stats, response_cache_stats
+
+
+class Command(BaseCommand):
+    help = "Show hit/miss counters of the public API response cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reset", action="store_true", help="Reset the counters after printing.")
+
+    def handle(self, *args, **options):
+        stats = response_cache_stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0.0
+        self.stdout.write(f"hits: {stats['hits']}  misses: {stats['misses']}  hit ratio: {ratio:.1%}")
+        if options["reset"]:
+            reset_response_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
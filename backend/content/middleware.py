@@ -0,0 +1,136 @@
+import logging
+from time import perf_counter
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+from .cache import start_version_scope, stop_version_scope
+from .compression import compress, is_compressible, negotiate_encoding
+from .queries import QueryBudgetExceeded, start_recording, stop_recording
+from .timing import record_timing, start_timings, stop_timings, timing_phase
+
+logger = logging.getLogger(__name__)
+
+
+class ContentVersionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        token = start_version_scope()
+        try:
+            return self.get_response(request)
+        finally:
+            stop_version_scope(token)
+
+
+class CompressionMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            response.streaming
+            or response.status_code != 200
+            or response.has_header("Content-Encoding")
+            or settings.CSRF_COOKIE_NAME in response.cookies
+            or not is_compressible(response.get("Content-Type", ""), len(response.content))
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = negotiate_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding == "identity":
+            return response
+
+        variants = getattr(response, "precompressed", None) or {}
+        compressed = variants.get(encoding)
+        if compressed is None:
+            with timing_phase("compress"):
+                compressed = compress(response.content, encoding)
+            if compressed is None or len(compressed) >= len(response.content):
+                return response
+            response["X-Compression"] = "dynamic"
+        else:
+            response["X-Compression"] = "precompressed"
+
+        response.content = compressed
+        response["Content-Length"] = str(len(compressed))
+        response["Content-Encoding"] = encoding
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = f"W/{etag}"
+        return response
+
+
+def _query_budget(request) -> int | None:
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None
+    budgets = settings.CONTENT_QUERY_BUDGETS
+    return budgets.get(match.view_name, budgets.get(match.url_name))
+
+
+class QueryBudgetMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.CONTENT_QUERY_HEADERS and not settings.CONTENT_QUERY_BUDGETS:
+            return self.get_response(request)
+
+        recorder, token = start_recording()
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_recording(token)
+        if response.streaming:
+            return response
+        record_timing("db", recorder.duration * 1000)
+
+        if settings.CONTENT_QUERY_HEADERS:
+            response["X-DB-Queries"] = str(recorder.count)
+            response["X-DB-Time"] = f"{recorder.duration * 1000:.2f}"
+            response["X-DB-Duplicates"] = str(recorder.duplicates)
+
+        budget = _query_budget(request)
+        if budget is None or recorder.count <= budget:
+            return response
+
+        message = (
+            f"{request.method} {request.path} ran {recorder.count} queries "
+            f"(budget {budget}, {recorder.duplicates} repeated, {recorder.duration * 1000:.1f} ms)."
+        )
+        repeated = "".join(f"\n  {count}x {sql}" for sql, count in recorder.repeated())
+        if settings.CONTENT_QUERY_BUDGET_ACTION == "raise":
+            raise QueryBudgetExceeded(message + repeated)
+        logger.warning("%s%s", message, repeated)
+        return response
+
+
+class ServerTimingMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.CONTENT_SERVER_TIMING:
+            return self.get_response(request)
+
+        started = perf_counter()
+        timings, token = start_timings()
+        try:
+            response = self.get_response(request)
+        finally:
+            stop_timings(token)
+        response["Server-Timing"] = timings.header((perf_counter() - started) * 1000)
+        return response
+
+    def process_template_response(self, request, response):
+        if not settings.CONTENT_SERVER_TIMING or response.is_rendered:
+            return response
+        started = perf_counter()
+        response.add_post_render_callback(
+            lambda rendered: record_timing("render", (perf_counter() - started) * 1000)
+        )
+        return response
@@ -0,0 +1,50 @@
+# Generated by Django 5.2 on 2026-10-17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0014_story_detail_ui_texts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LocalizedSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Created at")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Updated at")),
+                ("model_label", models.CharField(max_length=80, verbose_name="Model")),
+                ("object_id", models.PositiveBigIntegerField(verbose_name="Object ID")),
+                ("language", models.CharField(max_length=12, verbose_name="Language")),
+                (
+                    "fallback_language",
+                    models.CharField(max_length=12, verbose_name="Fallback language"),
+                ),
+                (
+                    "fields",
+                    models.JSONField(blank=True, default=dict, verbose_name="Localized fields"),
+                ),
+            ],
+            options={
+                "verbose_name": "Localized snapshot",
+                "verbose_name_plural": "Localized snapshots",
+                "ordering": ("model_label", "object_id", "language"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("model_label", "object_id", "language", "fallback_language"),
+                        name="content_unique_localized_snapshot",
+                    ),
+                ],
+            },
+        ),
+    ]
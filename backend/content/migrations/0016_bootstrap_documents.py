@@ -0,0 +1,43 @@
+# Generated by Django 5.2 on 2026-10-17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0015_localized_snapshots"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BootstrapDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="Created at")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="Updated at")),
+                ("kind", models.CharField(max_length=40, verbose_name="Kind")),
+                ("language", models.CharField(max_length=12, verbose_name="Language")),
+                ("content_version", models.BigIntegerField(verbose_name="Content version")),
+                ("body", models.TextField(verbose_name="Serialized JSON")),
+            ],
+            options={
+                "verbose_name": "Bootstrap document",
+                "verbose_name_plural": "Bootstrap documents",
+                "ordering": ("kind", "language"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("kind", "language"),
+                        name="content_unique_bootstrap_document",
+                    ),
+                ],
+            },
+        ),
+    ]
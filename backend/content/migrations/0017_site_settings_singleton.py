@@ -0,0 +1,48 @@
+# Generated by Django 5.2 on 2026-10-17
+
+from django.db import migrations, models
+
+
+def keep_latest_site_settings(apps, schema_editor):
+    SiteSettings = apps.get_model("content", "SiteSettings")
+    LocalizedSnapshot = apps.get_model("content", "LocalizedSnapshot")
+    latest = SiteSettings.objects.order_by("-updated_at", "-id").first()
+    if latest is None:
+        return
+    stale = list(SiteSettings.objects.exclude(pk=latest.pk).values_list("pk", flat=True))
+    LocalizedSnapshot.objects.filter(
+        model_label="content.sitesettings",
+        object_id__in=stale,
+    ).delete()
+    SiteSettings.objects.filter(pk__in=stale).delete()
+
+
+def noop_reverse(apps, schema_editor):
+    return None
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0016_bootstrap_documents"),
+    ]
+
+    operations = [
+        migrations.RunPython(keep_latest_site_settings, noop_reverse),
+        migrations.AddField(
+            model_name="sitesettings",
+            name="singleton_key",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                editable=False,
+                unique=True,
+                verbose_name="Singleton key",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="sitesettings",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("singleton_key", 1)),
+                name="content_site_settings_singleton",
+            ),
+        ),
+    ]
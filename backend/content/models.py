@@ -68,6 +68,8 @@ class SiteText(OrderedPublishableModel):
 
 
 class SiteSettings(TimeStampedModel, SeoFieldsMixin):
+    SINGLETON_KEY = 1
+
     brand_name = models.CharField("Brand name", max_length=120, default="Romanweiẞ")
     brand_name_i18n = models.JSONField("Brand name translations", default=dict, blank=True)
     footer_title = models.CharField("Footer title", max_length=120, default="Romanweiẞ")
@@ -110,10 +112,19 @@ class SiteSettings(TimeStampedModel, SeoFieldsMixin):
     contact_email = models.EmailField(
         "Contact email", max_length=254, default="hello@romanweiss.com"
     )
+    singleton_key = models.PositiveSmallIntegerField(
+        "Singleton key", default=SINGLETON_KEY, unique=True, editable=False
+    )
 
     class Meta:
         verbose_name = "Site settings"
         verbose_name_plural = "Site settings"
+        constraints = [
+            models.CheckConstraint(
+                condition=Q(singleton_key=1),
+                name="content_site_settings_singleton",
+            ),
+        ]
 
     def __str__(self):
         return self.brand_name
@@ -559,3 +570,46 @@ class Translation(TimeStampedModel):
 
     def __str__(self):
         return f"{self.language.code}: {self.key.key}"
+
+
+class LocalizedSnapshot(TimeStampedModel):
+    model_label = models.CharField("Model", max_length=80)
+    object_id = models.PositiveBigIntegerField("Object ID")
+    language = models.CharField("Language", max_length=12)
+    fallback_language = models.CharField("Fallback language", max_length=12)
+    fields = models.JSONField("Localized fields", default=dict, blank=True)
+
+    class Meta:
+        verbose_name = "Localized snapshot"
+        verbose_name_plural = "Localized snapshots"
+        ordering = ("model_label", "object_id", "language")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("model_label", "object_id", "language", "fallback_language"),
+                name="content_unique_localized_snapshot",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.model_label}#{self.object_id} ({self.language})"
+
+
+class BootstrapDocument(TimeStampedModel):
+    kind = models.CharField("Kind", max_length=40)
+    language = models.CharField("Language", max_length=12)
+    content_version = models.BigIntegerField("Content version")
+    body = models.TextField("Serialized JSON")
+
+    class Meta:
+        verbose_name = "Bootstrap document"
+        verbose_name_plural = "Bootstrap documents"
+        ordering = ("kind", "language")
+        constraints = [
+            models.UniqueConstraint(
+                fields=("kind", "language"),
+                name="content_unique_bootstrap_document",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} ({self.language})"
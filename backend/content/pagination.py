@@ -0,0 +1,108 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+DEFAULT_KEYSET_ORDERING = ("order", "id")
+
+
+def encode_cursor(values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, fields: list) -> list:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise NotFound("Invalid cursor.") from None
+    if not isinstance(values, list) or len(values) != len(fields):
+        raise NotFound("Invalid cursor.")
+    if not all(isinstance(value, (str, int, float)) for value in values):
+        raise NotFound("Invalid cursor.")
+    try:
+        return [field.to_python(value) for field, value in zip(fields, values)]
+    except ValidationError:
+        raise NotFound("Invalid cursor.") from None
+
+
+def _after(ordering: tuple[str, ...], values: list) -> Q:
+    return reduce(
+        or_,
+        (
+            Q(**dict(zip(ordering[:index], values[:index])), **{f"{field}__gt": values[index]})
+            for index, field in enumerate(ordering)
+        ),
+    )
+
+
+class KeysetPagination(BasePagination):
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+
+    def get_limit(self, request) -> int:
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return settings.CONTENT_PAGE_SIZE
+        return max(1, min(limit, settings.CONTENT_MAX_PAGE_SIZE))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.cursor_query_param not in params and self.limit_query_param not in params:
+            return None
+
+        ordering = tuple(getattr(view, "keyset_ordering", DEFAULT_KEYSET_ORDERING))
+        limit = self.get_limit(request)
+        queryset = queryset.order_by(*ordering)
+        cursor = params.get(self.cursor_query_param)
+        if cursor:
+            fields = [queryset.model._meta.get_field(name) for name in ordering]
+            queryset = queryset.filter(_after(ordering, decode_cursor(cursor, fields)))
+
+        keys = list(queryset.values_list(*ordering)[: limit + 1])
+        page_keys = keys[:limit]
+        self.request = request
+        self.next_cursor = encode_cursor(page_keys[-1]) if len(keys) > limit else None
+        return queryset.filter(pk__in=[key[-1] for key in page_keys])
+
+    def get_next_link(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_first_link(self) -> str:
+        return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "next_cursor": self.next_cursor,
+                "first": self.get_first_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "next_cursor": {"type": "string", "nullable": True},
+                "first": {"type": "string", "format": "uri"},
+                "results": schema,
+            },
+        }
@@ -0,0 +1,57 @@
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from time import perf_counter
+
+_recorder = ContextVar("content_query_recorder", default=None)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = perf_counter() - started
+            with self._lock:
+                self.count += 1
+                self.duration += elapsed
+                self.statements[sql] += 1
+
+    @property
+    def duplicates(self) -> int:
+        return sum(count - 1 for count in self.statements.values() if count > 1)
+
+    def repeated(self, limit: int = 3) -> list[tuple[str, int]]:
+        return [(sql, count) for sql, count in self.statements.most_common(limit) if count > 1]
+
+
+def _record(execute, sql, params, many, context):
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_recorder(sender=None, connection=None, **kwargs) -> None:
+    if connection is not None and _record not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record)
+
+
+def start_recording() -> tuple[QueryRecorder, object]:
+    recorder = QueryRecorder()
+    return recorder, _recorder.set(recorder)
+
+
+def stop_recording(token) -> None:
+    _recorder.reset(token)
@@ -1,7 +1,10 @@
-from copy import deepcopy
+from collections.abc import Mapping
 
+from django.db.models import Manager, QuerySet
 from rest_framework import serializers
 
+from .localization import LocalizationSpec, _localized_text, localize_rows
+
 from .models import (
     Category,
     CategoryGalleryItem,
@@ -18,6 +21,8 @@ from .models import (
     SocialLink,
     Story,
 )
+from .site_settings import CachedSiteSettings
+from .snapshots import SNAPSHOT_FIELDS, snapshot_for, snapshot_map
 
 
 def _request_lang(serializer: serializers.Serializer) -> str:
@@ -38,46 +43,6 @@ def _fallback_lang(serializer: serializers.Serializer) -> str:
     return "en"
 
 
-def _localized_text(
-    default_value: str,
-    translations: dict,
-    lang: str,
-    fallback_lang: str = "en",
-) -> str:
-    base = default_value if isinstance(default_value, str) else ""
-
-    if isinstance(translations, dict):
-        translated = translations.get(lang)
-        if isinstance(translated, str) and translated.strip():
-            return translated
-
-    if base.strip():
-        return base
-
-    if isinstance(translations, dict):
-        fallback_value = translations.get(fallback_lang)
-        if isinstance(fallback_value, str) and fallback_value.strip():
-            return fallback_value
-
-    return base
-
-
-def _localized_dict(default_value: dict, translations: dict, lang: str, fallback_lang: str) -> dict:
-    base = deepcopy(default_value) if isinstance(default_value, dict) else {}
-    if not isinstance(translations, dict):
-        return base
-
-    fallback_payload = translations.get(fallback_lang)
-    if isinstance(fallback_payload, dict):
-        base = {**fallback_payload, **base}
-
-    if lang != fallback_lang:
-        translated = translations.get(lang)
-        if isinstance(translated, dict):
-            base.update(translated)
-    return base
-
-
 def _menu_item_href_from_parts(href: str, page, url_key: str, external_url: str) -> str:
     if external_url:
         return external_url
@@ -123,6 +88,145 @@ def _asset_or_legacy_url(asset, legacy_url: str) -> str:
     return legacy
 
 
+def _section_anchor(key: str, payload: dict) -> str:
+    if isinstance(payload, Mapping):
+        payload_anchor = payload.get("anchor")
+        if isinstance(payload_anchor, str) and payload_anchor.strip():
+            return payload_anchor.strip()
+    if key == "hero":
+        return "journey"
+    return key
+
+
+class SnapshotListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        self.child.preload_snapshots(items)
+        return super().to_representation(items)
+
+
+class SnapshotFieldsMixin:
+    def preload_snapshots(self, instances):
+        model = self.Meta.model
+        snapshots = self.context.setdefault("_snapshots", {})
+        pending = [obj for obj in instances if (model, obj.pk) not in snapshots]
+        loaded = snapshot_map(model, pending, _request_lang(self), _fallback_lang(self))
+        for pk, fields in loaded.items():
+            snapshots[(model, pk)] = fields
+
+    def localized(self, obj, name: str):
+        snapshots = self.context.setdefault("_snapshots", {})
+        key = (type(obj), obj.pk)
+        if key not in snapshots:
+            snapshots[key] = snapshot_for(obj, _request_lang(self), _fallback_lang(self))
+        return snapshots[key][name]
+
+
+class LocalizedRowsListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        return self.child.localize_many(data)
+
+
+class LocalizedRowsSerializer(serializers.ModelSerializer):
+    translated_fields: tuple[str, ...] = ()
+    payload_fields: tuple[str, ...] = ()
+    asset_fields: dict[str, tuple[str, str]] = {}
+    computed_fields: tuple[str, ...] = ()
+    extra_columns: tuple[str, ...] = ()
+
+    @classmethod
+    def selected_fields(cls, fields=None, expand=None) -> tuple[str, ...]:
+        if fields is None and expand is None:
+            return tuple(cls.Meta.fields)
+        base = fields or [name for name in cls.Meta.fields if name not in cls.computed_fields]
+        chosen = set(base)
+        chosen.update(expand or ())
+        return tuple(name for name in cls.Meta.fields if name in chosen)
+
+    @classmethod
+    def localization_spec(cls, fields=None) -> LocalizationSpec:
+        fields = tuple(cls.Meta.fields) if fields is None else tuple(fields)
+        specs = cls.__dict__.get("_localization_specs")
+        if specs is None:
+            specs = cls._localization_specs = {}
+        spec = specs.get(fields)
+        if spec is None:
+            spec = LocalizationSpec(
+                fields,
+                translated=[name for name in cls.translated_fields if name in fields],
+                payloads=[name for name in cls.payload_fields if name in fields],
+                assets={
+                    name: source for name, source in cls.asset_fields.items() if name in fields
+                },
+                computed=cls.computed_fields,
+                extra=("id",) + cls.extra_columns,
+                materialized=cls.Meta.model in SNAPSHOT_FIELDS,
+                model=cls.Meta.model,
+            )
+            specs[fields] = spec
+        return spec
+
+    def requested_fields(self) -> tuple[str, ...]:
+        return self.selected_fields(self.context.get("fields"), self.context.get("expand"))
+
+    def includes(self, name: str) -> bool:
+        return name in self.requested_fields()
+
+    def to_representation(self, instance):
+        return self.localize_many([instance])[0]
+
+    def localize_many(self, source) -> list[dict]:
+        spec = self.localization_spec(self.requested_fields())
+        return [spec.output(row) for row in self.localized_rows(source)]
+
+    def localized_rows(self, source) -> list[dict]:
+        if isinstance(source, Manager):
+            source = source.all()
+        if not isinstance(source, QuerySet):
+            source = list(source)
+        spec = self.localization_spec(self.requested_fields())
+        rows = localize_rows(
+            source,
+            spec,
+            _request_lang(self),
+            _fallback_lang(self),
+            self.read_snapshots if spec.materialized else None,
+        )
+        self.attach_related(rows, source)
+        return rows
+
+    def read_snapshots(self, keys) -> dict[int, dict]:
+        return snapshot_map(self.Meta.model, keys, _request_lang(self), _fallback_lang(self))
+
+    def attach_related(self, rows: list[dict], source) -> None:
+        return None
+
+    def nested_rows(self, rows, source, accessor: str, child_class, parent_field: str) -> list[list[dict]]:
+        context = {
+            key: value for key, value in self.context.items() if key not in ("fields", "expand")
+        }
+        child = child_class(context=context)
+        child_spec = child.localization_spec()
+
+        if isinstance(source, QuerySet):
+            queryset = child_class.Meta.model.objects.filter(
+                **{f"{parent_field}__in": [row["id"] for row in rows], "is_published": True}
+            ).order_by(parent_field, "order", "id")
+            grouped: dict[int, list[dict]] = {}
+            for child_row in child.localized_rows(queryset):
+                grouped.setdefault(child_row[parent_field], []).append(child_spec.output(child_row))
+            return [grouped.get(row["id"], []) for row in rows]
+
+        groups = []
+        for obj in source:
+            items = [item for item in getattr(obj, accessor).all() if item.is_published]
+            items.sort(key=lambda item: (item.order, item.id))
+            groups.append(items)
+
+        localized = iter(child.localize_many([item for items in groups for item in items]))
+        return [[next(localized) for _ in items] for items in groups]
+
+
 class SiteTextSerializer(serializers.ModelSerializer):
     value = serializers.SerializerMethodField()
 
@@ -136,7 +240,7 @@ class SiteTextSerializer(serializers.ModelSerializer):
         return _localized_text(obj.text, obj.text_i18n, lang, fallback)
 
 
-class SiteSettingsSerializer(serializers.ModelSerializer):
+class SiteSettingsSerializer(SnapshotFieldsMixin, serializers.ModelSerializer):
     brand_name = serializers.SerializerMethodField()
     footer_title = serializers.SerializerMethodField()
     footer_description = serializers.SerializerMethodField()
@@ -148,6 +252,7 @@ class SiteSettingsSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = SiteSettings
+        list_serializer_class = SnapshotListSerializer
         fields = (
             "id",
             "brand_name",
@@ -166,80 +271,46 @@ class SiteSettingsSerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
+    def localized(self, obj, name: str):
+        if not isinstance(obj, CachedSiteSettings):
+            return super().localized(obj, name)
+        snapshots = self.context.setdefault("_snapshots", {})
+        key = (SiteSettings, obj.pk)
+        if key not in snapshots:
+            snapshots[key] = obj.localized(_request_lang(self), _fallback_lang(self))
+        return snapshots[key][name]
+
     def get_brand_name(self, obj):
-        return _localized_text(
-            obj.brand_name,
-            obj.brand_name_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "brand_name")
 
     def get_footer_title(self, obj):
-        return _localized_text(
-            obj.footer_title,
-            obj.footer_title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "footer_title")
 
     def get_footer_description(self, obj):
-        return _localized_text(
-            obj.footer_description,
-            obj.footer_description_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "footer_description")
 
     def get_footer_explore_title(self, obj):
-        return _localized_text(
-            obj.footer_explore_title,
-            obj.footer_explore_title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "footer_explore_title")
 
     def get_footer_social_title(self, obj):
-        return _localized_text(
-            obj.footer_social_title,
-            obj.footer_social_title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "footer_social_title")
 
     def get_footer_newsletter_title(self, obj):
-        return _localized_text(
-            obj.footer_newsletter_title,
-            obj.footer_newsletter_title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "footer_newsletter_title")
 
     def get_newsletter_note(self, obj):
-        return _localized_text(
-            obj.newsletter_note,
-            obj.newsletter_note_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "newsletter_note")
 
     def get_ui(self, obj):
-        lang = _request_lang(self)
-        fallback = _fallback_lang(self)
-        ui_map = obj.ui_i18n if isinstance(obj.ui_i18n, dict) else {}
-        base = {}
-        fallback_ui = ui_map.get(fallback)
-        if isinstance(fallback_ui, dict):
-            base.update(fallback_ui)
-        if lang != fallback:
-            current_ui = ui_map.get(lang)
-            if isinstance(current_ui, dict):
-                base.update(current_ui)
-        return base
-
-
-class SectionImageSerializer(serializers.ModelSerializer):
+        return self.localized(obj, "ui")
+
+
+class SectionImageSerializer(LocalizedRowsSerializer):
+    extra_columns = ("section_id",)
+
     class Meta:
         model = SectionImage
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "image_url",
@@ -250,16 +321,22 @@ class SectionImageSerializer(serializers.ModelSerializer):
         )
 
 
-class PageSectionSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    subtitle = serializers.SerializerMethodField()
-    body = serializers.SerializerMethodField()
-    payload = serializers.SerializerMethodField()
-    images = serializers.SerializerMethodField()
-    anchor = serializers.SerializerMethodField()
+class PageSectionSerializer(LocalizedRowsSerializer):
+    title = serializers.CharField(read_only=True)
+    subtitle = serializers.CharField(read_only=True)
+    body = serializers.CharField(read_only=True)
+    payload = serializers.JSONField(read_only=True)
+    images = serializers.ListField(read_only=True)
+    anchor = serializers.CharField(read_only=True)
+
+    translated_fields = ("title", "subtitle", "body")
+    payload_fields = ("payload",)
+    computed_fields = ("anchor", "images")
+    extra_columns = ("page_id", "key")
 
     class Meta:
         model = PageSection
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "key",
@@ -274,62 +351,29 @@ class PageSectionSerializer(serializers.ModelSerializer):
             "images",
         )
 
-    def get_images(self, obj):
-        images = [image for image in obj.images.all() if image.is_published]
-        images.sort(key=lambda image: (image.order, image.id))
-        return SectionImageSerializer(images, many=True).data
-
-    def get_title(self, obj):
-        return _localized_text(
-            obj.title,
-            obj.title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_subtitle(self, obj):
-        return _localized_text(
-            obj.subtitle,
-            obj.subtitle_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+    def attach_related(self, rows, source):
+        if self.includes("anchor"):
+            for row in rows:
+                row["anchor"] = _section_anchor(row["key"], row["payload"])
+        if not self.includes("images"):
+            return
+        images = self.nested_rows(rows, source, "images", SectionImageSerializer, "section_id")
+        for row, section_images in zip(rows, images):
+            row["images"] = section_images
 
-    def get_body(self, obj):
-        return _localized_text(
-            obj.body,
-            obj.body_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_payload(self, obj):
-        return _localized_dict(
-            obj.payload,
-            obj.payload_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_anchor(self, obj):
-        payload = self.get_payload(obj)
-        if isinstance(payload, dict):
-            payload_anchor = payload.get("anchor")
-            if isinstance(payload_anchor, str) and payload_anchor.strip():
-                return payload_anchor.strip()
-        if obj.key == "hero":
-            return "journey"
-        return obj.key
 
+class PageSerializer(LocalizedRowsSerializer):
+    title = serializers.CharField(read_only=True)
+    seo_title = serializers.CharField(read_only=True)
+    seo_description = serializers.CharField(read_only=True)
+    sections = serializers.ListField(read_only=True)
 
-class PageSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    seo_title = serializers.SerializerMethodField()
-    seo_description = serializers.SerializerMethodField()
-    sections = serializers.SerializerMethodField()
+    translated_fields = ("title", "seo_title", "seo_description")
+    computed_fields = ("sections",)
 
     class Meta:
         model = Page
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "title",
@@ -345,43 +389,22 @@ class PageSerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
-    def get_sections(self, obj):
-        sections = [section for section in obj.sections.all() if section.is_published]
-        sections.sort(key=lambda section: (section.order, section.id))
-        return PageSectionSerializer(sections, many=True, context=self.context).data
-
-    def get_title(self, obj):
-        return _localized_text(
-            obj.title,
-            obj.title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_seo_title(self, obj):
-        return _localized_text(
-            obj.seo_title,
-            obj.seo_title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_seo_description(self, obj):
-        return _localized_text(
-            obj.seo_description,
-            obj.seo_description_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+    def attach_related(self, rows, source):
+        if not self.includes("sections"):
+            return
+        sections = self.nested_rows(rows, source, "sections", PageSectionSerializer, "page_id")
+        for row, page_sections in zip(rows, sections):
+            row["sections"] = page_sections
 
 
-class MenuItemSerializer(serializers.ModelSerializer):
+class MenuItemSerializer(SnapshotFieldsMixin, serializers.ModelSerializer):
     label = serializers.SerializerMethodField()
     href = serializers.SerializerMethodField()
     page_slug = serializers.CharField(source="page.slug", read_only=True)
 
     class Meta:
         model = MenuItem
+        list_serializer_class = SnapshotListSerializer
         fields = (
             "id",
             "label",
@@ -396,12 +419,7 @@ class MenuItemSerializer(serializers.ModelSerializer):
         return _menu_item_href_from_parts(obj.href, obj.page, "", "")
 
     def get_label(self, obj):
-        return _localized_text(
-            obj.label,
-            obj.label_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "label")
 
 
 class MenuSerializer(serializers.ModelSerializer):
@@ -410,8 +428,13 @@ class MenuSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Menu
+        list_serializer_class = SnapshotListSerializer
         fields = ("id", "code", "title", "location", "items")
 
+    def preload_snapshots(self, instances):
+        items = [item for menu in instances for item in menu.items.all() if item.is_published]
+        MenuItemSerializer(context=self.context).preload_snapshots(items)
+
     def get_items(self, obj):
         items = [item for item in obj.items.all() if item.is_published]
         items.sort(key=lambda item: (item.order, item.id))
@@ -426,13 +449,16 @@ class MenuSerializer(serializers.ModelSerializer):
         )
 
 
-class CategorySerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    cover_url = serializers.SerializerMethodField()
-    gallery_items = serializers.SerializerMethodField()
+class CategorySerializer(LocalizedRowsSerializer):
+    cover_url = serializers.CharField(read_only=True)
+    gallery_items = serializers.ListField(read_only=True)
+
+    asset_fields = {"cover_url": ("cover", "image_url")}
+    computed_fields = ("gallery_items",)
 
     class Meta:
         model = Category
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "title",
@@ -447,30 +473,32 @@ class CategorySerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
-    def get_title(self, obj):
-        return _localized_text(
-            obj.title,
-            {},
-            _request_lang(self),
-            _fallback_lang(self),
+    def attach_related(self, rows, source):
+        if not self.includes("gallery_items"):
+            return
+        gallery_items = self.nested_rows(
+            rows,
+            source,
+            "gallery_items",
+            CategoryGalleryItemSerializer,
+            "category_id",
         )
+        for row, items in zip(rows, gallery_items):
+            row["gallery_items"] = items
 
-    def get_cover_url(self, obj):
-        return _asset_or_legacy_url(obj.cover, obj.image_url)
 
-    def get_gallery_items(self, obj):
-        items = [item for item in obj.gallery_items.all() if item.is_published]
-        items.sort(key=lambda item: (item.order, item.id))
-        return CategoryGalleryItemSerializer(items, many=True, context=self.context).data
+class CategoryGalleryItemSerializer(LocalizedRowsSerializer):
+    title = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    media_url = serializers.CharField(read_only=True)
 
-
-class CategoryGalleryItemSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    media_url = serializers.SerializerMethodField()
+    translated_fields = ("title", "description")
+    asset_fields = {"media_url": ("media", "image_url")}
+    extra_columns = ("category_id",)
 
     class Meta:
         model = CategoryGalleryItem
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "title",
@@ -482,32 +510,17 @@ class CategoryGalleryItemSerializer(serializers.ModelSerializer):
             "is_published",
         )
 
-    def get_title(self, obj):
-        return _localized_text(
-            obj.title,
-            obj.title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_description(self, obj):
-        return _localized_text(
-            obj.description,
-            obj.description_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_media_url(self, obj):
-        return _asset_or_legacy_url(obj.media, obj.image_url)
 
+class ExpeditionSerializer(LocalizedRowsSerializer):
+    cover_url = serializers.CharField(read_only=True)
+    media_items = serializers.ListField(read_only=True)
 
-class ExpeditionSerializer(serializers.ModelSerializer):
-    cover_url = serializers.SerializerMethodField()
-    media_items = serializers.SerializerMethodField()
+    asset_fields = {"cover_url": ("cover", "image_url")}
+    computed_fields = ("media_items",)
 
     class Meta:
         model = Expedition
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "title",
@@ -524,26 +537,32 @@ class ExpeditionSerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
-    def get_cover_url(self, obj):
-        return _asset_or_legacy_url(obj.cover, obj.image_url)
+    def attach_related(self, rows, source):
+        if not self.includes("media_items"):
+            return
+        media_items = self.nested_rows(
+            rows,
+            source,
+            "media_items",
+            ExpeditionMediaSerializer,
+            "expedition_id",
+        )
+        for row, items in zip(rows, media_items):
+            row["media_items"] = items
 
-    def get_media_items(self, obj):
-        media_items = [item for item in obj.media_items.all() if item.is_published]
-        media_items.sort(key=lambda item: (item.order, item.id))
-        return ExpeditionMediaSerializer(
-            media_items,
-            many=True,
-            context=self.context,
-        ).data
 
+class ExpeditionMediaSerializer(LocalizedRowsSerializer):
+    title = serializers.CharField(read_only=True)
+    body = serializers.CharField(read_only=True)
+    media_url = serializers.CharField(read_only=True)
 
-class ExpeditionMediaSerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    body = serializers.SerializerMethodField()
-    media_url = serializers.SerializerMethodField()
+    translated_fields = ("title", "body")
+    asset_fields = {"media_url": ("media", "image_url")}
+    extra_columns = ("expedition_id",)
 
     class Meta:
         model = ExpeditionMedia
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "kind",
@@ -556,34 +575,19 @@ class ExpeditionMediaSerializer(serializers.ModelSerializer):
             "is_published",
         )
 
-    def get_title(self, obj):
-        return _localized_text(
-            obj.title,
-            obj.title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_body(self, obj):
-        return _localized_text(
-            obj.body,
-            obj.body_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_media_url(self, obj):
-        return _asset_or_legacy_url(obj.media, obj.image_url)
 
+class StorySerializer(LocalizedRowsSerializer):
+    title = serializers.CharField(read_only=True)
+    date_label = serializers.CharField(read_only=True)
+    description = serializers.CharField(read_only=True)
+    cover_url = serializers.CharField(read_only=True)
 
-class StorySerializer(serializers.ModelSerializer):
-    title = serializers.SerializerMethodField()
-    date_label = serializers.SerializerMethodField()
-    description = serializers.SerializerMethodField()
-    cover_url = serializers.SerializerMethodField()
+    translated_fields = ("title", "date_label", "description")
+    asset_fields = {"cover_url": ("cover", "image_url")}
 
     class Meta:
         model = Story
+        list_serializer_class = LocalizedRowsListSerializer
         fields = (
             "id",
             "title",
@@ -598,35 +602,8 @@ class StorySerializer(serializers.ModelSerializer):
             "updated_at",
         )
 
-    def get_title(self, obj):
-        return _localized_text(
-            obj.title,
-            obj.title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_date_label(self, obj):
-        return _localized_text(
-            obj.date_label,
-            obj.date_label_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
 
-    def get_description(self, obj):
-        return _localized_text(
-            obj.description,
-            obj.description_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
-
-    def get_cover_url(self, obj):
-        return _asset_or_legacy_url(obj.cover, obj.image_url)
-
-
-class NavigationItemSerializer(serializers.ModelSerializer):
+class NavigationItemSerializer(SnapshotFieldsMixin, serializers.ModelSerializer):
     label = serializers.SerializerMethodField()
     label_key = serializers.SerializerMethodField()
     href = serializers.SerializerMethodField()
@@ -635,6 +612,7 @@ class NavigationItemSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = NavigationItem
+        list_serializer_class = SnapshotListSerializer
         fields = (
             "id",
             "menu",
@@ -652,12 +630,7 @@ class NavigationItemSerializer(serializers.ModelSerializer):
         )
 
     def get_label(self, obj):
-        return _localized_text(
-            obj.title,
-            obj.title_i18n,
-            _request_lang(self),
-            _fallback_lang(self),
-        )
+        return self.localized(obj, "title")
 
     def get_label_key(self, obj):
         return _menu_item_label_key(obj.menu, obj.url_key, obj.slug)
@@ -0,0 +1,81 @@
+from django.apps import apps
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from .bundles import schedule_i18n_bundles
+from .cache import DERIVED_MODEL_LABELS, bump_content_version
+from .documents import schedule_document_rebuild
+from .models import Language, SiteText, Translation, TranslationKey
+from .snapshots import SNAPSHOT_FIELDS, delete_snapshots, refresh_snapshots
+from .viewsets import DOCUMENT_BUILDERS
+
+I18N_MODELS = (Language, SiteText, Translation, TranslationKey)
+
+
+def _rebuild_documents():
+    schedule_document_rebuild(DOCUMENT_BUILDERS)
+
+
+def _content_changed(sender, **kwargs):
+    transaction.on_commit(bump_content_version)
+    transaction.on_commit(_rebuild_documents)
+
+
+def _i18n_bundles_changed(sender, raw=False, **kwargs):
+    if not raw:
+        transaction.on_commit(schedule_i18n_bundles)
+
+
+def _snapshot_saved(sender, instance, raw=False, **kwargs):
+    if not raw:
+        refresh_snapshots(instance)
+
+
+def _snapshot_deleted(sender, instance, **kwargs):
+    delete_snapshots(instance)
+
+
+def _versioned_models():
+    return [
+        model
+        for model in apps.get_app_config("content").get_models()
+        if model._meta.label_lower not in DERIVED_MODEL_LABELS
+    ]
+
+
+def connect_signals():
+    for model in _versioned_models():
+        post_save.connect(
+            _content_changed,
+            sender=model,
+            dispatch_uid=f"content_version_save_{model.__name__}",
+        )
+        post_delete.connect(
+            _content_changed,
+            sender=model,
+            dispatch_uid=f"content_version_delete_{model.__name__}",
+        )
+
+    for model in I18N_MODELS:
+        post_save.connect(
+            _i18n_bundles_changed,
+            sender=model,
+            dispatch_uid=f"i18n_bundles_save_{model.__name__}",
+        )
+        post_delete.connect(
+            _i18n_bundles_changed,
+            sender=model,
+            dispatch_uid=f"i18n_bundles_delete_{model.__name__}",
+        )
+
+    for model in SNAPSHOT_FIELDS:
+        post_save.connect(
+            _snapshot_saved,
+            sender=model,
+            dispatch_uid=f"localized_snapshot_save_{model.__name__}",
+        )
+        post_delete.connect(
+            _snapshot_deleted,
+            sender=model,
+            dispatch_uid=f"localized_snapshot_delete_{model.__name__}",
+        )
@@ -0,0 +1,60 @@
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from .cache import versioned
+from .i18n import language_registry
+from .models import SiteSettings
+from .snapshots import localized_fields
+
+
+class CachedSiteSettings:
+    __slots__ = ("_instance", "_localized", "_values")
+
+    def __init__(self, instance: SiteSettings, localized: dict):
+        values = {
+            field.attname: getattr(instance, field.attname)
+            for field in instance._meta.concrete_fields
+        }
+        object.__setattr__(self, "_instance", instance)
+        object.__setattr__(self, "_values", MappingProxyType(values))
+        object.__setattr__(self, "_localized", MappingProxyType(localized))
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Cached site settings are read-only.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Cached site settings are read-only.")
+
+    @property
+    def pk(self) -> int:
+        return self._values["id"]
+
+    def localized(self, lang_code: str, fallback_lang: str) -> dict:
+        fields = self._localized.get((lang_code, fallback_lang))
+        if fields is None:
+            fields = localized_fields(self._instance, lang_code, fallback_lang)
+        return {
+            name: dict(value) if isinstance(value, Mapping) else value
+            for name, value in fields.items()
+        }
+
+
+def _load_site_settings() -> CachedSiteSettings:
+    instance, _ = SiteSettings.objects.get_or_create(singleton_key=SiteSettings.SINGLETON_KEY)
+    registry = language_registry()
+    fallback_lang = registry.default_code
+    localized = {
+        (code, fallback_lang): localized_fields(instance, code, fallback_lang)
+        for code in registry.codes
+    }
+    return CachedSiteSettings(instance, localized)
+
+
+def site_settings() -> CachedSiteSettings:
+    return versioned(("site_settings",), _load_site_settings)
@@ -0,0 +1,148 @@
+from .i18n import language_registry
+from .localization import _localized_dict, _localized_text, _merged_translations
+from .models import (
+    CategoryGalleryItem,
+    ExpeditionMedia,
+    LocalizedSnapshot,
+    MenuItem,
+    NavigationItem,
+    PageSection,
+    SiteSettings,
+    Story,
+)
+
+SNAPSHOT_FIELDS = {
+    Story: {"text": ("title", "date_label", "description")},
+    ExpeditionMedia: {"text": ("title", "body")},
+    CategoryGalleryItem: {"text": ("title", "description")},
+    PageSection: {"text": ("title", "subtitle", "body"), "payload": ("payload",)},
+    NavigationItem: {"text": ("title",)},
+    MenuItem: {"text": ("label",)},
+    SiteSettings: {
+        "text": (
+            "brand_name",
+            "footer_title",
+            "footer_description",
+            "footer_explore_title",
+            "footer_social_title",
+            "footer_newsletter_title",
+            "newsletter_note",
+        ),
+        "merged": ("ui",),
+    },
+}
+
+
+def localized_fields(obj, lang_code: str, fallback_lang: str) -> dict:
+    spec = SNAPSHOT_FIELDS[type(obj)]
+    fields = {}
+    for name in spec.get("text", ()):
+        fields[name] = _localized_text(
+            getattr(obj, name),
+            getattr(obj, f"{name}_i18n"),
+            lang_code,
+            fallback_lang,
+        )
+    for name in spec.get("payload", ()):
+        fields[name] = dict(
+            _localized_dict(
+                getattr(obj, name),
+                getattr(obj, f"{name}_i18n"),
+                lang_code,
+                fallback_lang,
+            )
+        )
+    for name in spec.get("merged", ()):
+        fields[name] = _merged_translations(getattr(obj, f"{name}_i18n"), lang_code, fallback_lang)
+    return fields
+
+
+def _snapshot(obj, lang_code: str, fallback_lang: str) -> LocalizedSnapshot:
+    return LocalizedSnapshot(
+        model_label=obj._meta.label_lower,
+        object_id=obj.pk,
+        language=lang_code,
+        fallback_language=fallback_lang,
+        fields=localized_fields(obj, lang_code, fallback_lang),
+    )
+
+
+def snapshot_map(model, source, lang_code: str, fallback_lang: str) -> dict[int, dict]:
+    items = list(source)
+    if not items:
+        return {}
+
+    instances = None
+    if isinstance(items[0], model):
+        instances = {obj.pk: obj for obj in items}
+        ids = list(instances)
+    else:
+        ids = items
+
+    found = dict(
+        LocalizedSnapshot.objects.filter(
+            model_label=model._meta.label_lower,
+            language=lang_code,
+            fallback_language=fallback_lang,
+            object_id__in=ids,
+        ).values_list("object_id", "fields")
+    )
+    missing = [pk for pk in ids if pk not in found]
+    if not missing:
+        return found
+
+    if instances is None:
+        loaded = model.objects.filter(pk__in=missing)
+    else:
+        loaded = [instances[pk] for pk in missing]
+
+    created = [_snapshot(obj, lang_code, fallback_lang) for obj in loaded]
+    for snapshot in created:
+        found[snapshot.object_id] = snapshot.fields
+    if lang_code in language_registry().codes:
+        LocalizedSnapshot.objects.bulk_create(created, ignore_conflicts=True)
+    return found
+
+
+def snapshot_for(obj, lang_code: str, fallback_lang: str) -> dict:
+    return snapshot_map(type(obj), [obj], lang_code, fallback_lang)[obj.pk]
+
+
+def refresh_snapshots(obj) -> None:
+    registry = language_registry()
+    LocalizedSnapshot.objects.filter(
+        model_label=obj._meta.label_lower,
+        object_id=obj.pk,
+    ).delete()
+    LocalizedSnapshot.objects.bulk_create(
+        [_snapshot(obj, code, registry.default_code) for code in registry.codes],
+        ignore_conflicts=True,
+    )
+
+
+def delete_snapshots(obj) -> None:
+    LocalizedSnapshot.objects.filter(
+        model_label=obj._meta.label_lower,
+        object_id=obj.pk,
+    ).delete()
+
+
+def rebuild_snapshots(models=None, batch_size: int = 500) -> dict[str, int]:
+    registry = language_registry()
+    counts = {}
+    for model in models or SNAPSHOT_FIELDS:
+        label = model._meta.label_lower
+        LocalizedSnapshot.objects.filter(model_label=label).delete()
+        batch = []
+        total = 0
+        for obj in model.objects.order_by("pk").iterator(chunk_size=batch_size):
+            batch.extend(_snapshot(obj, code, registry.default_code) for code in registry.codes)
+            if len(batch) >= batch_size:
+                LocalizedSnapshot.objects.bulk_create(batch, ignore_conflicts=True)
+                total += len(batch)
+                batch = []
+        if batch:
+            LocalizedSnapshot.objects.bulk_create(batch, ignore_conflicts=True)
+            total += len(batch)
+        counts[label] = total
+    return counts
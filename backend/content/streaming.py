@@ -0,0 +1,50 @@
+from itertools import islice
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from .renderers import ORJSONRenderer
+
+STREAM_CONTENT_TYPES = {
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+_renderer = ORJSONRenderer()
+
+
+def stream_format(request) -> str | None:
+    requested = str(request.query_params.get("stream", "")).strip().lower()
+    if requested in ("1", "true", "yes"):
+        return "json"
+    if requested in STREAM_CONTENT_TYPES:
+        return requested
+    return None
+
+
+def iter_rows(queryset, serialize, chunk_size: int | None = None):
+    chunk_size = chunk_size or settings.CONTENT_STREAM_CHUNK_SIZE
+    keys = queryset.values_list("pk", flat=True).iterator(chunk_size=chunk_size)
+    while chunk := list(islice(keys, chunk_size)):
+        yield from serialize(queryset.filter(pk__in=chunk))
+
+
+def _json_array(rows):
+    yield b"["
+    separator = b""
+    for row in rows:
+        yield separator + _renderer.render(row)
+        separator = b","
+    yield b"]"
+
+
+def _ndjson(rows):
+    for row in rows:
+        yield _renderer.render(row) + b"\n"
+
+
+def streaming_response(rows, output_format: str) -> StreamingHttpResponse:
+    chunks = _ndjson(rows) if output_format == "ndjson" else _json_array(rows)
+    response = StreamingHttpResponse(chunks, content_type=STREAM_CONTENT_TYPES[output_format])
+    response["X-Streamed"] = output_format
+    return response
@@ -0,0 +1,1117 @@
+import gzip
+import json
+import tempfile
+from copy import deepcopy
+
+import brotli
+import msgpack
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.files.storage import default_storage
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import resolve
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+
+from .benchmarks import regressions
+from .bundles import read_manifest, write_i18n_bundles
+from .cache import (
+    CONTENT_VERSION_KEY,
+    _memo,
+    bump_content_version,
+    clear_versioned,
+    content_version,
+    response_cache_stats,
+)
+from .checks import check_shared_cache
+from .compression import negotiate_encoding
+from .documents import document_status
+from .generation import generate_content
+from .i18n import _build_legacy_translation_table, translation_table
+from .localization import LayeredMapping, _localized_text
+from .models import (
+    BootstrapDocument,
+    Category,
+    CategoryGalleryItem,
+    Expedition,
+    ExpeditionMedia,
+    Language,
+    LocalizedSnapshot,
+    Page,
+    PageSection,
+    SectionImage,
+    SiteSettings,
+    SiteText,
+    Story,
+    Translation,
+    TranslationKey,
+)
+from .pagination import encode_cursor
+from .queries import QueryBudgetExceeded
+from .serializers import (
+    CategorySerializer,
+    ExpeditionSerializer,
+    PageSectionSerializer,
+    PageSerializer,
+    StorySerializer,
+    _asset_or_legacy_url,
+    _fallback_lang,
+    _request_lang,
+)
+from .site_settings import site_settings
+from .viewsets import BATCH_MAX_REQUESTS, DOCUMENT_BUILDERS
+
+LANGUAGES = ("en", "ru", "zh", "de")
+
+
+def _text(serializer, obj, name):
+    return _localized_text(
+        getattr(obj, name),
+        getattr(obj, f"{name}_i18n"),
+        _request_lang(serializer),
+        _fallback_lang(serializer),
+    )
+
+
+def _payload(serializer, obj):
+    lang = _request_lang(serializer)
+    fallback_lang = _fallback_lang(serializer)
+    base = deepcopy(obj.payload) if isinstance(obj.payload, dict) else {}
+    translations = obj.payload_i18n
+    if not isinstance(translations, dict):
+        return base
+    fallback_payload = translations.get(fallback_lang)
+    if isinstance(fallback_payload, dict):
+        base = {**fallback_payload, **base}
+    if lang != fallback_lang:
+        translated = translations.get(lang)
+        if isinstance(translated, dict):
+            base.update(translated)
+    return base
+
+
+def _published(items):
+    items = [item for item in items if item.is_published]
+    items.sort(key=lambda item: (item.order, item.id))
+    return items
+
+
+class ReferenceSectionImageSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = SectionImage
+        fields = ("id", "image_url", "alt_text", "caption", "order", "is_published")
+
+
+class ReferencePageSectionSerializer(serializers.ModelSerializer):
+    title = serializers.SerializerMethodField()
+    subtitle = serializers.SerializerMethodField()
+    body = serializers.SerializerMethodField()
+    payload = serializers.SerializerMethodField()
+    images = serializers.SerializerMethodField()
+    anchor = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PageSection
+        fields = (
+            "id",
+            "key",
+            "anchor",
+            "section_type",
+            "title",
+            "subtitle",
+            "body",
+            "payload",
+            "order",
+            "is_published",
+            "images",
+        )
+
+    def get_images(self, obj):
+        return ReferenceSectionImageSerializer(_published(obj.images.all()), many=True).data
+
+    def get_title(self, obj):
+        return _text(self, obj, "title")
+
+    def get_subtitle(self, obj):
+        return _text(self, obj, "subtitle")
+
+    def get_body(self, obj):
+        return _text(self, obj, "body")
+
+    def get_payload(self, obj):
+        return _payload(self, obj)
+
+    def get_anchor(self, obj):
+        anchor = self.get_payload(obj).get("anchor")
+        if isinstance(anchor, str) and anchor.strip():
+            return anchor.strip()
+        if obj.key == "hero":
+            return "journey"
+        return obj.key
+
+
+class ReferencePageSerializer(serializers.ModelSerializer):
+    title = serializers.SerializerMethodField()
+    seo_title = serializers.SerializerMethodField()
+    seo_description = serializers.SerializerMethodField()
+    sections = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Page
+        fields = PageSerializer.Meta.fields
+
+    def get_sections(self, obj):
+        return ReferencePageSectionSerializer(
+            _published(obj.sections.all()),
+            many=True,
+            context=self.context,
+        ).data
+
+    def get_title(self, obj):
+        return _text(self, obj, "title")
+
+    def get_seo_title(self, obj):
+        return _text(self, obj, "seo_title")
+
+    def get_seo_description(self, obj):
+        return _text(self, obj, "seo_description")
+
+
+class ReferenceCategoryGalleryItemSerializer(serializers.ModelSerializer):
+    title = serializers.SerializerMethodField()
+    description = serializers.SerializerMethodField()
+    media_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = CategoryGalleryItem
+        fields = (
+            "id",
+            "title",
+            "description",
+            "image_url",
+            "media_url",
+            "alt_text",
+            "order",
+            "is_published",
+        )
+
+    def get_title(self, obj):
+        return _text(self, obj, "title")
+
+    def get_description(self, obj):
+        return _text(self, obj, "description")
+
+    def get_media_url(self, obj):
+        return _asset_or_legacy_url(obj.media, obj.image_url)
+
+
+class ReferenceCategorySerializer(serializers.ModelSerializer):
+    title = serializers.SerializerMethodField()
+    cover_url = serializers.SerializerMethodField()
+    gallery_items = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Category
+        fields = CategorySerializer.Meta.fields
+
+    def get_title(self, obj):
+        return _localized_text(obj.title, {}, _request_lang(self), _fallback_lang(self))
+
+    def get_cover_url(self, obj):
+        return _asset_or_legacy_url(obj.cover, obj.image_url)
+
+    def get_gallery_items(self, obj):
+        return ReferenceCategoryGalleryItemSerializer(
+            _published(obj.gallery_items.all()),
+            many=True,
+            context=self.context,
+        ).data
+
+
+class ReferenceExpeditionMediaSerializer(serializers.ModelSerializer):
+    title = serializers.SerializerMethodField()
+    body = serializers.SerializerMethodField()
+    media_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExpeditionMedia
+        fields = (
+            "id",
+            "kind",
+            "title",
+            "body",
+            "media_url",
+            "video_url",
+            "alt_text",
+            "order",
+            "is_published",
+        )
+
+    def get_title(self, obj):
+        return _text(self, obj, "title")
+
+    def get_body(self, obj):
+        return _text(self, obj, "body")
+
+    def get_media_url(self, obj):
+        return _asset_or_legacy_url(obj.media, obj.image_url)
+
+
+class ReferenceExpeditionSerializer(serializers.ModelSerializer):
+    cover_url = serializers.SerializerMethodField()
+    media_items = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Expedition
+        fields = ExpeditionSerializer.Meta.fields
+
+    def get_cover_url(self, obj):
+        return _asset_or_legacy_url(obj.cover, obj.image_url)
+
+    def get_media_items(self, obj):
+        return ReferenceExpeditionMediaSerializer(
+            _published(obj.media_items.all()),
+            many=True,
+            context=self.context,
+        ).data
+
+
+class ReferenceStorySerializer(serializers.ModelSerializer):
+    title = serializers.SerializerMethodField()
+    date_label = serializers.SerializerMethodField()
+    description = serializers.SerializerMethodField()
+    cover_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Story
+        fields = StorySerializer.Meta.fields
+
+    def get_title(self, obj):
+        return _text(self, obj, "title")
+
+    def get_date_label(self, obj):
+        return _text(self, obj, "date_label")
+
+    def get_description(self, obj):
+        return _text(self, obj, "description")
+
+    def get_cover_url(self, obj):
+        return _asset_or_legacy_url(obj.cover, obj.image_url)
+
+
+@override_settings(CONTENT_DOCUMENTS_IN_BACKGROUND=False, CONTENT_I18N_BUNDLES_IN_BACKGROUND=False)
+class ContentCacheTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        media = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(media.cleanup)
+        cls.enterClassContext(override_settings(MEDIA_ROOT=media.name))
+
+    def setUp(self):
+        for alias in caches:
+            caches[alias].clear()
+        clear_versioned()
+
+    def save(self, obj):
+        with self.captureOnCommitCallbacks(execute=True):
+            obj.save()
+
+
+class VersionReadCountingCache(LocMemCache):
+    reads = 0
+
+    def get(self, key, default=None, version=None):
+        if key == CONTENT_VERSION_KEY:
+            VersionReadCountingCache.reads += 1
+        return super().get(key, default, version)
+
+
+@override_settings(
+    CACHES={
+        "default": {"BACKEND": "content.tests.VersionReadCountingCache", "LOCATION": "version"},
+        "responses": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+)
+class ContentVersionScopeTests(ContentCacheTestCase):
+    def test_version_is_read_once_per_request(self):
+        paths = ("/api/v1/batch/?bundle=home", "/api/content/?lang=ru", "/api/content/?lang=ru")
+        for path in (*paths, "/api/async/content/?lang=ru"):
+            with self.subTest(path=path):
+                VersionReadCountingCache.reads = 0
+                self.assertEqual(self.client.get(path).status_code, 200)
+                self.assertEqual(VersionReadCountingCache.reads, 1)
+
+
+class TranslationTableCacheTests(ContentCacheTestCase):
+    def test_site_text_save_refreshes_shared_table(self):
+        text = SiteText.objects.create(
+            key="cache.greeting", text="Hello", text_i18n={"ru": "Привет"}
+        )
+        self.assertEqual(translation_table("ru", "en")["cache.greeting"], "Привет")
+        with self.assertNumQueries(0):
+            translation_table("ru", "en")
+
+        text.text_i18n = {"ru": "Здравствуйте"}
+        self.save(text)
+        self.assertEqual(translation_table("ru", "en")["cache.greeting"], "Здравствуйте")
+
+    def test_translation_save_refreshes_legacy_table(self):
+        SiteText.objects.all().delete()
+        key = TranslationKey.objects.create(key="legacy.greeting")
+        translation = Translation.objects.create(
+            language=Language.objects.get(code="ru"), key=key, text="Привет"
+        )
+        self.assertEqual(translation_table("ru", "en")["legacy.greeting"], "Привет")
+
+        translation.text = "Здравствуйте"
+        self.save(translation)
+        self.assertEqual(translation_table("ru", "en")["legacy.greeting"], "Здравствуйте")
+
+
+class LayeredMappingTests(SimpleTestCase):
+    def test_layers_match_a_dict_merge(self):
+        translated = {"title": "Заголовок", "cta": "Вперёд"}
+        base = {"anchor": "start", "title": "Title", "nested": {"a": 1}}
+        fallback = {"extra": "x", "title": "Fallback", "anchor": "fallback"}
+        layered = LayeredMapping(translated, None, base, "junk", fallback)
+
+        self.assertEqual(layered["title"], "Заголовок")
+        self.assertEqual(layered["anchor"], "start")
+        self.assertEqual(layered["extra"], "x")
+        with self.assertRaises(KeyError):
+            layered["missing"]
+        self.assertIn("cta", layered)
+        self.assertNotIn("junk", layered)
+        self.assertEqual(len(layered), 5)
+        self.assertEqual(list(layered), ["extra", "title", "anchor", "nested", "cta"])
+        self.assertEqual(dict(layered), {**fallback, **base, **translated})
+        self.assertEqual(list(dict(layered)), list({**fallback, **base, **translated}))
+        self.assertEqual(len(LayeredMapping(None, "junk")), 0)
+
+
+class LocalizedSnapshotTests(ContentCacheTestCase):
+    def snapshots(self, pk):
+        return dict(
+            LocalizedSnapshot.objects.filter(model_label="content.story", object_id=pk).values_list(
+                "language", "fields"
+            )
+        )
+
+    def test_snapshots_follow_save_and_delete(self):
+        story = Story.objects.create(
+            title="Trail",
+            title_i18n={"ru": "Тропа"},
+            slug="trail",
+            date_label="2026",
+            description="Walk",
+            image_url="https://example.com/trail.jpg",
+        )
+        pk = story.pk
+        snapshots = self.snapshots(pk)
+        self.assertEqual(set(snapshots), {"en", "ru", "zh"})
+        self.assertEqual(snapshots["ru"]["title"], "Тропа")
+        self.assertEqual(snapshots["zh"]["title"], "Trail")
+
+        story.title_i18n = {"ru": "Путь"}
+        story.save()
+        self.assertEqual(self.snapshots(pk)["ru"]["title"], "Путь")
+
+        story.delete()
+        self.assertEqual(self.snapshots(pk), {})
+
+
+class I18nDeltaSyncTests(ContentCacheTestCase):
+    def fetch(self, **params):
+        response = self.client.get("/api/i18n/", {"lang": "ru", **params})
+        self.assertEqual(response.status_code, 200)
+        return response["X-I18n-Version"], json.loads(response.content)
+
+    def test_delta_for_known_tokens_and_full_payload_otherwise(self):
+        text = SiteText.objects.create(
+            key="delta.title", text="Title", text_i18n={"ru": "Заголовок"}
+        )
+        removed = SiteText.objects.create(key="delta.removed", text="Gone")
+        token, full = self.fetch()
+        self.assertEqual(full["delta.title"], "Заголовок")
+
+        _, same = self.fetch(since=token)
+        self.assertEqual((same["full"], same["changed"], same["removed"]), (False, {}, []))
+        response = self.client.get(
+            "/api/i18n/", {"lang": "ru", "since": token}, HTTP_IF_NONE_MATCH=f'"{token}..{token}"'
+        )
+        self.assertEqual(response.status_code, 304)
+
+        text.text_i18n = {"ru": "Новый заголовок"}
+        self.save(text)
+        with self.captureOnCommitCallbacks(execute=True):
+            removed.delete()
+        new_token, delta = self.fetch(since=token)
+        self.assertNotEqual(new_token, token)
+        self.assertFalse(delta["full"])
+        self.assertEqual(delta["changed"], {"delta.title": "Новый заголовок"})
+        self.assertEqual(delta["removed"], ["delta.removed"])
+
+        _, unknown = self.fetch(since="unknown")
+        self.assertTrue(unknown["full"])
+        self.assertEqual(unknown["changed"], self.fetch()[1])
+
+    @override_settings(CORS_ALLOWED_ORIGINS=["http://localhost:5173"])
+    def test_cross_origin_client_can_use_versions(self):
+        origin = {"HTTP_ORIGIN": "http://localhost:5173"}
+        preflight = self.client.options(
+            "/api/i18n/",
+            HTTP_ACCESS_CONTROL_REQUEST_METHOD="GET",
+            HTTP_ACCESS_CONTROL_REQUEST_HEADERS="if-none-match",
+            **origin,
+        )
+        self.assertIn("if-none-match", preflight["Access-Control-Allow-Headers"])
+        response = self.client.get("/api/i18n/", {"lang": "ru"}, **origin)
+        self.assertEqual(response["Access-Control-Expose-Headers"], "ETag, X-I18n-Version")
+
+    def test_content_can_skip_texts(self):
+        payload = json.loads(self.client.get("/api/content/?lang=ru&texts=0").content)
+        self.assertEqual(payload["texts"], {})
+        self.assertTrue(json.loads(self.client.get("/api/content/?lang=ru").content)["texts"])
+
+
+class TranslationGroupTests(ContentCacheTestCase):
+    def test_unknown_groups_are_rejected_before_caching(self):
+        SiteText.objects.create(key="tests.title", group="tests", text="Title")
+        response = self.client.get("/api/i18n/", {"lang": "ru", "groups": "tests"})
+        self.assertEqual(json.loads(response.content), {"tests.title": "Title"})
+
+        entries = len(_memo)
+        for path in ("/api/i18n/", "/api/content/", "/api/async/content/"):
+            with self.subTest(path=path):
+                response = self.client.get(path, {"lang": "ru", "groups": "tests,junk"})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(json.loads(response.content), {"groups": ["Unknown group: junk"]})
+        self.assertEqual(len(_memo), entries)
+
+
+class I18nBundleTests(ContentCacheTestCase):
+    def read(self, name):
+        with default_storage.open(name) as handle:
+            return handle.read()
+
+    def test_i18n_save_rewrites_bundles_and_manifest(self):
+        write_i18n_bundles()
+        previous = read_manifest()["languages"]["ru"]["file"]
+        self.save(SiteText(key="bundle.title", text="Title", text_i18n={"ru": "Заголовок"}))
+
+        manifest = read_manifest()
+        self.assertEqual(set(manifest["languages"]), {"en", "ru", "zh"})
+        current = manifest["languages"]["ru"]
+        self.assertNotEqual(current["file"], previous)
+        self.assertEqual(current["file"], f"i18n/ru.{current['hash']}.json")
+        data = self.read(current["file"])
+        self.assertEqual(json.loads(data), translation_table("ru", "en"))
+        self.assertEqual(json.loads(data)["bundle.title"], "Заголовок")
+        self.assertEqual(gzip.decompress(self.read(f"{current['file']}.gz")), data)
+        _, files = default_storage.listdir("i18n")
+        self.assertFalse([name for name in files if name.startswith(".")])
+
+
+def _reference_legacy_table(lang_code, fallback_lang):
+    key_by_id = dict(TranslationKey.objects.filter(is_active=True).values_list("id", "key"))
+    translations = {}
+    for code in dict.fromkeys((lang_code, fallback_lang)):
+        rows = Translation.objects.filter(
+            language__code=code,
+            language__is_active=True,
+            key_id__in=key_by_id,
+        ).values_list("key_id", "text")
+        for key_id, text in rows:
+            translations.setdefault(key_by_id[key_id], text)
+    for key in key_by_id.values():
+        translations.setdefault(key, key)
+    return translations
+
+
+class LegacyTranslationTableTests(TestCase):
+    def test_pivot_query_matches_per_language_queries(self):
+        languages = dict(Language.objects.values_list("code", "id"))
+        Language.objects.filter(code="zh").update(is_active=False)
+        both, english, missing, inactive = (
+            TranslationKey.objects.create(key=key, is_active=key != "legacy.inactive")
+            for key in ("legacy.both", "legacy.english", "legacy.missing", "legacy.inactive")
+        )
+        Translation.objects.bulk_create(
+            [
+                Translation(language_id=languages["en"], key=both, text="Both"),
+                Translation(language_id=languages["ru"], key=both, text="Оба"),
+                Translation(language_id=languages["en"], key=english, text="English"),
+                Translation(language_id=languages["zh"], key=missing, text="缺"),
+                Translation(language_id=languages["ru"], key=inactive, text="Скрыт"),
+            ]
+        )
+        for lang_code, fallback_lang in (("ru", "en"), ("en", "en"), ("zh", "ru"), ("de", "en")):
+            with self.subTest(lang=lang_code, fallback=fallback_lang):
+                with self.assertNumQueries(1):
+                    table = _build_legacy_translation_table(lang_code, fallback_lang)
+                self.assertEqual(table, _reference_legacy_table(lang_code, fallback_lang))
+        table = _build_legacy_translation_table("ru", "en")
+        self.assertEqual(
+            [table["legacy.both"], table["legacy.english"], table["legacy.missing"]],
+            ["Оба", "English", "legacy.missing"],
+        )
+        self.assertNotIn("legacy.inactive", table)
+
+
+@override_settings(ALLOWED_HOSTS=["testserver", "a.example", "b.example"])
+class ResponseCacheTests(ContentCacheTestCase):
+    path = "/api/stories/?lang=ru&limit=1"
+
+    def test_hit_miss_and_invalidation_after_bump(self):
+        first = self.client.get(self.path)
+        self.assertEqual(first["X-Cache"], "MISS")
+        second = self.client.get(self.path)
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+        bump_content_version()
+        self.assertEqual(self.client.get(self.path)["X-Cache"], "MISS")
+
+    def test_host_is_part_of_the_key(self):
+        for host in ("a.example", "b.example"):
+            response = self.client.get(self.path, HTTP_HOST=host)
+            self.assertEqual(response["X-Cache"], "MISS")
+            self.assertTrue(json.loads(response.content)["first"].startswith(f"http://{host}/"))
+
+    def test_authenticated_and_browsable_responses_are_not_cached(self):
+        admin = get_user_model().objects.create_superuser("cache-admin", "admin@example.com", "pw")
+        self.client.force_login(admin)
+        response = self.client.get(self.path, HTTP_ACCEPT="text/html")
+        self.assertEqual(response["X-Cache"], "BYPASS")
+        self.assertNotIn("ETag", response)
+        self.assertIn(b"cache-admin", response.content)
+
+        self.client.logout()
+        for _ in range(2):
+            response = self.client.get(self.path, HTTP_ACCEPT="text/html")
+            self.assertEqual(response["X-Cache"], "MISS")
+            self.assertNotIn(b"cache-admin", response.content)
+
+
+class ConditionalRequestTests(ContentCacheTestCase):
+    path = "/api/content/?lang=ru"
+
+    def test_not_modified_until_content_changes(self):
+        response = self.client.get(self.path)
+        etag, last_modified = response["ETag"], response["Last-Modified"]
+        for headers in ({"HTTP_IF_NONE_MATCH": etag}, {"HTTP_IF_MODIFIED_SINCE": last_modified}):
+            with self.subTest(headers=headers):
+                response = self.client.get(self.path, **headers)
+                self.assertEqual(response.status_code, 304)
+                self.assertEqual(response["ETag"], etag)
+                self.assertEqual(response.content, b"")
+
+        bump_content_version()
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_delete_changes_seeded_version_after_cache_loss(self):
+        etag = self.client.get(self.path)["ETag"]
+        Story.objects.order_by("updated_at").first().delete()
+        for alias in caches:
+            caches[alias].clear()
+        clear_versioned()
+        response = self.client.get(self.path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class BootstrapDocumentTests(ContentCacheTestCase):
+    path = "/api/site/structure/?lang=ru"
+
+    def document(self):
+        return BootstrapDocument.objects.get(kind="site-structure", language="ru")
+
+    def stale(self):
+        return [item for item in document_status(DOCUMENT_BUILDERS) if item["stale"]]
+
+    def test_stale_documents_are_rebuilt(self):
+        self.assertEqual(self.client.get(self.path).status_code, 200)
+        self.assertEqual(self.document().content_version, content_version())
+
+        bump_content_version()
+        self.assertTrue(self.stale())
+        self.assertEqual(self.client.get(self.path).status_code, 200)
+        self.assertEqual(self.document().content_version, content_version())
+
+        instance = SiteSettings.objects.get()
+        instance.brand_name_i18n = {"ru": "Новый бренд"}
+        self.save(instance)
+        self.assertEqual(self.stale(), [])
+        self.assertEqual(json.loads(self.document().body)["site"]["brand_name"], "Новый бренд")
+
+
+class MessagePackRendererTests(ContentCacheTestCase):
+    def test_msgpack_payload_matches_json(self):
+        for path in ("/api/content/?lang=ru", "/api/stories/?lang=ru", "/api/v1/site/?lang=zh"):
+            with self.subTest(path=path):
+                packed = self.client.get(path, HTTP_ACCEPT="application/msgpack")
+                self.assertEqual(packed["Content-Type"], "application/msgpack")
+                expected = json.loads(self.client.get(path, HTTP_ACCEPT="application/json").content)
+                self.assertEqual(msgpack.unpackb(packed.content), expected)
+
+
+class BatchEndpointTests(ContentCacheTestCase):
+    def get(self, path, status_code=200):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, status_code)
+        return json.loads(response.content)
+
+    def test_fans_out_and_reports_errors_per_item(self):
+        payload = self.get("/api/v1/batch/?requests=navigation,stories,page:missing&lang=ru")
+        responses = payload["responses"]
+        self.assertEqual(list(responses), ["navigation", "stories", "page:missing"])
+        self.assertEqual(responses["navigation"]["body"], self.get("/api/navigation/?lang=ru"))
+        self.assertEqual(responses["stories"]["body"], self.get("/api/stories/?lang=ru"))
+        self.assertEqual(responses["page:missing"]["status"], 404)
+
+    def test_rejects_invalid_batches(self):
+        for query in ("requests=unknown", "requests=page", "bundle=missing", ""):
+            with self.subTest(query=query):
+                self.get(f"/api/v1/batch/?{query}", status_code=400)
+        stories = ",".join(f"story:s{index}" for index in range(BATCH_MAX_REQUESTS + 1))
+        self.get(f"/api/v1/batch/?requests={stories}", status_code=400)
+
+
+class CompressionTests(ContentCacheTestCase):
+    path = "/api/content/?lang=ru"
+
+    def test_negotiates_encoding(self):
+        cases = {
+            "gzip, br": "br",
+            "gzip, br;q=0.5": "gzip",
+            "br;q=0, gzip;q=0": "identity",
+            "*": "br",
+            "identity": "identity",
+            "": "identity",
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(negotiate_encoding(header), expected)
+
+    def test_miss_precompresses_every_encoding(self):
+        plain = self.client.get(self.path).content
+        response = self.client.get(self.path, HTTP_ACCEPT_ENCODING="br")
+        self.assertEqual((response["X-Cache"], response["X-Compression"]), ("HIT", "precompressed"))
+        self.assertEqual(brotli.decompress(response.content), plain)
+        self.assertIn("Accept-Encoding", response["Vary"])
+
+        bump_content_version()
+        response = self.client.get(self.path, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response["X-Compression"], "precompressed")
+        self.assertEqual(gzip.decompress(response.content), plain)
+        self.assertTrue(response["ETag"].startswith("W/"))
+        cached = self.client.get(self.path, HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual((cached["X-Cache"], cached["X-Compression"]), ("HIT", "precompressed"))
+
+    def test_batch_items_are_not_precompressed(self):
+        self.client.get("/api/v1/batch/?bundle=home", HTTP_ACCEPT_ENCODING="br")
+        store = caches["responses"]
+        entries = [store.get(key.split(":", 2)[2]) for key in list(store._cache)]
+        entries = [entry for entry in entries if isinstance(entry, dict)]
+        self.assertGreater(len(entries), 1)
+        self.assertEqual(sum(bool(entry["encodings"]) for entry in entries), 1)
+
+    def test_skips_small_streamed_and_error_responses(self):
+        for path in ("/api/v1/menus/missing/", "/api/stories/?stream=json"):
+            with self.subTest(path=path):
+                response = self.client.get(path, HTTP_ACCEPT_ENCODING="br")
+                self.assertNotIn("Content-Encoding", response)
+        with override_settings(CONTENT_COMPRESS_MIN_SIZE=10**7):
+            response = self.client.get(self.path, HTTP_ACCEPT_ENCODING="br")
+        self.assertNotIn("Content-Encoding", response)
+
+
+class CompiledSerializerOutputTests(TestCase):
+    cases = (
+        (PageSerializer, ReferencePageSerializer, Page, "sections__images"),
+        (CategorySerializer, ReferenceCategorySerializer, Category, "gallery_items__media"),
+        (ExpeditionSerializer, ReferenceExpeditionSerializer, Expedition, "media_items__media"),
+        (StorySerializer, ReferenceStorySerializer, Story, None),
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        expedition = Expedition.objects.create(
+            title="Test expedition",
+            slug="test-expedition",
+            date_label="2026",
+            description="Base description",
+            image_url="https://example.com/cover.jpg",
+        )
+        ExpeditionMedia.objects.create(
+            expedition=expedition,
+            title="",
+            title_i18n={"en": "English only"},
+            body="Body",
+            body_i18n={"ru": "Тело", "zh": "  "},
+            image_url="https://example.com/a.jpg",
+            order=2,
+        )
+        ExpeditionMedia.objects.create(
+            expedition=expedition,
+            title="Hidden",
+            image_url="https://example.com/b.jpg",
+            is_published=False,
+        )
+        page = Page.objects.create(title="Test page", slug="test-page", title_i18n={"zh": "测试"})
+        section = PageSection.objects.create(
+            page=page,
+            key="hero",
+            section_type="hero",
+            title="Hero",
+            payload={"anchor": "  ", "cta_label": "Go", "nested": {"a": 1}},
+            payload_i18n={"en": {"extra": "x"}, "ru": {"cta_label": "Вперёд", "anchor": "start"}},
+        )
+        SectionImage.objects.create(section=section, image_url="https://example.com/s.jpg", order=1)
+        SectionImage.objects.create(
+            section=section,
+            image_url="https://example.com/hidden.jpg",
+            is_published=False,
+        )
+
+    def render(self, serializer_class, source, lang, many=True):
+        context = {"lang_code": lang, "fallback_lang": "en"}
+        return JSONRenderer().render(serializer_class(source, many=many, context=context).data)
+
+    def test_compiled_list_output_is_byte_identical(self):
+        for serializer_class, reference_class, model, prefetch in self.cases:
+            queryset = model.objects.order_by("order", "id")
+            prefetched = queryset.prefetch_related(prefetch) if prefetch else queryset
+            for lang in LANGUAGES:
+                with self.subTest(serializer=serializer_class.__name__, lang=lang):
+                    expected = self.render(reference_class, prefetched, lang)
+                    self.assertEqual(self.render(serializer_class, queryset, lang), expected)
+                    self.assertEqual(self.render(serializer_class, list(prefetched), lang), expected)
+
+    def test_compiled_detail_output_is_byte_identical(self):
+        for serializer_class, reference_class, model, _ in self.cases:
+            for obj in model.objects.order_by("order", "id"):
+                for lang in LANGUAGES:
+                    with self.subTest(serializer=serializer_class.__name__, pk=obj.pk, lang=lang):
+                        self.assertEqual(
+                            self.render(serializer_class, obj, lang, many=False),
+                            self.render(reference_class, obj, lang, many=False),
+                        )
+
+    def test_sparse_output_is_projection_of_full_output(self):
+        for serializer_class, _, model, _ in self.cases:
+            queryset = model.objects.order_by("order", "id")
+            full = serializer_class(
+                queryset,
+                many=True,
+                context={"lang_code": "ru", "fallback_lang": "en"},
+            ).data
+            for fields in (("title",), ("id", "slug", "cover_url"), ("updated_at",)):
+                selected = [name for name in serializer_class.Meta.fields if name in fields]
+                with self.subTest(serializer=serializer_class.__name__, fields=fields):
+                    sparse = serializer_class(
+                        queryset,
+                        many=True,
+                        context={"lang_code": "ru", "fallback_lang": "en", "fields": fields},
+                    ).data
+                    self.assertEqual(
+                        sparse,
+                        [{name: item[name] for name in selected} for item in full],
+                    )
+
+
+    def test_sparse_section_anchor_without_images(self):
+        context = {"lang_code": "ru", "fallback_lang": "en"}
+        queryset = PageSection.objects.order_by("order", "id")
+        full = PageSectionSerializer(queryset, many=True, context=context).data
+        self.assertIn("start", [item["anchor"] for item in full])
+        for source in (queryset, list(queryset)):
+            sparse = PageSectionSerializer(
+                source, many=True, context={**context, "fields": ("anchor",)}
+            ).data
+            self.assertEqual(sparse, [{"anchor": item["anchor"]} for item in full])
+
+
+class KeysetPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(title="Archive", slug="archive")
+        for index in range(5):
+            CategoryGalleryItem.objects.create(
+                category=cls.category,
+                title=f"Frame {index}",
+                image_url=f"https://example.com/{index}.jpg",
+                order=index // 2 + 1,
+            )
+
+    def setUp(self):
+        for alias in caches:
+            caches[alias].clear()
+
+    def walk(self, url, between_pages=None):
+        seen = []
+        while url:
+            payload = self.client.get(url).json()
+            seen.extend(item["id"] for item in payload["results"])
+            url = payload["next"]
+            if between_pages:
+                between_pages()
+                between_pages = None
+        return seen
+
+    def test_unpaginated_without_cursor_or_limit(self):
+        payload = self.client.get(f"/api/categories/{self.category.slug}/gallery/").json()
+        self.assertIsInstance(payload, list)
+        self.assertEqual(len(payload), 5)
+
+    def test_pages_follow_order_and_id(self):
+        expected = list(
+            self.category.gallery_items.order_by("order", "id").values_list("id", flat=True)
+        )
+        url = f"/api/categories/{self.category.slug}/gallery/?limit=2"
+        self.assertEqual(self.walk(url), expected)
+
+    def test_pages_are_stable_under_concurrent_inserts(self):
+        expected = list(
+            self.category.gallery_items.order_by("order", "id").values_list("id", flat=True)
+        )
+
+        def insert_before_cursor():
+            self.setUp()
+            CategoryGalleryItem.objects.create(category=self.category, title="Early", order=0)
+
+        url = f"/api/categories/{self.category.slug}/gallery/?limit=2"
+        self.assertEqual(self.walk(url, insert_before_cursor), expected)
+
+    def test_malformed_cursors_are_not_found(self):
+        url = f"/api/categories/{self.category.slug}/gallery/?limit=2&cursor="
+        for values in (["abc", 1], [{"a": 1}, 1], [None, 1], [1]):
+            with self.subTest(values=values):
+                self.assertEqual(self.client.get(url + encode_cursor(values)).status_code, 404)
+        self.assertEqual(self.client.get(url + "%%%").status_code, 404)
+        self.assertEqual(self.client.get(url + encode_cursor(["2", 1])).status_code, 200)
+
+
+@override_settings(CONTENT_STREAM_CHUNK_SIZE=2)
+class StreamingListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(title="Archive", slug="archive")
+        Category.objects.create(title="Second", slug="second", order=2)
+        for index in range(5):
+            CategoryGalleryItem.objects.create(
+                category=cls.category,
+                title=f"Frame {index}",
+                image_url=f"https://example.com/{index}.jpg",
+            )
+
+    def setUp(self):
+        for alias in caches:
+            caches[alias].clear()
+
+    def test_streamed_array_matches_regular_list(self):
+        url = f"/api/categories/{self.category.slug}/gallery/?lang=ru"
+        expected = self.client.get(url).content
+        self.setUp()
+        response = self.client.get(f"{url}&stream=json")
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(b"".join(response.streaming_content), expected)
+
+    @override_settings(CONTENT_QUERY_HEADERS=True)
+    def test_streamed_ndjson_emits_one_row_per_line(self):
+        url = "/api/categories/?lang=ru"
+        expected = self.client.get(url).json()
+        self.setUp()
+        response = self.client.get(f"{url}&stream=ndjson")
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual([json.loads(line) for line in lines], expected)
+        self.assertEqual(response["X-Cache"], "BYPASS")
+        self.assertNotIn("X-DB-Queries", response)
+        self.assertEqual(response_cache_stats()["misses"], 0)
+
+
+@override_settings(CONTENT_QUERY_HEADERS=True, CONTENT_QUERY_BUDGET_ACTION="raise")
+class QueryBudgetTests(TestCase):
+    paths = (
+        "/api/content/?lang=ru",
+        "/api/site/structure/?lang=ru",
+        "/api/v1/bootstrap/?lang=ru",
+        "/api/v1/batch/?bundle=home&lang=ru",
+    )
+
+    def setUp(self):
+        BootstrapDocument.objects.all().delete()
+        for alias in caches:
+            caches[alias].clear()
+
+    def test_composite_views_stay_within_budget_on_cold_caches(self):
+        for path in self.paths:
+            with self.subTest(path=path):
+                self.setUp()
+                response = self.client.get(path)
+                self.assertEqual(response.status_code, 200)
+                self.assertGreater(int(response["X-DB-Queries"]), 0)
+                self.assertEqual(self.client.get(path)["X-DB-Queries"], "0")
+
+    def test_server_timing_breaks_down_cold_and_cached_requests(self):
+        def phases(response):
+            return {entry.split(";")[0] for entry in response["Server-Timing"].split(", ")}
+
+        cold = phases(self.client.get("/api/content/?lang=ru"))
+        self.assertTrue({"lang", "cache", "settings", "texts", "render", "db", "total"} <= cold)
+        cached = phases(self.client.get("/api/content/?lang=ru"))
+        self.assertEqual(cached, {"lang", "cache", "db", "total"})
+
+    def test_exceeded_budget_raises(self):
+        with override_settings(CONTENT_QUERY_BUDGETS={"content": 1}):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get("/api/content/?lang=ru")
+
+
+class BenchmarkRegressionTests(TestCase):
+    def result(self, **values):
+        return {
+            "size": 10,
+            "route": "content",
+            "lang": "ru",
+            "queries": 5,
+            "cold_median_ms": 40.0,
+            "warm_median_ms": 2.0,
+            **values,
+        }
+
+    def test_reports_slowdowns_and_extra_queries_only(self):
+        baseline = [self.result(), self.result(route="navigation")]
+        results = [
+            self.result(queries=6, cold_median_ms=60.0, warm_median_ms=3.5),
+            self.result(route="navigation", cold_median_ms=44.0),
+            self.result(route="v1-site"),
+        ]
+        self.assertEqual(
+            regressions(results, baseline),
+            ["content @ 10: queries 5 -> 6", "content @ 10: cold_median_ms 40.00 -> 60.00"],
+        )
+
+
+class ContentGeneratorTests(TestCase):
+    counts = {
+        "expeditions": 3,
+        "media_per_expedition": 2,
+        "categories": 2,
+        "gallery_per_category": 2,
+        "stories": 2,
+        "pages": 2,
+        "sections_per_page": 2,
+        "images_per_section": 1,
+        "menus": 1,
+        "items_per_menu": 2,
+        "navigation_items": 2,
+        "site_texts": 3,
+        "translation_keys": 3,
+    }
+
+    def titles(self, prefix):
+        return list(
+            PageSection.objects.filter(page__slug__startswith=f"{prefix}-")
+            .order_by("id")
+            .values_list("title", "body_i18n")
+        )
+
+    def test_same_seed_generates_same_content(self):
+        stats = generate_content("first", seed=7, **self.counts)
+        generate_content("second", seed=7, **self.counts)
+        self.assertEqual(self.titles("first"), self.titles("second"))
+        rows = {item["model"]: item["rows"] for item in stats}
+        self.assertEqual(rows["content.expeditionmedia"], 6)
+        self.assertEqual(rows["content.translation"], 9)
+        with self.assertRaises(ValueError):
+            generate_content("first", **self.counts)
+
+    def test_content_version_bumps_on_commit(self):
+        before = content_version()
+        with self.captureOnCommitCallbacks() as callbacks:
+            generate_content("bump", seed=3, **self.counts)
+        self.assertEqual(content_version(), before)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(content_version(), before)
+
+
+class SharedCacheCheckTests(TestCase):
+    def test_per_process_cache_warns_outside_debug(self):
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        with override_settings(DEBUG=False, CACHES=locmem):
+            self.assertEqual([issue.id for issue in check_shared_cache(None)], ["content.W001"])
+        with override_settings(DEBUG=True, CACHES=locmem):
+            self.assertEqual(check_shared_cache(None), [])
+        shared = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}}
+        with override_settings(DEBUG=False, CACHES=shared):
+            self.assertEqual(check_shared_cache(None), [])
+
+
+@override_settings(CONTENT_DOCUMENTS_IN_BACKGROUND=False)
+class SiteSettingsSingletonTests(TestCase):
+    def test_cached_singleton_refreshes_on_save(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            current = site_settings()
+        with self.assertNumQueries(0):
+            self.assertIs(site_settings(), current)
+        self.assertEqual(SiteSettings.objects.count(), 1)
+        with self.assertRaises(AttributeError):
+            current.brand_name = "Changed"
+
+        instance = SiteSettings.objects.get()
+        instance.brand_name_i18n = {"ru": "Бренд"}
+        with self.captureOnCommitCallbacks(execute=True):
+            instance.save()
+        refreshed = site_settings()
+        self.assertIsNot(refreshed, current)
+        self.assertEqual(refreshed.localized("ru", "en")["brand_name"], "Бренд")
+
+    def test_second_row_is_rejected(self):
+        site_settings()
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SiteSettings.objects.create()
+        self.assertEqual(SiteSettings.objects.count(), 1)
+
+
+@override_settings(CONTENT_DOCUMENTS_IN_BACKGROUND=False)
+class AsyncCompositeViewTests(TransactionTestCase):
+    paths = (
+        ("/api/content/", "/api/async/content/"),
+        ("/api/site/structure/", "/api/async/site/structure/"),
+        ("/api/v1/bootstrap/", "/api/async/v1/bootstrap/"),
+    )
+
+    def setUp(self):
+        page = Page.objects.create(title="Async", slug="async-page")
+        PageSection.objects.create(page=page, key="hero", section_type="hero", title="Hero")
+
+    def clear(self):
+        BootstrapDocument.objects.all().delete()
+        for alias in caches:
+            caches[alias].clear()
+
+    async def test_async_views_match_sync_views(self):
+        for sync_path, async_path in self.paths:
+            for lang in ("en", "ru"):
+                with self.subTest(path=sync_path, lang=lang):
+                    await sync_to_async(self.clear)()
+                    expected = await sync_to_async(self.client.get)(f"{sync_path}?lang={lang}")
+                    await sync_to_async(self.clear)()
+                    response = await self.async_client.get(f"{async_path}?lang={lang}")
+                    self.assertEqual(response.status_code, expected.status_code)
+                    self.assertEqual(response.content, expected.content)
+
+    def test_async_web_routes_do_not_shadow_page_slugs(self):
+        self.assertEqual(resolve("/async/", urlconf="content.web_urls").url_name, "page")
+        self.assertEqual(resolve("/~async/", urlconf="content.web_urls").url_name, "async-home")
+        match = resolve("/~async/about/", urlconf="content.web_urls")
+        self.assertEqual((match.url_name, match.kwargs), ("async-page", {"slug": "about"}))
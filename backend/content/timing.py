@@ -0,0 +1,62 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+
+_timings = ContextVar("content_server_timings", default=None)
+
+
+class ServerTimings:
+    def __init__(self):
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, duration_ms: float) -> None:
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + duration_ms
+
+    def header(self, total_ms: float) -> str:
+        entries = [f"{name};dur={duration:.2f}" for name, duration in self.phases.items()]
+        entries.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(entries)
+
+
+def start_timings() -> tuple[ServerTimings, object]:
+    timings = ServerTimings()
+    return timings, _timings.set(timings)
+
+
+def stop_timings(token) -> None:
+    _timings.reset(token)
+
+
+def record_timing(name: str, duration_ms: float) -> None:
+    timings = _timings.get()
+    if timings is not None:
+        timings.add(name, duration_ms)
+
+
+@contextmanager
+def timing_phase(name: str):
+    timings = _timings.get()
+    if timings is None:
+        yield
+        return
+    started = perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (perf_counter() - started) * 1000)
+
+
+def timed(name: str):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timing_phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,14 @@
 from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from .async_views import AsyncContentView, AsyncSiteBootstrapView, AsyncSiteStructureView
 from .viewsets import (
+    BatchView,
     CategoryViewSet,
     ContentView,
     ExpeditionViewSet,
     I18nDictionaryView,
+    I18nManifestView,
     MenuDetailView,
     NavigationView,
     NavigationItemViewSet,
@@ -36,10 +39,19 @@ urlpatterns = [
     path("navigation/", NavigationView.as_view(), name="navigation"),
     path("pages/<slug:slug>/", PageDetailView.as_view(), name="page-detail"),
     path("i18n/", I18nDictionaryView.as_view(), name="i18n-dictionary"),
+    path("i18n/manifest/", I18nManifestView.as_view(), name="i18n-manifest"),
     path("i18n/set-language/", SetLanguageView.as_view(), name="set-language"),
     path("site/structure/", SiteStructureView.as_view(), name="site-structure"),
     path("v1/site/", SiteSettingsDetailView.as_view(), name="v1-site"),
     path("v1/bootstrap/", SiteBootstrapView.as_view(), name="v1-bootstrap"),
+    path("v1/batch/", BatchView.as_view(), name="v1-batch"),
+    path("async/content/", AsyncContentView.as_view(), name="async-content"),
+    path(
+        "async/site/structure/",
+        AsyncSiteStructureView.as_view(),
+        name="async-site-structure",
+    ),
+    path("async/v1/bootstrap/", AsyncSiteBootstrapView.as_view(), name="async-v1-bootstrap"),
     path("v1/menus/<slug:code>/", MenuDetailView.as_view(), name="v1-menu-detail"),
 ]
 urlpatterns += v1_router.urls
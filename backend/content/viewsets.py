@@ -1,26 +1,57 @@
+from collections.abc import Mapping
+
+import orjson
 from django.conf import settings
+from django.http import HttpRequest, HttpResponse, QueryDict
+from django.shortcuts import get_object_or_404
+from django.urls import NoReverseMatch, resolve, reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, parse_etags, quote_etag
 from django.utils.text import slugify
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from .cache import (
+    content_version,
+    count_response_cache,
+    request_fingerprint,
+    response_cache,
+    response_cache_key,
+    response_etag,
+)
+from .compression import available_encodings, precompress
+from .documents import load_document
+from .fetches import run_fetches
+from .i18n import (
+    language_registry,
+    route_groups,
+    translation_bundle,
+    translation_delta,
+    translation_groups,
+    translation_token,
+)
+from .localization import _localized_text
 from .models import (
     Category,
+    CategoryGalleryItem,
     Expedition,
-    Language,
+    ExpeditionMedia,
     Menu,
     MenuItem,
     NavigationItem,
     Page,
     SiteSettings,
-    SiteText,
     SocialLink,
     Story,
-    Translation,
-    TranslationKey,
 )
+from .pagination import KeysetPagination
 from .serializers import (
+    CategoryGalleryItemSerializer,
     CategorySerializer,
+    ExpeditionMediaSerializer,
     ExpeditionSerializer,
     MenuSerializer,
     NavigationItemSerializer,
@@ -29,55 +60,30 @@ from .serializers import (
     SocialLinkSerializer,
     StorySerializer,
 )
-
-
-def _localize_text(default_value: str, translations: dict, lang_code: str, fallback_lang: str) -> str:
-    if isinstance(translations, dict):
-        translated = translations.get(lang_code)
-        if isinstance(translated, str) and translated.strip():
-            return translated
-
-    if isinstance(default_value, str) and default_value.strip():
-        return default_value
-
-    if isinstance(translations, dict):
-        fallback_value = translations.get(fallback_lang)
-        if isinstance(fallback_value, str) and fallback_value.strip():
-            return fallback_value
-
-    return default_value if isinstance(default_value, str) else ""
+from .site_settings import site_settings
+from .snapshots import snapshot_map
+from .streaming import iter_rows, stream_format, streaming_response
+from .timing import timed, timing_phase
 
 
 def _language_by_code(code: str):
-    return (
-        Language.objects.filter(code=code, is_active=True)
-        .order_by("order", "id")
-        .first()
-    )
+    return language_registry().get(code)
 
 
 def _active_languages():
-    return Language.objects.filter(is_active=True).order_by("order", "id")
+    return language_registry().languages
 
 
 def _get_default_language():
-    languages = _active_languages()
-    return (
-        languages.filter(code="en").first()
-        or languages.filter(is_default=True).first()
-        or languages.first()
-    )
+    return language_registry().default
 
 
 def _default_language_code() -> str:
-    default_language = _get_default_language()
-    if default_language:
-        return default_language.code
-    return "en"
+    return language_registry().default_code
 
 
 def _resolve_language(request):
-    requested = str(request.query_params.get("lang", "")).strip().lower()
+    requested = str(request.GET.get("lang", "")).strip().lower()
     if requested:
         language = _language_by_code(requested)
         if language:
@@ -92,11 +98,12 @@ def _resolve_language(request):
     return _get_default_language()
 
 
+@timed("lang")
 def _resolved_language_code(request):
     language = _resolve_language(request)
     if language:
-        return language.code
-    fallback = str(request.query_params.get("lang", "")).strip().lower()
+        return language["code"]
+    fallback = str(request.GET.get("lang", "")).strip().lower()
     return fallback or _default_language_code()
 
 
@@ -112,62 +119,32 @@ def _set_language_cookie(response, language_code: str):
     )
 
 
-def _legacy_translation_dict(language_code: str, fallback_lang: str) -> dict[str, str]:
-    key_records = list(
-        TranslationKey.objects.filter(is_active=True).values_list("id", "key")
-    )
-    if not key_records:
-        return {}
-
-    key_by_id = {key_id: key for key_id, key in key_records}
-    translations: dict[str, str] = {}
-
-    current_rows = Translation.objects.filter(
-        language__code=language_code,
-        language__is_active=True,
-        key_id__in=key_by_id,
-        key__is_active=True,
-    ).values_list("key_id", "text")
-    for key_id, text in current_rows:
-        translations[key_by_id[key_id]] = text
-
-    if fallback_lang != language_code:
-        fallback_rows = Translation.objects.filter(
-            language__code=fallback_lang,
-            language__is_active=True,
-            key_id__in=key_by_id,
-            key__is_active=True,
-        ).values_list("key_id", "text")
-        for key_id, text in fallback_rows:
-            translations.setdefault(key_by_id[key_id], text)
-
-    for _, key in key_records:
-        translations.setdefault(key, key)
-
-    return translations
-
-
-def _site_text_dict(language_code: str, fallback_lang: str) -> dict[str, str]:
-    values: dict[str, str] = {}
-    for site_text in SiteText.objects.filter(is_published=True).order_by("group", "order", "key"):
-        values[site_text.key] = _localize_text(
-            site_text.text,
-            site_text.text_i18n,
-            language_code,
-            fallback_lang,
-        )
+def _requested_groups(request) -> tuple:
+    manifest = route_groups()["routes"]
+    groups = set()
+    for param in ("groups", "namespaces"):
+        raw = str(request.GET.get(param, ""))
+        groups.update(group.strip() for group in raw.split(",") if group.strip())
+    unknown = groups - set(translation_groups().values())
+    if unknown:
+        raise ValidationError({"groups": [f"Unknown group: {group}" for group in sorted(unknown)]})
+    route = str(request.GET.get("route", "")).strip()
+    groups.update(manifest.get(route, ()))
+    return tuple(sorted(groups))
 
-    if values:
-        return values
 
-    return _legacy_translation_dict(language_code, fallback_lang)
+def _requested_texts(request) -> bool:
+    return str(request.GET.get("texts", "1")).strip().lower() not in {"0", "false", "no"}
 
 
+@timed("texts")
+def _site_text_dict(language_code: str, fallback_lang: str, groups: tuple = ()) -> dict[str, str]:
+    return translation_bundle(language_code, fallback_lang, groups)
+
+
+@timed("settings")
 def _get_or_create_site_settings():
-    instance = SiteSettings.objects.order_by("-updated_at").first()
-    if instance is None:
-        instance = SiteSettings.objects.create(brand_name="Romanweiẞ", footer_title="Romanweiẞ")
-    return instance
+    return site_settings()
 
 
 def _get_home_page():
@@ -188,6 +165,7 @@ def _menu_item_key(menu_code: str, token: str) -> str:
     return f"nav.{slug_token}"
 
 
+@timed("nav")
 def _navigation_payload(lang_code: str, fallback_lang: str, menu_code: str | None = None):
     menus: dict[str, list[dict]] = {"main": [], "footer": [], "social": []}
 
@@ -220,6 +198,8 @@ def _navigation_payload(lang_code: str, fallback_lang: str, menu_code: str | Non
             .order_by("menu__order", "order", "id")
         )
 
+        fallback_items = list(fallback_items)
+        labels = snapshot_map(MenuItem, fallback_items, lang_code, fallback_lang)
         for item in fallback_items:
             fallback_href = item.href or ("/" if item.page and item.page.is_home else "")
             if item.page and not fallback_href:
@@ -232,7 +212,7 @@ def _navigation_payload(lang_code: str, fallback_lang: str, menu_code: str | Non
             )
             token = slugify(token_base) or f"item_{item.id}"
             menu = item.menu.code
-            label = _localize_text(item.label, item.label_i18n, lang_code, fallback_lang)
+            label = labels[item.id]["label"]
             kind = "anchor" if fallback_href.startswith("#") or fallback_href.startswith("/#") else "page"
             if fallback_href.startswith("http://") or fallback_href.startswith("https://") or fallback_href.startswith("mailto:"):
                 kind = "external"
@@ -260,6 +240,47 @@ def _navigation_payload(lang_code: str, fallback_lang: str, menu_code: str | Non
     return menus
 
 
+class StreamingListMixin:
+    def list(self, request, *args, **kwargs):
+        output_format = stream_format(request)
+        if output_format is None:
+            return super().list(request, *args, **kwargs)
+        return self.streaming_list(self.filter_queryset(self.get_queryset()), output_format)
+
+    def streaming_list(self, queryset, output_format, serializer_class=None):
+        serializer_class = serializer_class or self.get_serializer_class()
+        context = self.get_serializer_context()
+
+        def serialize(chunk):
+            return serializer_class(chunk, many=True, context={**context}).data
+
+        return streaming_response(iter_rows(queryset, serialize), output_format)
+
+
+class NestedCollectionMixin(StreamingListMixin):
+    def nested_collection(self, slug, model, parent_field, serializer_class):
+        lookup = self.queryset.values_list("id", flat=True)
+        parent_id = get_object_or_404(lookup, **{self.lookup_field: slug})
+        queryset = (
+            model.objects.filter(**{parent_field: parent_id, "is_published": True})
+            .select_related("media")
+            .order_by("order", "id")
+        )
+        output_format = stream_format(self.request)
+        if output_format is not None:
+            return self.streaming_list(queryset, output_format, serializer_class)
+
+        page = self.paginate_queryset(queryset)
+        serializer = serializer_class(
+            queryset if page is None else page,
+            many=True,
+            context=self.get_serializer_context(),
+        )
+        if page is None:
+            return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+
 class LocalizedSerializerContextMixin:
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -268,18 +289,204 @@ class LocalizedSerializerContextMixin:
         return context
 
 
+def _query_list(request, param: str) -> tuple[str, ...] | None:
+    if param not in request.query_params:
+        return None
+    raw = str(request.query_params.get(param, ""))
+    return tuple(dict.fromkeys(name.strip() for name in raw.split(",") if name.strip()))
+
+
+class SparseFieldsetMixin:
+    expand_prefetches: dict[str, tuple[str, ...]] = {}
+
+    def requested_fields(self) -> tuple[str, ...]:
+        return self.get_serializer_class().selected_fields(
+            _query_list(self.request, "fields"),
+            _query_list(self.request, "expand"),
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fields"] = _query_list(self.request, "fields")
+        context["expand"] = _query_list(self.request, "expand")
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        requested = self.requested_fields()
+        prefetches = [
+            lookup
+            for name, lookups in self.expand_prefetches.items()
+            if name in requested
+            for lookup in lookups
+        ]
+        if prefetches:
+            queryset = queryset.prefetch_related(*prefetches)
+        return queryset
+
+
+CACHEABLE_MEDIA_TYPES = ("application/json", "application/msgpack")
+
+
+def _anonymous_request(request) -> bool:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return False
+    return "HTTP_AUTHORIZATION" not in request.META
+
+
+def _response_cache_probe(request):
+    lang_code = _resolved_language_code(request)
+    version = content_version()
+    batch_item = getattr(request, "batch_item", False)
+    fingerprint = request_fingerprint(
+        "batch" if batch_item else "",
+        request.scheme,
+        request.get_host(),
+        request.path,
+        request.META.get("QUERY_STRING", ""),
+        lang_code,
+        request.META.get("HTTP_ACCEPT", ""),
+    )
+    probe = {
+        "lang_code": lang_code,
+        "fallback_lang": _default_language_code(),
+        "key": response_cache_key(version, fingerprint),
+        "etag": response_etag(version, fingerprint),
+        "last_modified": version // 1_000_000_000,
+        "cacheable": _anonymous_request(request),
+        "encodings": () if batch_item else available_encodings(),
+    }
+    if not probe["cacheable"]:
+        return probe, None
+    with timing_phase("cache"):
+        response = get_conditional_response(
+            request,
+            etag=probe["etag"],
+            last_modified=probe["last_modified"],
+        )
+        if response is None:
+            response = _cached_entry_response(response_cache().get(probe["key"]))
+    return probe, response
+
+
+def _cached_entry_response(cached) -> HttpResponse | None:
+    if cached is None:
+        return None
+    count_response_cache("hit")
+    response = HttpResponse(cached["content"], status=cached["status"])
+    for header, value in cached["headers"]:
+        response[header] = value
+    if cached["language_cookie"]:
+        _set_language_cookie(response, cached["language_cookie"])
+    response.precompressed = cached.get("encodings") or {}
+    response["X-Cache"] = "HIT"
+    return response
+
+
+def _store_response(probe: dict, response) -> None:
+    if not probe["cacheable"] or response.streaming:
+        response["X-Cache"] = "BYPASS"
+        return
+    count_response_cache("miss")
+    if hasattr(response, "render"):
+        with timing_phase("render"):
+            response.render()
+    media_type = response.get("Content-Type", "").split(";")[0].strip()
+    if (
+        settings.CONTENT_RESPONSE_CACHE_TIMEOUT
+        and response.status_code == status.HTTP_200_OK
+        and media_type in CACHEABLE_MEDIA_TYPES
+    ):
+        with timing_phase("compress"):
+            response.precompressed = precompress(
+                response.content, response.get("Content-Type", ""), probe["encodings"]
+            )
+        with timing_phase("cache"):
+            response_cache().set(
+                probe["key"],
+                {
+                    "status": response.status_code,
+                    "content": response.content,
+                    "encodings": response.precompressed,
+                    "headers": list(response.items()),
+                    "language_cookie": probe["lang_code"] if "lang" in response.cookies else None,
+                },
+                settings.CONTENT_RESPONSE_CACHE_TIMEOUT,
+            )
+    response["X-Cache"] = "MISS"
+
+
+def _finish_response(probe: dict, response):
+    if probe["cacheable"] and response.status_code in (
+        status.HTTP_200_OK,
+        status.HTTP_304_NOT_MODIFIED,
+    ):
+        response["ETag"] = probe["etag"]
+        response["Last-Modified"] = http_date(probe["last_modified"])
+    patch_vary_headers(response, ("Accept", "Cookie"))
+    return response
+
+
+class ResponseCacheMixin:
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return super().dispatch(request, *args, **kwargs)
+
+        probe, response = _response_cache_probe(request)
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+            _store_response(probe, response)
+        return _finish_response(probe, response)
+
+
 class I18nDictionaryView(APIView):
     def get(self, request):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
-        payload = _site_text_dict(lang_code, fallback_lang)
-        response = Response(payload)
+        groups = _requested_groups(request)
+        token = translation_token(lang_code, fallback_lang, groups)
+        since = str(request.query_params.get("since", "")).strip()
+        etag = quote_etag(f"{since}..{token}" if since else token)
+
+        if_none_match = request.headers.get("If-None-Match", "")
+        if if_none_match and (etag in parse_etags(if_none_match) or if_none_match.strip() == "*"):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        elif since:
+            if since == token:
+                delta = {"changed": {}, "removed": []}
+            else:
+                delta = translation_delta(lang_code, fallback_lang, since, groups)
+            if delta is None:
+                delta = {"changed": _site_text_dict(lang_code, fallback_lang, groups), "removed": []}
+                full = True
+            else:
+                full = False
+            response = Response(
+                {
+                    "version": token,
+                    "since": since,
+                    "full": full,
+                    "changed": delta["changed"],
+                    "removed": delta["removed"],
+                }
+            )
+        else:
+            response = Response(_site_text_dict(lang_code, fallback_lang, groups))
+
+        response["ETag"] = etag
+        response["X-I18n-Version"] = token
         response["Content-Language"] = lang_code
         if request.query_params.get("lang"):
             _set_language_cookie(response, lang_code)
         return response
 
 
+class I18nManifestView(ResponseCacheMixin, APIView):
+    def get(self, request):
+        return Response(route_groups())
+
+
 class SetLanguageView(APIView):
     def post(self, request):
         requested = str(request.data.get("lang", "")).strip().lower()
@@ -291,46 +498,55 @@ class SetLanguageView(APIView):
                 {"detail": "Unsupported language."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        response = Response({"lang": language.code})
-        _set_language_cookie(response, language.code)
+        response = Response({"lang": language["code"]})
+        _set_language_cookie(response, language["code"])
         return response
 
 
-class ContentView(APIView):
+def _content_pages(lang_code: str, fallback_lang: str) -> list[dict]:
+    pages = Page.objects.filter(is_active=True, is_published=True).order_by("order", "id")
+    return [
+        {
+            "slug": page.slug,
+            "title": _localized_text(page.title, page.title_i18n, lang_code, fallback_lang),
+            "is_home": page.is_home,
+            "order": page.order,
+        }
+        for page in pages
+    ]
+
+
+def _content_fetches(
+    lang_code: str, fallback_lang: str, groups: tuple = (), texts: bool = True
+) -> dict:
+    context = {"lang_code": lang_code, "fallback_lang": fallback_lang}
+    return {
+        "languages": lambda: list(_active_languages()),
+        "site": lambda: SiteSettingsSerializer(_get_or_create_site_settings(), context=context).data,
+        "texts": (lambda: _site_text_dict(lang_code, fallback_lang, groups)) if texts else dict,
+        "pages": lambda: _content_pages(lang_code, fallback_lang),
+    }
+
+
+def _content_document(lang_code: str, fallback_lang: str, parts: dict) -> dict:
+    return {
+        "lang": lang_code,
+        "default_lang": fallback_lang,
+        "languages": parts["languages"],
+        "site": parts["site"],
+        "texts": parts["texts"],
+        "pages": parts["pages"],
+    }
+
+
+class ContentView(ResponseCacheMixin, APIView):
     def get(self, request):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
-        site_settings = _get_or_create_site_settings()
-
-        pages = Page.objects.filter(is_active=True, is_published=True).order_by("order", "id")
-        page_payload = [
-            {
-                "slug": page.slug,
-                "title": _localize_text(page.title, page.title_i18n, lang_code, fallback_lang),
-                "is_home": page.is_home,
-                "order": page.order,
-            }
-            for page in pages
-        ]
-
-        payload = {
-            "lang": lang_code,
-            "default_lang": fallback_lang,
-            "languages": list(
-                _active_languages().values(
-                    "code",
-                    "name",
-                    "is_default",
-                    "order",
-                )
-            ),
-            "site": SiteSettingsSerializer(
-                site_settings,
-                context={"lang_code": lang_code, "fallback_lang": fallback_lang},
-            ).data,
-            "texts": _site_text_dict(lang_code, fallback_lang),
-            "pages": page_payload,
-        }
+        fetches = _content_fetches(
+            lang_code, fallback_lang, _requested_groups(request), _requested_texts(request)
+        )
+        payload = _content_document(lang_code, fallback_lang, run_fetches(fetches))
 
         response = Response(payload)
         response["Content-Language"] = lang_code
@@ -339,7 +555,7 @@ class ContentView(APIView):
         return response
 
 
-class NavigationView(APIView):
+class NavigationView(ResponseCacheMixin, APIView):
     def get(self, request):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
@@ -353,7 +569,7 @@ class NavigationView(APIView):
         return response
 
 
-class PageDetailView(APIView):
+class PageDetailView(ResponseCacheMixin, APIView):
     def get(self, request, slug):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
@@ -388,167 +604,186 @@ class PageDetailView(APIView):
         return response
 
 
-class SiteStructureView(APIView):
-    def get(self, request):
-        lang_code = _resolved_language_code(request)
-        fallback_lang = _default_language_code()
-        site_settings = _get_or_create_site_settings()
-        page = _get_home_page()
-        if page is None:
-            return Response(
-                {"detail": "No active pages are available."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+def _home_page_data(lang_code: str, fallback_lang: str) -> dict | None:
+    page = _get_home_page()
+    if page is None:
+        return None
+    return PageSerializer(
+        page,
+        context={"lang_code": lang_code, "fallback_lang": fallback_lang},
+    ).data
 
-        page_data = PageSerializer(
-            page,
-            context={"lang_code": lang_code, "fallback_lang": fallback_lang},
-        ).data
-
-        section_payload = []
-        for section in page_data.get("sections", []):
-            token = section["key"].replace("-", "_")
-            payload = section.get("payload") if isinstance(section.get("payload"), dict) else {}
-            payload_keys = {}
-            for field, value in payload.items():
-                if isinstance(value, str):
-                    payload_keys[field] = f"section.{token}.{field}"
-
-            section_payload.append(
-                {
-                    "id": section["id"],
-                    "key": section["key"],
-                    "anchor": section.get("anchor") or section["key"],
-                    "section_type": section["section_type"],
-                    "title": section.get("title", ""),
-                    "title_key": f"section.{token}.title",
-                    "subtitle": section.get("subtitle", ""),
-                    "subtitle_key": f"section.{token}.subtitle",
-                    "body": section.get("body", ""),
-                    "body_key": f"section.{token}.body",
-                    "payload": payload,
-                    "payload_keys": payload_keys,
-                    "images": section.get("images", []),
-                }
-            )
 
-        response = Response(
+def _structure_site(lang_code: str, fallback_lang: str) -> dict:
+    current = _get_or_create_site_settings()
+    site_fields = current.localized(lang_code, fallback_lang)
+    return {
+        "brand_name": site_fields["brand_name"],
+        "brand_key": "brand.name",
+        "footer_title": site_fields["footer_title"],
+        "footer_title_key": "footer.title",
+        "footer_description": site_fields["footer_description"],
+        "footer_description_key": "footer.description",
+        "footer_explore_title": site_fields["footer_explore_title"],
+        "footer_explore_title_key": "footer.explore",
+        "footer_social_title": site_fields["footer_social_title"],
+        "footer_social_title_key": "footer.social",
+        "footer_newsletter_title": site_fields["footer_newsletter_title"],
+        "footer_newsletter_title_key": "footer.newsletter",
+        "newsletter_note": site_fields["newsletter_note"],
+        "newsletter_note_key": "footer.newsletter_note",
+        "contact_email": current.contact_email,
+    }
+
+
+def _structure_sections(page_data: dict) -> list[dict]:
+    section_payload = []
+    for section in page_data.get("sections", []):
+        token = section["key"].replace("-", "_")
+        payload = section.get("payload") if isinstance(section.get("payload"), Mapping) else {}
+        payload_keys = {}
+        for field, value in payload.items():
+            if isinstance(value, str):
+                payload_keys[field] = f"section.{token}.{field}"
+
+        section_payload.append(
             {
-                "lang": lang_code,
-                "languages": list(
-                    _active_languages().values(
-                        "code",
-                        "name",
-                        "is_default",
-                        "order",
-                    )
-                ),
-                "site": {
-                    "brand_name": _localize_text(
-                        site_settings.brand_name,
-                        site_settings.brand_name_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "brand_key": "brand.name",
-                    "footer_title": _localize_text(
-                        site_settings.footer_title,
-                        site_settings.footer_title_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "footer_title_key": "footer.title",
-                    "footer_description": _localize_text(
-                        site_settings.footer_description,
-                        site_settings.footer_description_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "footer_description_key": "footer.description",
-                    "footer_explore_title": _localize_text(
-                        site_settings.footer_explore_title,
-                        site_settings.footer_explore_title_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "footer_explore_title_key": "footer.explore",
-                    "footer_social_title": _localize_text(
-                        site_settings.footer_social_title,
-                        site_settings.footer_social_title_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "footer_social_title_key": "footer.social",
-                    "footer_newsletter_title": _localize_text(
-                        site_settings.footer_newsletter_title,
-                        site_settings.footer_newsletter_title_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "footer_newsletter_title_key": "footer.newsletter",
-                    "newsletter_note": _localize_text(
-                        site_settings.newsletter_note,
-                        site_settings.newsletter_note_i18n,
-                        lang_code,
-                        fallback_lang,
-                    ),
-                    "newsletter_note_key": "footer.newsletter_note",
-                    "contact_email": site_settings.contact_email,
-                },
-                "pages": list(
-                    Page.objects.filter(is_active=True)
-                    .order_by("order", "id")
-                    .values("slug", "is_active", "order")
-                ),
-                "menus": _navigation_payload(lang_code, fallback_lang),
-                "sections": section_payload,
+                "id": section["id"],
+                "key": section["key"],
+                "anchor": section.get("anchor") or section["key"],
+                "section_type": section["section_type"],
+                "title": section.get("title", ""),
+                "title_key": f"section.{token}.title",
+                "subtitle": section.get("subtitle", ""),
+                "subtitle_key": f"section.{token}.subtitle",
+                "body": section.get("body", ""),
+                "body_key": f"section.{token}.body",
+                "payload": payload,
+                "payload_keys": payload_keys,
+                "images": section.get("images", []),
             }
         )
+    return section_payload
+
+
+def _site_structure_fetches(lang_code: str, fallback_lang: str) -> dict:
+    return {
+        "page": lambda: _home_page_data(lang_code, fallback_lang),
+        "site": lambda: _structure_site(lang_code, fallback_lang),
+        "languages": lambda: list(_active_languages()),
+        "pages": lambda: list(
+            Page.objects.filter(is_active=True)
+            .order_by("order", "id")
+            .values("slug", "is_active", "order")
+        ),
+        "menus": lambda: _navigation_payload(lang_code, fallback_lang),
+    }
+
+
+def _site_structure_from_parts(lang_code: str, fallback_lang: str, parts: dict) -> dict | None:
+    if parts["page"] is None:
+        return None
+    return {
+        "lang": lang_code,
+        "languages": parts["languages"],
+        "site": parts["site"],
+        "pages": parts["pages"],
+        "menus": parts["menus"],
+        "sections": _structure_sections(parts["page"]),
+    }
+
+
+def _site_bootstrap_fetches(lang_code: str, fallback_lang: str) -> dict:
+    context = {"lang_code": lang_code, "fallback_lang": fallback_lang}
+    menus = (
+        Menu.objects.filter(is_published=True)
+        .prefetch_related("items__page")
+        .order_by("order", "id")
+    )
+    return {
+        "page": lambda: _home_page_data(lang_code, fallback_lang),
+        "site": lambda: SiteSettingsSerializer(_get_or_create_site_settings(), context=context).data,
+        "menus": lambda: MenuSerializer(menus, many=True, context=context).data,
+    }
+
+
+def _site_bootstrap_from_parts(lang_code: str, fallback_lang: str, parts: dict) -> dict | None:
+    if parts["page"] is None:
+        return None
+    return {
+        "lang": lang_code,
+        "site": parts["site"],
+        "page": parts["page"],
+        "menus": parts["menus"],
+    }
+
+
+DOCUMENT_PARTS = {
+    "site-structure": (_site_structure_fetches, _site_structure_from_parts),
+    "site-bootstrap": (_site_bootstrap_fetches, _site_bootstrap_from_parts),
+}
+
+
+def _site_structure_document(lang_code: str, fallback_lang: str) -> dict | None:
+    parts = run_fetches(_site_structure_fetches(lang_code, fallback_lang))
+    return _site_structure_from_parts(lang_code, fallback_lang, parts)
+
+
+def _site_bootstrap_document(lang_code: str, fallback_lang: str) -> dict | None:
+    parts = run_fetches(_site_bootstrap_fetches(lang_code, fallback_lang))
+    return _site_bootstrap_from_parts(lang_code, fallback_lang, parts)
+
+
+DOCUMENT_BUILDERS = {
+    "site-structure": _site_structure_document,
+    "site-bootstrap": _site_bootstrap_document,
+}
+
+
+def _document_headers(response, request, document, lang_code: str, language_headers: bool) -> None:
+    if document is not None:
+        response["X-Document-Version"] = str(document.content_version)
+        response["X-Document-Built-At"] = http_date(document.updated_at.timestamp())
+    if language_headers:
         response["Content-Language"] = lang_code
-        if request.query_params.get("lang"):
+        if request.GET.get("lang"):
             _set_language_cookie(response, lang_code)
-        return response
 
 
-class SiteBootstrapView(APIView):
+class StoredDocumentView(ResponseCacheMixin, APIView):
+    document_kind = None
+    language_headers = False
+
     def get(self, request):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
-        site_settings = _get_or_create_site_settings()
-        page = _get_home_page()
-        if page is None:
+        payload, document = load_document(
+            self.document_kind,
+            DOCUMENT_BUILDERS[self.document_kind],
+            lang_code,
+            fallback_lang,
+        )
+        if payload is None:
             return Response(
                 {"detail": "No active pages are available."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        menus = (
-            Menu.objects.filter(is_published=True)
-            .prefetch_related("items__page")
-            .order_by("order", "id")
-        )
+        response = Response(payload)
+        _document_headers(response, request, document, lang_code, self.language_headers)
+        return response
+
+
+class SiteStructureView(StoredDocumentView):
+    document_kind = "site-structure"
+    language_headers = True
 
-        return Response(
-            {
-                "lang": lang_code,
-                "site": SiteSettingsSerializer(
-                    site_settings,
-                    context={"lang_code": lang_code, "fallback_lang": fallback_lang},
-                ).data,
-                "page": PageSerializer(
-                    page,
-                    context={"lang_code": lang_code, "fallback_lang": fallback_lang},
-                ).data,
-                "menus": MenuSerializer(
-                    menus,
-                    many=True,
-                    context={"lang_code": lang_code, "fallback_lang": fallback_lang},
-                ).data,
-            }
-        )
 
+class SiteBootstrapView(StoredDocumentView):
+    document_kind = "site-bootstrap"
 
-class SiteSettingsDetailView(APIView):
+
+class SiteSettingsDetailView(ResponseCacheMixin, APIView):
     def get(self, request):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
@@ -561,7 +796,7 @@ class SiteSettingsDetailView(APIView):
         )
 
 
-class MenuDetailView(APIView):
+class MenuDetailView(ResponseCacheMixin, APIView):
     def get(self, request, code):
         lang_code = _resolved_language_code(request)
         fallback_lang = _default_language_code()
@@ -583,17 +818,138 @@ class MenuDetailView(APIView):
         )
 
 
-class PageViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet):
+BATCH_TARGETS = {
+    "content": ("content", None),
+    "navigation": ("navigation", None),
+    "page": ("page-detail", "slug"),
+    "site": ("v1-site", None),
+    "bootstrap": ("v1-bootstrap", None),
+    "structure": ("site-structure", None),
+    "menu": ("v1-menu-detail", "code"),
+    "expeditions": ("expeditions-list", None),
+    "expedition": ("expeditions-detail", "slug"),
+    "categories": ("categories-list", None),
+    "category": ("categories-detail", "slug"),
+    "stories": ("stories-list", None),
+    "story": ("stories-detail", "slug"),
+}
+
+BATCH_BUNDLES = {
+    "home": ("content", "navigation", "page:home", "expeditions", "categories", "stories"),
+}
+
+BATCH_MAX_REQUESTS = 20
+
+
+def _batch_requests(request) -> list[str]:
+    names = []
+    bundle = str(request.query_params.get("bundle", "")).strip()
+    if bundle:
+        if bundle not in BATCH_BUNDLES:
+            raise ValueError(f"Unknown batch bundle: {bundle}.")
+        names.extend(BATCH_BUNDLES[bundle])
+    raw = str(request.query_params.get("requests", ""))
+    names.extend(name.strip() for name in raw.split(",") if name.strip())
+    return list(dict.fromkeys(names))
+
+
+def _batch_path(name: str) -> str:
+    target, _, argument = name.partition(":")
+    if target not in BATCH_TARGETS:
+        raise ValueError(f"Unknown batch request: {name}.")
+    url_name, kwarg = BATCH_TARGETS[target]
+    if bool(kwarg) != bool(argument):
+        raise ValueError(f"Invalid batch request: {name}.")
+    try:
+        return reverse(url_name, kwargs={kwarg: argument} if kwarg else None)
+    except NoReverseMatch:
+        raise ValueError(f"Invalid batch request: {name}.") from None
+
+
+def _batch_subrequest(request, path: str, lang_code: str) -> HttpRequest:
+    query = QueryDict(mutable=True)
+    query["lang"] = lang_code
+    sub_request = HttpRequest()
+    sub_request.method = "GET"
+    sub_request.path = sub_request.path_info = path
+    sub_request.GET = query
+    sub_request.COOKIES = request.COOKIES
+    sub_request.batch_item = True
+    sub_request.META = {
+        key: value
+        for key, value in request.META.items()
+        if key not in ("HTTP_IF_NONE_MATCH", "HTTP_IF_MODIFIED_SINCE")
+    }
+    sub_request.META.update(
+        {
+            "REQUEST_METHOD": "GET",
+            "PATH_INFO": path,
+            "QUERY_STRING": query.urlencode(),
+            "HTTP_ACCEPT": "application/json",
+        }
+    )
+    return sub_request
+
+
+def _batch_response(request, path: str, lang_code: str) -> dict:
+    match = resolve(path)
+    response = match.func(_batch_subrequest(request, path, lang_code), *match.args, **match.kwargs)
+    if hasattr(response, "render"):
+        response.render()
+    return {
+        "status": response.status_code,
+        "body": orjson.loads(response.content) if response.content else None,
+    }
+
+
+class BatchView(ResponseCacheMixin, APIView):
+    def get(self, request):
+        try:
+            names = _batch_requests(request)
+            paths = {name: _batch_path(name) for name in names}
+        except ValueError as error:
+            return Response({"detail": str(error)}, status=status.HTTP_400_BAD_REQUEST)
+        if not names:
+            return Response(
+                {"detail": "Pass a bundle or a list of requests."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(names) > BATCH_MAX_REQUESTS:
+            return Response(
+                {"detail": f"A batch may contain at most {BATCH_MAX_REQUESTS} requests."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        lang_code = _resolved_language_code(request)
+        response = Response(
+            {
+                "lang": lang_code,
+                "responses": {
+                    name: _batch_response(request, path, lang_code) for name, path in paths.items()
+                },
+            }
+        )
+        response["Content-Language"] = lang_code
+        if request.query_params.get("lang"):
+            _set_language_cookie(response, lang_code)
+        return response
+
+
+class PageViewSet(
+    ResponseCacheMixin,
+    SparseFieldsetMixin,
+    StreamingListMixin,
+    LocalizedSerializerContextMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = PageSerializer
+    queryset = Page.objects.filter(is_active=True, is_published=True).order_by("order", "id")
+    expand_prefetches = {"sections": ("sections__images",)}
     lookup_field = "slug"
     pagination_class = None
 
     def get_queryset(self):
-        queryset = (
-            Page.objects.filter(is_active=True, is_published=True)
-            .prefetch_related("sections__images")
-            .order_by("order", "id")
-        )
+        queryset = super().get_queryset()
         is_home = self.request.query_params.get("is_home")
         if is_home is not None:
             is_home_value = is_home.lower() in {"1", "true", "yes"}
@@ -601,44 +957,79 @@ class PageViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet
         return queryset
 
 
-class SiteSettingsViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet):
+class SiteSettingsViewSet(
+    ResponseCacheMixin, LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet
+):
     serializer_class = SiteSettingsSerializer
-    queryset = SiteSettings.objects.order_by("-updated_at")
+    queryset = SiteSettings.objects.all()
     pagination_class = None
 
     def list(self, request, *args, **kwargs):
-        instance = self.get_queryset().first()
-        if instance is None:
-            instance = SiteSettings.objects.create(brand_name="Romanweiẞ", footer_title="Romanweiẞ")
-        serializer = self.get_serializer(instance)
+        serializer = self.get_serializer(_get_or_create_site_settings())
         return Response(serializer.data)
 
 
-class CategoryViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet):
+class CategoryViewSet(
+    ResponseCacheMixin,
+    SparseFieldsetMixin,
+    NestedCollectionMixin,
+    LocalizedSerializerContextMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = CategorySerializer
     queryset = (
         Category.objects.filter(is_published=True)
         .select_related("cover")
-        .prefetch_related("gallery_items__media")
         .order_by("order", "id")
     )
+    expand_prefetches = {"gallery_items": ("gallery_items__media",)}
     lookup_field = "slug"
-    pagination_class = None
+    pagination_class = KeysetPagination
+
+    @action(detail=True, url_path="gallery")
+    def gallery(self, request, slug=None):
+        return self.nested_collection(
+            slug,
+            CategoryGalleryItem,
+            "category_id",
+            CategoryGalleryItemSerializer,
+        )
 
 
-class ExpeditionViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet):
+class ExpeditionViewSet(
+    ResponseCacheMixin,
+    SparseFieldsetMixin,
+    NestedCollectionMixin,
+    LocalizedSerializerContextMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = ExpeditionSerializer
     queryset = (
         Expedition.objects.filter(is_published=True)
         .select_related("cover")
-        .prefetch_related("media_items__media")
         .order_by("order", "id")
     )
+    expand_prefetches = {"media_items": ("media_items__media",)}
     lookup_field = "slug"
-    pagination_class = None
+    pagination_class = KeysetPagination
+
+    @action(detail=True, url_path="media")
+    def media(self, request, slug=None):
+        return self.nested_collection(
+            slug,
+            ExpeditionMedia,
+            "expedition_id",
+            ExpeditionMediaSerializer,
+        )
 
 
-class StoryViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet):
+class StoryViewSet(
+    ResponseCacheMixin,
+    SparseFieldsetMixin,
+    StreamingListMixin,
+    LocalizedSerializerContextMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = StorySerializer
     queryset = (
         Story.objects.filter(is_published=True)
@@ -646,12 +1037,18 @@ class StoryViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSe
         .order_by("order", "id")
     )
     lookup_field = "slug"
-    pagination_class = None
+    pagination_class = KeysetPagination
 
 
-class NavigationItemViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyModelViewSet):
+class NavigationItemViewSet(
+    ResponseCacheMixin,
+    StreamingListMixin,
+    LocalizedSerializerContextMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     serializer_class = NavigationItemSerializer
-    pagination_class = None
+    pagination_class = KeysetPagination
+    keyset_ordering = ("menu", "order", "id")
 
     def get_queryset(self):
         queryset = (
@@ -668,7 +1065,7 @@ class NavigationItemViewSet(LocalizedSerializerContextMixin, viewsets.ReadOnlyMo
         return queryset
 
 
-class SocialLinkViewSet(viewsets.ReadOnlyModelViewSet):
+class SocialLinkViewSet(ResponseCacheMixin, viewsets.ReadOnlyModelViewSet):
     serializer_class = SocialLinkSerializer
     queryset = SocialLink.objects.filter(is_published=True).order_by("order", "id")
     pagination_class = None
@@ -1,6 +1,8 @@
 from django.urls import path
 
 from .web_views import (
+    AsyncContentPageView,
+    AsyncHomePageView,
     CategoryDetailView,
     ContactSubmitView,
     ContentPageView,
@@ -21,5 +23,7 @@ urlpatterns = [
         ExpeditionDetailView.as_view(),
         name="expedition-detail",
     ),
+    path("~async/", AsyncHomePageView.as_view(), name="async-home"),
+    path("~async/<slug:slug>/", AsyncContentPageView.as_view(), name="async-page"),
     path("<slug:slug>/", ContentPageView.as_view(), name="page"),
 ]
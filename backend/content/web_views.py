@@ -1,5 +1,6 @@
-from copy import deepcopy
+from collections.abc import Mapping
 
+from asgiref.sync import sync_to_async
 from django import forms
 from django.conf import settings
 from django.contrib import messages
@@ -13,60 +14,38 @@ from django.views.generic import TemplateView, View
 
 from api.models import ContactMessage
 
+from .fetches import gather_fetches, run_fetches
+from .i18n import language_registry, site_text_table
+from .localization import LayeredMapping, _payload_layers
 from .models import (
     Category,
     CategoryGalleryItem,
     Expedition,
     ExpeditionMedia,
     HeroSection,
-    Language,
     NavigationItem,
     Page,
-    SiteSettings,
-    SiteText,
+    PageSection,
     Story,
 )
+from .site_settings import CachedSiteSettings, site_settings
+from .snapshots import snapshot_map
+from .timing import timed, timing_phase
 
 
 def _default_language_code() -> str:
     return (settings.LANGUAGE_CODE or "en").split("-")[0].lower()
 
 
+@timed("lang")
 def _active_language_code() -> str:
     code = translation.get_language() or _default_language_code()
     return str(code).split("-")[0].lower()
 
 
-def _localize_text(default_value: str, translations: dict, lang_code: str, fallback_lang: str) -> str:
-    if isinstance(translations, dict):
-        translated = translations.get(lang_code)
-        if isinstance(translated, str) and translated.strip():
-            return translated
-
-    if isinstance(default_value, str) and default_value.strip():
-        return default_value
-
-    if isinstance(translations, dict):
-        fallback_value = translations.get(fallback_lang)
-        if isinstance(fallback_value, str) and fallback_value.strip():
-            return fallback_value
-    return default_value if isinstance(default_value, str) else ""
-
-
-def _localize_dict(default_payload: dict, translations: dict, lang_code: str, fallback_lang: str) -> dict:
-    base = deepcopy(default_payload) if isinstance(default_payload, dict) else {}
-    if not isinstance(translations, dict):
-        return base
-
-    fallback_payload = translations.get(fallback_lang)
-    if isinstance(fallback_payload, dict):
-        base.update(fallback_payload)
-
-    if lang_code != fallback_lang:
-        translated_payload = translations.get(lang_code)
-        if isinstance(translated_payload, dict):
-            base.update(translated_payload)
-    return base
+def _localize_dict(default_payload: dict, translations: dict, lang_code: str, fallback_lang: str) -> Mapping:
+    translated, fallback = _payload_layers(translations, lang_code, fallback_lang)
+    return LayeredMapping(translated, fallback, default_payload)
 
 
 def _is_external(value: str) -> bool:
@@ -74,17 +53,9 @@ def _is_external(value: str) -> bool:
     return lowered.startswith("http://") or lowered.startswith("https://") or lowered.startswith("mailto:")
 
 
+@timed("texts")
 def _site_text_map(lang_code: str, fallback_lang: str) -> dict[str, str]:
-    values: dict[str, str] = {}
-    queryset = SiteText.objects.filter(is_published=True).order_by("group", "order", "key")
-    for site_text in queryset:
-        values[site_text.key] = _localize_text(
-            site_text.text,
-            site_text.text_i18n,
-            lang_code,
-            fallback_lang,
-        )
-    return values
+    return site_text_table(lang_code, fallback_lang)
 
 
 def _text(texts: dict[str, str], key: str, default: str = "") -> str:
@@ -102,51 +73,19 @@ def _resolve_media_url(asset, fallback_static_path: str, legacy_url: str = "") -
     return static(fallback_static_path)
 
 
-def _site_settings_payload(site_settings: SiteSettings, lang_code: str, fallback_lang: str) -> dict:
+def _site_settings_payload(
+    settings_obj: CachedSiteSettings, lang_code: str, fallback_lang: str
+) -> dict:
+    fields = settings_obj.localized(lang_code, fallback_lang)
     return {
-        "brand_name": _localize_text(
-            site_settings.brand_name,
-            site_settings.brand_name_i18n,
-            lang_code,
-            fallback_lang,
-        ),
-        "contact_email": site_settings.contact_email,
-        "footer_title": _localize_text(
-            site_settings.footer_title,
-            site_settings.footer_title_i18n,
-            lang_code,
-            fallback_lang,
-        ),
-        "footer_description": _localize_text(
-            site_settings.footer_description,
-            site_settings.footer_description_i18n,
-            lang_code,
-            fallback_lang,
-        ),
-        "footer_explore_title": _localize_text(
-            site_settings.footer_explore_title,
-            site_settings.footer_explore_title_i18n,
-            lang_code,
-            fallback_lang,
-        ),
-        "footer_social_title": _localize_text(
-            site_settings.footer_social_title,
-            site_settings.footer_social_title_i18n,
-            lang_code,
-            fallback_lang,
-        ),
-        "footer_newsletter_title": _localize_text(
-            site_settings.footer_newsletter_title,
-            site_settings.footer_newsletter_title_i18n,
-            lang_code,
-            fallback_lang,
-        ),
-        "newsletter_note": _localize_text(
-            site_settings.newsletter_note,
-            site_settings.newsletter_note_i18n,
-            lang_code,
-            fallback_lang,
-        ),
+        "brand_name": fields["brand_name"],
+        "contact_email": settings_obj.contact_email,
+        "footer_title": fields["footer_title"],
+        "footer_description": fields["footer_description"],
+        "footer_explore_title": fields["footer_explore_title"],
+        "footer_social_title": fields["footer_social_title"],
+        "footer_newsletter_title": fields["footer_newsletter_title"],
+        "newsletter_note": fields["newsletter_note"],
     }
 
 
@@ -185,19 +124,21 @@ def _navigation_href(item) -> str:
     return href or "#"
 
 
+@timed("nav")
 def _navigation_payload(
     lang_code: str,
     fallback_lang: str,
     texts: dict[str, str],
 ) -> dict[str, list[dict]]:
     payload: dict[str, list[dict]] = {"main": [], "footer": [], "social": []}
-    queryset = (
+    items = list(
         NavigationItem.objects.filter(is_published=True)
         .select_related("page")
         .order_by("menu", "order", "id")
     )
-    for item in queryset:
-        label_default = _localize_text(item.title, item.title_i18n, lang_code, fallback_lang)
+    localized = snapshot_map(NavigationItem, items, lang_code, fallback_lang)
+    for item in items:
+        label_default = localized[item.id]["title"]
         label = _text(texts, _navigation_label_key(item), label_default)
         payload.setdefault(item.menu, []).append(
             {
@@ -213,14 +154,18 @@ def _navigation_payload(
 
 def _localized_sections(page: Page, lang_code: str, fallback_lang: str) -> dict[str, dict]:
     sections: dict[str, dict] = {}
-    for section in page.sections.filter(is_published=True).prefetch_related("images").order_by("order", "id"):
+    queryset = page.sections.filter(is_published=True).prefetch_related("images").order_by("order", "id")
+    page_sections = list(queryset)
+    localized = snapshot_map(PageSection, page_sections, lang_code, fallback_lang)
+    for section in page_sections:
         payload = _localize_dict(section.payload, section.payload_i18n, lang_code, fallback_lang)
+        fields = localized[section.id]
         sections[section.key] = {
             "id": section.id,
             "key": section.key,
-            "title": _localize_text(section.title, section.title_i18n, lang_code, fallback_lang),
-            "subtitle": _localize_text(section.subtitle, section.subtitle_i18n, lang_code, fallback_lang),
-            "body": _localize_text(section.body, section.body_i18n, lang_code, fallback_lang),
+            "title": fields["title"],
+            "subtitle": fields["subtitle"],
+            "body": fields["body"],
             "payload": payload,
             "anchor": payload.get("anchor") or ("journey" if section.key == "hero" else section.key),
             "images": [image for image in section.images.all() if image.is_published],
@@ -285,8 +230,8 @@ def _language_switches(
     texts: dict[str, str],
 ) -> list[dict]:
     default_code = _default_language_code()
-    queryset = Language.objects.filter(is_active=True).order_by("order", "id")
-    if not queryset.exists():
+    languages = language_registry().languages
+    if not languages:
         fallback = []
         for index, (code, label) in enumerate(getattr(settings, "LANGUAGES", (("en", "English"),)), start=1):
             normalized = str(code).split("-")[0].lower()
@@ -307,19 +252,20 @@ def _language_switches(
         return fallback
 
     switches = []
-    for language in queryset:
-        with translation.override(language.code):
+    for language in languages:
+        code = language["code"]
+        with translation.override(code):
             try:
                 url = reverse(route_name, kwargs=route_kwargs)
             except Exception:
                 url = reverse("content:home")
         switches.append(
             {
-                "code": language.code,
-                "label": _text(texts, f"lang.{language.code}", language.name),
+                "code": code,
+                "label": _text(texts, f"lang.{code}", language["name"]),
                 "url": url,
-                "is_active": language.code == lang_code,
-                "order": language.order,
+                "is_active": code == lang_code,
+                "order": language["order"],
             }
         )
     return switches
@@ -364,6 +310,80 @@ def _category_payload(category: Category, texts: dict[str, str]) -> dict:
     }
 
 
+def _story_payloads(texts: dict[str, str], lang_code: str, fallback_lang: str) -> list[dict]:
+    stories = []
+    story_items = list(
+        Story.objects.filter(is_published=True).select_related("cover").order_by("order", "id")
+    )
+    localized_stories = snapshot_map(Story, story_items, lang_code, fallback_lang)
+    for story in story_items:
+        key_prefix = f"story.{story.slug}"
+        fields = localized_stories[story.id]
+        stories.append(
+            {
+                "title": _text(texts, f"{key_prefix}.title", fields["title"]),
+                "date_label": _text(texts, f"{key_prefix}.date_label", fields["date_label"]),
+                "description": _text(texts, f"{key_prefix}.description", fields["description"]),
+                "slug": story.slug,
+                "cover_url": _resolve_media_url(
+                    story.cover,
+                    "content/images/story-default.svg",
+                    story.image_url,
+                ),
+            }
+        )
+    return stories
+
+
+def _page_fetches(page: Page, lang_code: str, fallback_lang: str, texts: dict[str, str]) -> dict:
+    return {
+        "sections": lambda: _localized_sections(page, lang_code, fallback_lang),
+        "expeditions": lambda: [
+            _expedition_payload(expedition, texts, lang_code, fallback_lang)
+            for expedition in Expedition.objects.filter(is_published=True).select_related("cover").order_by("order", "id")
+        ],
+        "categories": lambda: [
+            _category_payload(category, texts)
+            for category in Category.objects.filter(is_published=True).select_related("cover").order_by("order", "id")
+        ],
+        "stories": lambda: _story_payloads(texts, lang_code, fallback_lang),
+    }
+
+
+def _empty_page_context(context: dict) -> dict:
+    return {
+        "page_obj": None,
+        "hero": {},
+        "journal_intro_section": {},
+        "expeditions_section": {},
+        "categories_section": {},
+        "stories_section": {},
+        "contact_section": {},
+        "expeditions": [],
+        "categories": [],
+        "stories": [],
+        "page_title": context["site"].get("brand_name", ""),
+    }
+
+
+def _page_context(page: Page, context: dict, parts: dict) -> dict:
+    sections = parts["sections"]
+    hero = _hero_payload(page, sections, context["_texts"], context["site"].get("brand_name", ""))
+    return {
+        "page_obj": page,
+        "hero": hero,
+        "journal_intro_section": sections.get("journal-intro", {}),
+        "expeditions_section": sections.get("expeditions", {}),
+        "categories_section": sections.get("categories", {}),
+        "stories_section": sections.get("stories", {}),
+        "contact_section": sections.get("contact", {}),
+        "expeditions": parts["expeditions"],
+        "categories": parts["categories"],
+        "stories": parts["stories"],
+        "page_title": context["site"].get("brand_name", ""),
+    }
+
+
 class ContactMessageForm(forms.ModelForm):
     class Meta:
         model = ContactMessage
@@ -376,12 +396,10 @@ class SiteContextMixin:
         lang_code = _active_language_code()
         fallback_lang = _default_language_code()
 
-        site_settings = SiteSettings.objects.order_by("-updated_at").first()
-        if site_settings is None:
-            site_settings = SiteSettings.objects.create(brand_name="Romanweiẞ", footer_title="Romanweiẞ")
+        with timing_phase("settings"):
+            site_payload = _site_settings_payload(site_settings(), lang_code, fallback_lang)
 
         texts = _site_text_map(lang_code, fallback_lang)
-        site_payload = _site_settings_payload(site_settings, lang_code, fallback_lang)
         nav_payload = _navigation_payload(lang_code, fallback_lang, texts)
         language_switches = _language_switches(route_name, route_kwargs, lang_code, texts)
 
@@ -460,89 +478,33 @@ class BaseContentPageView(SiteContextMixin, TemplateView):
     def _route_kwargs(self, page: Page | None) -> dict:
         return {}
 
-    def get_context_data(self, **kwargs):
+    def get_base_context(self, **kwargs):
         context = super().get_context_data(**kwargs)
-
         page = self._resolve_page()
-        base = self._site_context(self.route_name, self._route_kwargs(page))
-        context.update(base)
+        context.update(self._site_context(self.route_name, self._route_kwargs(page)))
+        return page, context
+
+    def page_fetches(self, page: Page, context: dict) -> dict:
+        return _page_fetches(page, context["_lang_code"], context["_fallback_lang"], context["_texts"])
 
+    def get_context_data(self, **kwargs):
+        page, context = self.get_base_context(**kwargs)
         if page is None:
-            context.update(
-                {
-                    "page_obj": None,
-                    "hero": {},
-                    "journal_intro_section": {},
-                    "expeditions_section": {},
-                    "categories_section": {},
-                    "stories_section": {},
-                    "contact_section": {},
-                    "expeditions": [],
-                    "categories": [],
-                    "stories": [],
-                    "page_title": context["site"].get("brand_name", ""),
-                }
-            )
+            context.update(_empty_page_context(context))
             return context
+        context.update(_page_context(page, context, run_fetches(self.page_fetches(page, context))))
+        return context
 
-        lang_code = context["_lang_code"]
-        fallback_lang = context["_fallback_lang"]
-        texts = context["_texts"]
-        sections = _localized_sections(page, lang_code, fallback_lang)
-
-        expeditions = [
-            _expedition_payload(expedition, texts, lang_code, fallback_lang)
-            for expedition in Expedition.objects.filter(is_published=True).select_related("cover").order_by("order", "id")
-        ]
-
-        categories = [
-            _category_payload(category, texts)
-            for category in Category.objects.filter(is_published=True).select_related("cover").order_by("order", "id")
-        ]
-
-        stories = []
-        for story in Story.objects.filter(is_published=True).select_related("cover").order_by("order", "id"):
-            key_prefix = f"story.{story.slug}"
-            default_title = _localize_text(story.title, story.title_i18n, lang_code, fallback_lang)
-            default_date = _localize_text(story.date_label, story.date_label_i18n, lang_code, fallback_lang)
-            default_description = _localize_text(
-                story.description,
-                story.description_i18n,
-                lang_code,
-                fallback_lang,
-            )
-            stories.append(
-                {
-                    "title": _text(texts, f"{key_prefix}.title", default_title),
-                    "date_label": _text(texts, f"{key_prefix}.date_label", default_date),
-                    "description": _text(texts, f"{key_prefix}.description", default_description),
-                    "slug": story.slug,
-                    "cover_url": _resolve_media_url(
-                        story.cover,
-                        "content/images/story-default.svg",
-                        story.image_url,
-                    ),
-                }
-            )
-
-        hero = _hero_payload(page, sections, texts, context["site"].get("brand_name", ""))
 
-        context.update(
-            {
-                "page_obj": page,
-                "hero": hero,
-                "journal_intro_section": sections.get("journal-intro", {}),
-                "expeditions_section": sections.get("expeditions", {}),
-                "categories_section": sections.get("categories", {}),
-                "stories_section": sections.get("stories", {}),
-                "contact_section": sections.get("contact", {}),
-                "expeditions": expeditions,
-                "categories": categories,
-                "stories": stories,
-                "page_title": context["site"].get("brand_name", ""),
-            }
-        )
-        return context
+class AsyncContentPageMixin:
+    async def get(self, request, *args, **kwargs):
+        page, context = await sync_to_async(self.get_base_context)(**kwargs)
+        if page is None:
+            context.update(_empty_page_context(context))
+        else:
+            parts = await gather_fetches(self.page_fetches(page, context))
+            context.update(await sync_to_async(_page_context)(page, context, parts))
+        return self.render_to_response(context)
 
 
 class HomePageView(BaseContentPageView):
@@ -557,6 +519,14 @@ class ContentPageView(BaseContentPageView):
         return {"slug": slug} if slug else {}
 
 
+class AsyncHomePageView(AsyncContentPageMixin, HomePageView):
+    pass
+
+
+class AsyncContentPageView(AsyncContentPageMixin, ContentPageView):
+    pass
+
+
 class ExpeditionsIndexView(SiteContextMixin, TemplateView):
     template_name = "content/expeditions_index.html"
 
@@ -607,23 +577,19 @@ class CategoryDetailView(SiteContextMixin, TemplateView):
         texts = context["_texts"]
 
         category_payload = _category_payload(category, texts)
-        gallery_items_qs = (
+        gallery_source = list(
             CategoryGalleryItem.objects.filter(category=category, is_published=True)
             .select_related("media")
             .order_by("order", "id")
         )
+        localized_items = snapshot_map(CategoryGalleryItem, gallery_source, lang_code, fallback_lang)
 
         gallery_items = []
         lightbox_images = []
 
-        for item in gallery_items_qs:
-            title = _localize_text(item.title, item.title_i18n, lang_code, fallback_lang)
-            description = _localize_text(
-                item.description,
-                item.description_i18n,
-                lang_code,
-                fallback_lang,
-            )
+        for item in gallery_source:
+            title = localized_items[item.id]["title"]
+            description = localized_items[item.id]["description"]
             image_url = _resolve_media_url(
                 item.media,
                 "content/images/category-default.svg",
@@ -689,19 +655,20 @@ class ExpeditionDetailView(SiteContextMixin, TemplateView):
         texts = context["_texts"]
 
         expedition_payload = _expedition_payload(expedition, texts, lang_code, fallback_lang)
-        media_items = (
+        media_items = list(
             ExpeditionMedia.objects.filter(expedition=expedition, is_published=True)
             .select_related("media")
             .order_by("order", "id")
         )
+        localized_media = snapshot_map(ExpeditionMedia, media_items, lang_code, fallback_lang)
 
         blocks = []
         lightbox_images = []
 
-        if media_items.exists():
+        if media_items:
             for media_item in media_items:
-                title = _localize_text(media_item.title, media_item.title_i18n, lang_code, fallback_lang)
-                body = _localize_text(media_item.body, media_item.body_i18n, lang_code, fallback_lang)
+                title = localized_media[media_item.id]["title"]
+                body = localized_media[media_item.id]["body"]
 
                 if media_item.kind == ExpeditionMedia.KIND_IMAGE:
                     image_url = _resolve_media_url(
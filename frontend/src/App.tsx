@@ -9,14 +9,7 @@ import {
   useRef,
   useState,
 } from "react";
-import {
-  getCategories,
-  getExpeditions,
-  getNavigation,
-  getPageBySlug,
-  getStories,
-  sendContactMessage,
-} from "./api";
+import { batchBody, getBatch, getPageBySlug, sendContactMessage } from "./api";
 import { useI18n } from "./i18n";
 import type {
   CategoryData,
@@ -24,6 +17,7 @@ import type {
   ExpeditionData,
   ExpeditionMediaItem,
   NavigationItem,
+  NavigationResponse,
   PageData,
   PageSection,
   StoryData,
@@ -759,118 +753,76 @@ export default function App() {
   useEffect(() => {
     let cancelled = false;
 
-    async function loadNavigation() {
+    function errorMessage(error: unknown): string {
+      return error instanceof Error ? error.message : "";
+    }
+
+    async function loadCollections() {
       setIsNavigationLoading(true);
+      setIsExpeditionsLoading(true);
+      setIsCategoriesLoading(true);
+      setIsStoriesLoading(true);
       setNavigationError("");
+      setExpeditionsError("");
+      setCategoriesError("");
+      setStoriesError("");
       try {
-        const data = await getNavigation(lang);
-        if (!cancelled) {
+        const batch = await getBatch(lang, ["navigation", "expeditions", "categories", "stories"]);
+        if (cancelled) {
+          return;
+        }
+        try {
+          const data = batchBody<NavigationResponse>(batch, "navigation");
           setMenus({
             main: data.menus.main || [],
             footer: data.menus.footer || [],
             social: data.menus.social || [],
           });
-        }
-      } catch (error) {
-        if (!cancelled) {
+        } catch (error) {
           setMenus({ main: [], footer: [], social: [] });
-          setNavigationError(error instanceof Error ? error.message : "");
-        }
-      } finally {
-        if (!cancelled) {
-          setIsNavigationLoading(false);
-        }
-      }
-    }
-
-    void loadNavigation();
-    return () => {
-      cancelled = true;
-    };
-  }, [lang]);
-
-  useEffect(() => {
-    let cancelled = false;
-
-    async function loadExpeditions() {
-      setIsExpeditionsLoading(true);
-      setExpeditionsError("");
-      try {
-        const data = await getExpeditions(lang);
-        if (!cancelled) {
-          setExpeditionsData(data || []);
+          setNavigationError(errorMessage(error));
         }
-      } catch (error) {
-        if (!cancelled) {
+        try {
+          setExpeditionsData(batchBody<ExpeditionData[]>(batch, "expeditions") || []);
+        } catch (error) {
           setExpeditionsData([]);
-          setExpeditionsError(error instanceof Error ? error.message : "");
-        }
-      } finally {
-        if (!cancelled) {
-          setIsExpeditionsLoading(false);
-        }
-      }
-    }
-
-    void loadExpeditions();
-    return () => {
-      cancelled = true;
-    };
-  }, [lang]);
-
-  useEffect(() => {
-    let cancelled = false;
-
-    async function loadCategories() {
-      setIsCategoriesLoading(true);
-      setCategoriesError("");
-      try {
-        const data = await getCategories(lang);
-        if (!cancelled) {
-          setCategoriesData(data || []);
+          setExpeditionsError(errorMessage(error));
         }
-      } catch (error) {
-        if (!cancelled) {
+        try {
+          setCategoriesData(batchBody<CategoryData[]>(batch, "categories") || []);
+        } catch (error) {
           setCategoriesData([]);
-          setCategoriesError(error instanceof Error ? error.message : "");
+          setCategoriesError(errorMessage(error));
         }
-      } finally {
-        if (!cancelled) {
-          setIsCategoriesLoading(false);
-        }
-      }
-    }
-
-    void loadCategories();
-    return () => {
-      cancelled = true;
-    };
-  }, [lang]);
-
-  useEffect(() => {
-    let cancelled = false;
-
-    async function loadStories() {
-      setIsStoriesLoading(true);
-      setStoriesError("");
-      try {
-        const data = await getStories(lang);
-        if (!cancelled) {
-          setStoriesData(data || []);
+        try {
+          setStoriesData(batchBody<StoryData[]>(batch, "stories") || []);
+        } catch (error) {
+          setStoriesData([]);
+          setStoriesError(errorMessage(error));
         }
       } catch (error) {
         if (!cancelled) {
+          const message = errorMessage(error);
+          setMenus({ main: [], footer: [], social: [] });
+          setExpeditionsData([]);
+          setCategoriesData([]);
           setStoriesData([]);
-          setStoriesError(error instanceof Error ? error.message : "");
+          setNavigationError(message);
+          setExpeditionsError(message);
+          setCategoriesError(message);
+          setStoriesError(message);
         }
       } finally {
         if (!cancelled) {
+          setIsNavigationLoading(false);
+          setIsExpeditionsLoading(false);
+          setIsCategoriesLoading(false);
           setIsStoriesLoading(false);
         }
       }
     }
 
-    void loadStories();
+    void loadCollections();
     return () => {
       cancelled = true;
     };
@@ -1,8 +1,11 @@
 import type {
+  BatchResponse,
   CategoryData,
   ContactMessagePayload,
   ContentResponse,
   ExpeditionData,
+  I18nDelta,
+  I18nDictionary,
   Locale,
   NavigationResponse,
   PageResponse,
@@ -51,8 +54,75 @@ export async function setLanguageCookie(lang: Locale): Promise<void> {
   });
 }
 
-export async function getContent(lang: Locale): Promise<ContentResponse> {
-  return requestJson<ContentResponse>(buildApiUrl("/content/", { lang }));
+const I18N_STORAGE_PREFIX = "site.i18n.";
+
+type StoredDictionary = {
+  version: string;
+  texts: I18nDictionary;
+};
+
+function storageKey(lang: Locale, route?: string): string {
+  return route ? `${I18N_STORAGE_PREFIX}${lang}.${route}` : `${I18N_STORAGE_PREFIX}${lang}`;
+}
+
+function readStoredDictionary(lang: Locale, route?: string): StoredDictionary | null {
+  try {
+    const raw = window.localStorage.getItem(storageKey(lang, route));
+    return raw ? (JSON.parse(raw) as StoredDictionary) : null;
+  } catch {
+    return null;
+  }
+}
+
+function writeStoredDictionary(lang: Locale, stored: StoredDictionary, route?: string): void {
+  try {
+    window.localStorage.setItem(storageKey(lang, route), JSON.stringify(stored));
+  } catch {
+    // Storage may be full or disabled; the dictionary is simply re-fetched next time.
+  }
+}
+
+export async function getI18nDictionary(lang: Locale, route?: string): Promise<I18nDictionary> {
+  const stored = readStoredDictionary(lang, route);
+  if (!stored) {
+    const response = await fetch(buildApiUrl("/i18n/", { lang, route }), {
+      credentials: "include",
+    });
+    if (!response.ok) {
+      throw new Error(`Request failed (${response.status})`);
+    }
+    const texts = (await response.json()) as I18nDictionary;
+    const version = response.headers.get("X-I18n-Version");
+    if (version) {
+      writeStoredDictionary(lang, { version, texts }, route);
+    }
+    return texts;
+  }
+
+  const response = await fetch(buildApiUrl("/i18n/", { lang, route, since: stored.version }), {
+    credentials: "include",
+    headers: { "If-None-Match": `"${stored.version}..${stored.version}"` },
+  });
+  if (response.status === 304) {
+    return stored.texts;
+  }
+  if (!response.ok) {
+    throw new Error(`Request failed (${response.status})`);
+  }
+
+  const delta = (await response.json()) as I18nDelta;
+  const texts = delta.full ? { ...delta.changed } : { ...stored.texts, ...delta.changed };
+  for (const key of delta.removed) {
+    delete texts[key];
+  }
+  writeStoredDictionary(lang, { version: delta.version, texts }, route);
+  return texts;
+}
+
+export async function getContent(lang: Locale, withTexts = true): Promise<ContentResponse> {
+  return requestJson<ContentResponse>(
+    buildApiUrl("/content/", { lang, texts: withTexts ? undefined : "0" })
+  );
 }
 
 export async function getNavigation(
@@ -85,6 +155,32 @@ export async function getStories(lang: Locale): Promise<StoryData[]> {
   return requestJson<StoryData[]>(buildApiUrl("/stories/", { lang }));
 }
 
+export async function getBatch(
+  lang: Locale,
+  requests: string[],
+  bundle?: string
+): Promise<BatchResponse> {
+  return requestJson<BatchResponse>(
+    buildApiUrl("/v1/batch/", {
+      lang,
+      bundle,
+      requests: requests.length ? requests.join(",") : undefined,
+    })
+  );
+}
+
+export function batchBody<T>(batch: BatchResponse, name: string): T {
+  const item = batch.responses[name];
+  if (!item) {
+    throw new Error(`Missing batch response: ${name}`);
+  }
+  if (item.status < 200 || item.status >= 300) {
+    const detail = (item.body as { detail?: string } | null)?.detail;
+    throw new Error(detail || `Request failed (${item.status})`);
+  }
+  return item.body as T;
+}
+
 export async function sendContactMessage(
   payload: ContactMessagePayload
 ): Promise<{ status: string; id: number }> {
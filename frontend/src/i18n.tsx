@@ -7,7 +7,7 @@ import {
   useState,
   type ReactNode,
 } from "react";
-import { getContent, setLanguageCookie } from "./api";
+import { getContent, getI18nDictionary, setLanguageCookie } from "./api";
 import type { ContentResponse, I18nDictionary, Locale } from "./types";
 
 type I18nContextValue = {
@@ -68,10 +68,13 @@ export function I18nProvider({ children }: { children: ReactNode }) {
     async function loadContent() {
       setIsLoading(true);
       try {
-        const data = await getContent(lang);
+        const [data, texts] = await Promise.all([
+          getContent(lang, false),
+          getI18nDictionary(lang),
+        ]);
         if (!cancelled) {
           setContent(data);
-          setDictionary(data.texts || {});
+          setDictionary(texts);
         }
       } catch {
         if (!cancelled) {
@@ -2,6 +2,14 @@ export type Locale = string;
 
 export type I18nDictionary = Record<string, string>;
 
+export type I18nDelta = {
+  version: string;
+  since: string;
+  full: boolean;
+  changed: I18nDictionary;
+  removed: string[];
+};
+
 export type LanguageOption = {
   code: Locale;
   name: string;
@@ -109,6 +117,16 @@ export type PageResponse = {
   page: PageData;
 };
 
+export type BatchItem = {
+  status: number;
+  body: unknown;
+};
+
+export type BatchResponse = {
+  lang: Locale;
+  responses: Record<string, BatchItem>;
+};
+
 export type ExpeditionMediaItem = {
   id: number;
   kind: "image" | "video" | "story";